@@ -6,8 +6,9 @@ Maps analytics routes to Eel-exposed functions
 import eel
 from typing import Optional
 from datetime import datetime
-from app.database.connection import SessionLocal
+from app.database.connection import SessionLocal, get_pool_metrics
 from app.services.analytics_service import AnalyticsService
+from app.services.analytics_cache import analytics_cache
 from app.models.analytics_models import AnalyticsFilters
 from app.utils.logger import setup_logger
 import json
@@ -31,10 +32,7 @@ def get_product_analytics(
 ):
     """Get complete product analytics"""
     try:
-        db = SessionLocal()  # ← ADD THIS
-        
-        from app.services.product_analytics_service import get_product_analytics_updated
-        
+        db = SessionLocal()
         filters = AnalyticsFilters(
             date_filter=date_filter,
             start_date=start_date,
@@ -44,7 +42,10 @@ def get_product_analytics(
             product_type=product_type
         )
         
-        result = get_product_analytics_updated(db, filters)
+        result = analytics_cache.get_or_compute(
+            analytics_cache.make_key("get_product_analytics", filters),
+            lambda: AnalyticsService(db).get_product_overview(filters)
+        )
         
         db.close()
         
@@ -76,8 +77,10 @@ def get_quotes_by_product(
             quote_status=quote_status
         )
         
-        service = AnalyticsService(db)
-        result = service.get_quotes_by_product(filters)
+        result = analytics_cache.get_or_compute(
+            analytics_cache.make_key("get_quotes_by_product", filters),
+            lambda: AnalyticsService(db).get_quotes_by_product(filters)
+        )
         
         db.close()
         
@@ -118,8 +121,10 @@ def get_finance_analytics(
             customer=customer
         )
         
-        service = AnalyticsService(db)
-        result = service.get_finance_analytics(filters)
+        result = analytics_cache.get_or_compute(
+            analytics_cache.make_key("get_finance_analytics", filters),
+            lambda: AnalyticsService(db).get_finance_analytics(filters)
+        )
         
         db.close()
         
@@ -156,8 +161,10 @@ def get_revenue_by_status(
             end_date=end_date
         )
         
-        service = AnalyticsService(db)
-        result = service.get_revenue_by_status(filters)
+        result = analytics_cache.get_or_compute(
+            analytics_cache.make_key("get_revenue_by_status", filters),
+            lambda: AnalyticsService(db).get_revenue_by_status(filters)
+        )
         
         db.close()
         
@@ -180,9 +187,21 @@ def get_monthly_revenue_trend(
 ):
     """Get monthly revenue trend"""
     try:
+        # Trailing window of whole months, current month included
+        today = datetime.now()
+        year, month = divmod(today.year * 12 + today.month - months, 12)
+        
+        filters = AnalyticsFilters(
+            date_filter="custom",
+            start_date=datetime(year, month + 1, 1).strftime("%Y-%m-%d"),
+            quote_status=quote_status
+        )
+        
         db = SessionLocal()
-        service = AnalyticsService(db)
-        result = service.get_monthly_revenue_trend(months, quote_status)
+        result = analytics_cache.get_or_compute(
+            analytics_cache.make_key("get_monthly_revenue_trend", filters),
+            lambda: AnalyticsService(db).get_monthly_revenue_trend(filters)
+        )
         
         db.close()
         
@@ -223,8 +242,10 @@ def get_customer_analytics(
             customer=customer
         )
         
-        service = AnalyticsService(db)
-        result = service.get_customer_analytics(filters)
+        result = analytics_cache.get_or_compute(
+            analytics_cache.make_key("get_customer_analytics", filters),
+            lambda: AnalyticsService(db).get_customer_analytics(filters)
+        )
         
         db.close()
         
@@ -257,8 +278,10 @@ def get_top_customers(
             end_date=end_date
         )
         
-        service = AnalyticsService(db)
-        result = service.get_top_customers(filters, sort_by, limit)
+        result = analytics_cache.get_or_compute(
+            analytics_cache.make_key("get_top_customers", filters, sort_by, limit),
+            lambda: AnalyticsService(db).get_top_customers(filters, sort_by, limit)
+        )
         
         db.close()
         
@@ -293,8 +316,10 @@ def get_combined_insights(
             end_date=end_date
         )
         
-        service = AnalyticsService(db)
-        result = service.get_combined_insights(filters)
+        result = analytics_cache.get_or_compute(
+            analytics_cache.make_key("get_combined_insights", filters),
+            lambda: AnalyticsService(db).get_combined_insights(filters)
+        )
         
         db.close()
         
@@ -326,8 +351,10 @@ def get_product_customer_matrix(
             end_date=end_date
         )
         
-        service = AnalyticsService(db)
-        result = service.get_product_customer_matrix(filters, metric)
+        result = analytics_cache.get_or_compute(
+            analytics_cache.make_key("get_product_customer_matrix", filters, metric),
+            lambda: AnalyticsService(db).get_product_customer_matrix(filters, metric)
+        )
         
         db.close()
         
@@ -358,8 +385,10 @@ def get_quote_status_funnel(
             end_date=end_date
         )
         
-        service = AnalyticsService(db)
-        result = service.get_quote_status_funnel(filters)
+        result = analytics_cache.get_or_compute(
+            analytics_cache.make_key("get_quote_status_funnel", filters),
+            lambda: AnalyticsService(db).get_quote_status_funnel(filters)
+        )
         
         db.close()
         
@@ -380,8 +409,10 @@ def get_quote_velocity(months: int = 12):
     """Get monthly quote velocity"""
     try:
         db = SessionLocal()
-        service = AnalyticsService(db)
-        result = service.get_quote_velocity(months)
+        result = analytics_cache.get_or_compute(
+            analytics_cache.make_key("get_quote_velocity", None, months),
+            lambda: AnalyticsService(db).get_quote_velocity(months)
+        )
         
         db.close()
         
@@ -439,6 +470,95 @@ def export_analytics_data(
         }
 
 
+@eel.expose
+def export_detail_data(
+    level: str = "quote",
+    format: str = "xlsx",
+    date_filter: str = "all",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    quote_status: str = "all",
+    customer: str = "all",
+    product_type: str = "all"
+):
+    """Export one row per quote (level="quote"), line item (level="line_item") or requirement (level="requirement")"""
+    try:
+        from app.services.detail_export_service import DetailExportService
+
+        db = SessionLocal()
+        try:
+            filters = AnalyticsFilters(
+                date_filter=date_filter,
+                start_date=start_date,
+                end_date=end_date,
+                quote_status=quote_status,
+                customer=customer,
+                product_type=product_type
+            )
+
+            # Yield to the UI between chunks of large exports
+            return DetailExportService(db).export(level, format, filters, idle=lambda: eel.sleep(0))
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f"Error in export_detail_data: {e}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@eel.expose
+def export_data_snapshot(format: str = "parquet"):
+    """Export projects, quotations, line items and technical quotes as Parquet or Feather files"""
+    try:
+        from app.services.snapshot_service import SnapshotService
+
+        db = SessionLocal()
+        try:
+            return SnapshotService(db).export_snapshot(format)
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f"Error in export_data_snapshot: {e}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@eel.expose
+def get_analytics_cache_stats():
+    """Get analytics cache hit/miss counters"""
+    try:
+        return {
+            "success": True,
+            "data": analytics_cache.stats()
+        }
+    except Exception as e:
+        logger.error(f"Error in get_analytics_cache_stats: {e}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@eel.expose
+def get_database_pool_metrics():
+    """Get reader/writer connection pool occupancy and wait times"""
+    try:
+        return {
+            "success": True,
+            "data": get_pool_metrics()
+        }
+    except Exception as e:
+        logger.error(f"Error in get_database_pool_metrics: {e}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
 logger.info("Analytics API endpoints registered")
 
 @eel.expose
@@ -448,8 +568,10 @@ def get_customers_for_analytics():
         db = SessionLocal()
         from app.models.project import Project
         
-        customers = db.query(Project.customer_name).distinct().all()
-        customer_list = [{"customer_name": c[0]} for c in customers if c[0]]
+        customer_list = analytics_cache.get_or_compute(
+            analytics_cache.make_key("get_customers_for_analytics"),
+            lambda: [{"customer_name": c[0]} for c in db.query(Project.customer_name).distinct().all() if c[0]]
+        )
         
         db.close()
         
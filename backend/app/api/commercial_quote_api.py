@@ -3,74 +3,112 @@ Commercial Quote API endpoints
 """
 import eel
 import json
-from app.database.connection import SessionLocal
+from sqlalchemy.orm.exc import StaleDataError
+from app.database.connection import SessionLocal, WriterSession
 from app.models.commercial_quotation import CommercialQuotation
 from app.models.project import Project
+from app.services.analytics_rollup_service import AnalyticsRollupService
+from app.services.analytics_cache import analytics_cache
+from app.services.quotation_service import QuotationService, COMMERCIAL_FIELDS
+
+quotation_service = QuotationService()
 
 @eel.expose
 def save_commercial_quote(project_id: int, quotation_number: str, form_data: dict):
-    """Save or update commercial quotation"""
-    db = SessionLocal()
+    """Save or update commercial quotation (only the changed columns and line items are written)"""
+    db = WriterSession()
     try:
         # Check if quote already exists
-        existing = db.query(CommercialQuotation).filter(
+        quote = db.query(CommercialQuotation).filter(
             CommercialQuotation.quotation_number == quotation_number
         ).first()
         
-        if existing:
-            # Update existing
-            existing.to = form_data.get('to')
-            existing.attn = form_data.get('attn')
-            existing.email_to = form_data.get('email_to')
-            existing.your_inquiry_ref = form_data.get('your_inquiry_ref')
-            existing.pages = form_data.get('pages')
-            existing.your_partner = form_data.get('your_partner')
-            existing.mobile_no = form_data.get('mobile_no')
-            existing.fax_no = form_data.get('fax_no')
-            existing.email_partner = form_data.get('email_partner')
-            existing.items = json.dumps(form_data.get('items', []))
-            
-            # Calculate totals
-            items = form_data.get('items', [])
-            subtotal = sum(item.get('total_price', 0) for item in items)
-            existing.subtotal = subtotal
-            existing.tax_amount = 0.0  # Add tax calculation if needed
-            existing.total_amount = subtotal
-            
-            db.commit()
-            return {"success": True, "message": "Commercial quote updated"}
-        else:
-            # Create new
-            items = form_data.get('items', [])
-            subtotal = sum(item.get('total_price', 0) for item in items)
-            
-            new_quote = CommercialQuotation(
+        created = quote is None
+        if created:
+            quote = CommercialQuotation(
                 quotation_number=quotation_number,
-                to=form_data.get('to'),
-                attn=form_data.get('attn'),
-                email_to=form_data.get('email_to'),
-                your_inquiry_ref=form_data.get('your_inquiry_ref'),
-                pages=form_data.get('pages'),
-                your_partner=form_data.get('your_partner'),
-                mobile_no=form_data.get('mobile_no'),
-                fax_no=form_data.get('fax_no'),
-                email_partner=form_data.get('email_partner'),
-                items=json.dumps(items),
-                subtotal=subtotal,
-                tax_amount=0.0,
-                total_amount=subtotal
+                **{field: form_data.get(field) for field in COMMERCIAL_FIELDS}
             )
+            db.add(quote)
+        
+        changes = {field: form_data.get(field) for field in COMMERCIAL_FIELDS}
+        changes['items'] = form_data.get('items', [])
+        changed = quotation_service.apply_commercial_changes(quote, changes)
+        
+        if not changed:
+            return {"success": True, "message": "Commercial quote unchanged", "changed": [], "version": quote.version}
+        
+        if created or 'total_amount' in changed:
+            AnalyticsRollupService(db).refresh_quotation(quotation_number)
+        db.commit()
+        analytics_cache.invalidate()
+        return {
+            "success": True,
+            "message": "Commercial quote created" if created else "Commercial quote updated",
+            "changed": changed,
+            "version": quote.version
+        }
             
-            db.add(new_quote)
-            db.commit()
-            return {"success": True, "message": "Commercial quote created"}
-            
+    except StaleDataError:
+        db.rollback()
+        return version_conflict(current_version(db, quotation_number))
     except Exception as e:
         db.rollback()
         return {"success": False, "message": str(e)}
     finally:
         db.close()
 
+@eel.expose
+def patch_commercial_quote(quotation_number: str, changes: dict, version: int = None):
+    """
+    Apply only the changed header fields and line items of a saved commercial quotation.
+    With a version, the patch is refused if the quote was saved since that version.
+    """
+    db = WriterSession()
+    try:
+        quote = db.query(CommercialQuotation).filter(
+            CommercialQuotation.quotation_number == quotation_number
+        ).first()
+        
+        if not quote:
+            return {"success": False, "message": "Quote not found"}
+        if version is not None and quote.version != int(version):
+            return version_conflict(quote.version)
+        
+        changed = quotation_service.apply_commercial_changes(quote, changes or {})
+        if not changed:
+            return {"success": True, "message": "Commercial quote unchanged", "changed": [], "version": quote.version}
+        
+        if 'total_amount' in changed:
+            AnalyticsRollupService(db).refresh_quotation(quotation_number)
+        db.commit()
+        analytics_cache.invalidate()
+        return {"success": True, "message": "Commercial quote updated", "changed": changed, "version": quote.version}
+    
+    except StaleDataError:
+        db.rollback()
+        return version_conflict(current_version(db, quotation_number))
+    except Exception as e:
+        db.rollback()
+        return {"success": False, "message": str(e)}
+    finally:
+        db.close()
+
+def current_version(db, quotation_number: str):
+    """Stored version of a commercial quotation, None if it no longer exists"""
+    return db.query(CommercialQuotation.version).filter(
+        CommercialQuotation.quotation_number == quotation_number
+    ).scalar()
+
+def version_conflict(version):
+    """Response for an edit made against an outdated version of a quote"""
+    return {
+        "success": False,
+        "conflict": True,
+        "version": version,
+        "message": "This quote was changed elsewhere. Reload it and apply your edit again."
+    }
+
 @eel.expose
 def get_commercial_quote(quotation_number: str):
     """Get commercial quotation by quotation number"""
@@ -101,6 +139,7 @@ def get_commercial_quote(quotation_number: str):
                 "subtotal": quote.subtotal,
                 "tax_amount": quote.tax_amount,
                 "total_amount": quote.total_amount,
+                "version": quote.version,
                 "created_at": quote.created_at.isoformat() if quote.created_at else None
             }
         }
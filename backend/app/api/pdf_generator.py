@@ -12,14 +12,24 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT, TA_JUSTIFY
 from reportlab.pdfgen import canvas
 from pathlib import Path
+from io import BytesIO
+from pypdf import PdfReader, PdfWriter
+from app.api.pdf_styles import (
+    commercial_styles, commercial_page_templates,
+    COMMERCIAL_HEADER_WIDTHS, COMMERCIAL_CONTACT_WIDTHS, COMMERCIAL_ITEMS_WIDTHS
+)
 from app.database.connection import SessionLocal
+from app.utils.assets import logo_image, logo_flowable
+from app.services.pdf_cache import content_hash, pdf_input_hash, reuse_cached_pdf, pending_path, publish_pdf
 from sqlalchemy import text
 
 class FooteredCanvas(canvas.Canvas):
+    # Pages that carry the running header (the quotation's first page has its own)
+    header_from_page = 2
+
     def __init__(self, *args, **kwargs):
         canvas.Canvas.__init__(self, *args, **kwargs)
         self._saved_page_states = []
-        self.logo_path = getattr(FooteredCanvas, '_logo_path', None)
 
     def showPage(self):
         self._saved_page_states.append(dict(self.__dict__))
@@ -39,11 +49,12 @@ class FooteredCanvas(canvas.Canvas):
         page_height = A4[1]
         
         # HEADER (on pages 2+) - FIXED POSITIONING
-        if self._pageNumber >= 2:
-            if self.logo_path and Path(self.logo_path).exists():
+        if self._pageNumber >= self.header_from_page:
+            logo = logo_image()
+            if logo:
                 try:
                     self.drawImage(
-                        str(self.logo_path), 
+                        logo, 
                         page_width - 160,
                         page_height - 55,  # FIXED: Reduced from 60
                         width=130, 
@@ -89,6 +100,10 @@ class FooteredCanvas(canvas.Canvas):
         self.drawString(410, y_pos-30, "Swift Code: AXISINSB073")
         self.drawString(410, y_pos-40, "Account No. 910020047693645")
         
+class ConditionsCanvas(FooteredCanvas):
+    """Canvas for the standalone General Conditions pages, which all follow the quotation page"""
+    header_from_page = 1
+
 def flatten_general_conditions(gc_data):
     """Convert hierarchical general conditions to (title, content) tuples for PDF"""
     flattened = []
@@ -118,130 +133,397 @@ def flatten_general_conditions(gc_data):
     
     return flattened
 
+DEFAULT_GENERAL_CONDITIONS = [
+    {
+        "number": "1",
+        "title": "Scope of application",
+        "content": "These Terms apply to the sale and supply of power transmission parts (\"Products\") as per purchase orders issued by the Customer and accepted by the Company. Where applicable, the Company may manufacture or modify Products based on the Customer's specific requirements, subject to a written agreement on design specifications, delivery timelines, and pricing. The following Terms shall apply to all deliveries of our products, except as modified by express agreement accepted in writing by both parties. These Terms do not cover installation, commissioning, or maintenance services, if provided by the Company.",
+        "subsections": []
+    },
+    {
+        "number": "2",
+        "title": "Definitions",
+        "content": "",
+        "subsections": [
+            {
+                "letter": "a",
+                "content": "Confidential Information shall mean any and all materials and information concerning the Company, including without limitation its directors, officers, employees, subsidiaries and/or group companies, vendors, users and customers or any third party with which the Company associates (collectively, \"Affiliates\"), disclosed by the Company whether or not such information is expressly marked or designated as confidential information, including, without limitation, computer programs, software (including source code, object code and machine code) relating to the foregoing, technical drawings, algorithms, pricing information."
+            },
+            {
+                "letter": "b",
+                "content": "Intellectual Property Rights (IPR) shall mean all drawings, designs, models, specifications, documentation, software, inventions, techniques, processes, business methods, know-how, mask-works, copyrights, copyrightable materials, patents, trademarks, trade secrets, and any other information or materials protected under any intellectual property laws in effect anywhere in the world, and any applications, registrations or filings relating thereto."
+            }
+        ]
+    },
+    {
+        "number": "3",
+        "title": "Governing Terms",
+        "content": "",
+        "subsections": [
+            {
+                "letter": "a",
+                "content": "The following documents govern the transaction - Any Company-issued quotation, order acknowledgment, invoice, or written agreement."
+            },
+            {
+                "letter": "b",
+                "content": "To the extent possible, the terms contained in these documents shall be read harmoniously. However, in the event of any conflict between these Terms and another document, these Terms shall prevail. These Terms shall prevail over any contrary terms proposed by the Customer. No additional terms shall be deemed part of these Terms unless expressly agreed to in writing and signed by an authorized representative of the Company. For the avoidance of doubt, the following shall not form part of these Terms:",
+                "sub_subsections": [
+                    {
+                        "roman": "i",
+                        "content": "Any terms referenced by the Customer in its purchase orders or other documents, except for product description, quantity, and pricing that align with the Company's quotation, acknowledgment, invoice, or a separate signed agreement;"
+                    },
+                    {
+                        "roman": "ii",
+                        "content": "Customer's standard terms and conditions of purchase, quality policy, supplier guidelines, or similar operational policies;"
+                    },
+                    {
+                        "roman": "iii",
+                        "content": "Any terms on the Customer's website or electronic procurement portal, even if the Company is required to click \"accept,\" \"agree,\" or similar prompts in order to access or submit order-related information."
+                    }
+                ]
+            }
+        ]
+    },
+    {
+        "number": "4",
+        "title": "Terms of Payment and Pricing",
+        "content": "",
+        "subsections": [
+            {
+                "letter": "a",
+                "content": "Unless otherwise agreed, Customer shall make payment of 100% of the invoiced amount in advance against a Proforma Invoice issued by the Company. In the event of any delay in payment beyond the agreed timeline, the Company reserves the right to charge interest on the overdue amount at a rate of 8% above the prevailing discount rate of the Reserve Bank of India."
+            },
+            {
+                "letter": "b",
+                "content": "The Customer shall not withhold payment or make any deductions from the invoiced amount on account of complaints regarding the Products, unless such liability is acknowledged in writing by the Company. Goods and Services Tax (GST) and any other applicable taxes or duties shall be levied in accordance with the relevant HSN Code and prevailing laws at the time of invoicing."
+            },
+            {
+                "letter": "c",
+                "content": "Unless otherwise agreed in writing, the Company reserves the right to revise prices or apply a surcharge at any time to reflect changes in input costs, including but not limited to raw material prices, labor costs."
+            },
+            {
+                "letter": "d",
+                "content": "In cases where specialized tools, gauges, or clamping devices are required to execute a custom order, such items shall be invoiced separately to the Customer. However, ownership of these tools and devices shall remain exclusively with the Company upon completion of the order. Ownership of the Products shall remain with the Company until full payment of the purchase price has been received."
+            },
+            {
+                "letter": "e",
+                "content": "A Packing and Forwarding (P&F) charge of 2% shall be applicable on the price per Purchase Order. In cases where no P&F charge is applicable, the Company shall utilize its standard packing method for dispatch. Any special packaging requirements requested by the Customer may attract additional charges, which will be communicated separately."
+            }
+        ]
+    },
+    {
+        "number": "5",
+        "title": "Orders and Acceptance",
+        "content": "",
+        "subsections": [
+            {
+                "letter": "a",
+                "content": "All orders must be submitted in writing and clearly specify the type and quantity of Products, delivery address, required delivery date, and any applicable reference to quotations or prior correspondence."
+            },
+            {
+                "letter": "b",
+                "content": "Orders become binding only upon written acceptance by the Company. All dimensions, weights, illustrations, and technical drawings provided prior to order confirmation are indicative only and not contractually binding, unless confirmed in writing. The scope, specifications, and type of Products to be delivered shall be determined solely by the Company's written order confirmation."
+            },
+            {
+                "letter": "c",
+                "content": "Any modifications requested by the Customer after order confirmation must be approved in writing by the Company and may be subject to revised terms, including pricing and delivery schedule. The Customer may not cancel or amend an order after confirmation without the prior written consent of the Company. Any such change may be subject to charges as reasonably determined by the Company."
+            }
+        ]
+    },
+    {
+        "number": "6",
+        "title": "Delivery",
+        "content": "",
+        "subsections": [
+            {
+                "letter": "a",
+                "content": "All prices are quoted on an EX Works Chakan basis (Incoterms 2020), unless otherwise agreed."
+            },
+            {
+                "letter": "b",
+                "content": "The delivery period shall commence only after all technical specifications and contractual details have been mutually agreed upon in writing by both Parties"
+            }
+        ]
+    },
+    {
+        "number": "7",
+        "title": "Force Majeure",
+        "content": "",
+        "subsections": [
+            {
+                "letter": "a",
+                "content": "The Company shall not be liable for any delay in delivery or failure to fulfill an order caused by circumstances beyond its reasonable control, including but not limited to acts of God, natural disasters, pandemics, labor unrest, strikes, lockouts, supply chain disruptions, power or equipment failure, operating difficulties, delays by subcontractors or suppliers, transportation issues, port congestion, embargoes, or any governmental or regulatory actions (\"Force Majeure Event(s)\"). In the event of any such Force Majeure Event(s), the Company shall be entitled to an appropriate extension of the delivery period. The Company will notify the Customer of the occurrence and expected duration of such delay as soon as reasonably practicable. Any claims for penalties, liquidated damages, or other compensation due to delayed delivery shall be excluded unless specifically agreed upon in writing at the time of placing the order. The Customer shall not be entitled to cancel the order, reject, or refuse to accept delivery of the Products due to delays arising from Force Majeure Events or other reasons unless the Products, upon delivery, are found not to conform to the warranty obligations set forth in this Agreement."
+            }
+        ]
+    },
+    {
+        "number": "8",
+        "title": "Representations and Warranty",
+        "content": "",
+        "subsections": [
+            {
+                "letter": "a",
+                "content": "The Customer shall inspect the Products immediately upon receipt. Any claims for defects or non-conformities must be reported to the Company in writing within seven (7) days of receipt of the shipment. Failure to notify the Company within this period shall constitute acceptance of the Products as delivered and a waiver of any such claims."
+            },
+            {
+                "letter": "b",
+                "content": "Unless otherwise expressly agreed in writing, each Product shall be covered under the limited warranty by the Company that every Product has been been manufactured in accordance with applicable law and that it meets its specifications, it will be free from defects in materials or workmanship, provided it is stored, used and handled under the conditions recommended by Company. The Company warranty is for a period of twelve (12) months from the date of commissioning or eighteen (18) months from the date of dispatch, whichever occurs earlier. In the event of a valid deficiency claim, the Company's sole obligation shall be, at its discretion, to either:",
+                "sub_subsections": [
+                    {
+                        "roman": "i",
+                        "content": "Repair the defective component(s), or"
+                    },
+                    {
+                        "roman": "ii",
+                        "content": "Replace the defective component(s), free of charge, provided that such components are returned to the Company's premises in the original or equivalent protective packaging."
+                    }
+                ]
+            },
+            {
+                "letter": "c",
+                "content": "The Company shall be liable only for:",
+                "sub_subsections": [
+                    {
+                        "roman": "i",
+                        "content": "Defects arising from its own design or manufacturing faults; and"
+                    },
+                    {
+                        "roman": "ii",
+                        "content": "Material defects that the Company should have reasonably discovered through due diligence."
+                    }
+                ]
+            },
+            {
+                "letter": "d",
+                "content": "The Company shall not be liable for any claims, losses, or damages arising out of or relating to the following circumstances, whether direct or indirect:",
+                "sub_subsections": [
+                    {
+                        "roman": "i",
+                        "content": "Normal wear and tear of the Products under regular operating conditions, including deterioration due to environmental exposure, usage, or time;"
+                    },
+                    {
+                        "roman": "ii",
+                        "content": "Improper handling, incorrect storage, misuse, negligence, or operation of the Products in a manner inconsistent with the Product specifications, manuals, or any written instructions provided by the Company;"
+                    },
+                    {
+                        "roman": "iii",
+                        "content": "Any modification of the Products undertaken by the Customer or any third party;"
+                    },
+                    {
+                        "roman": "iv",
+                        "content": "Use of non-original replacement parts, components, or consumables with the Products;"
+                    },
+                    {
+                        "roman": "v",
+                        "content": "Any force majeure events including but not limited to fire, flood, act of God, civil unrest, strikes, war, pandemic, or government-imposed restrictions;"
+                    },
+                    {
+                        "roman": "vi",
+                        "content": "Consequential or indirect damages including, but not limited to, loss of production, business interruption, penalties for delay, freight costs, costs of disassembly/reassembly, or damage to other machinery or equipment."
+                    },
+                    {
+                        "roman": "vii",
+                        "content": "Any claims arising after the expiration of the applicable warranty period."
+                    }
+                ]
+            },
+            {
+                "letter": "e",
+                "content": "All other terms and conditions shall be as specified in the Installation and Operating Manual issued by the Company."
+            },
+            {
+                "letter": "f",
+                "content": "The Customer represents that it has all the requisite power to execute these Terms and to perform its obligations hereunder, and the person(s) implementing these Terms on its behalf are duly authorised. These Terms are legally binding upon it and it does not conflict with any agreement, instrument or understanding, oral or written, to which it is a party or by which it may be bound."
+            }
+        ]
+    },
+    {
+        "number": "9",
+        "title": "Indemnity and Limitation of Liability",
+        "content": "",
+        "subsections": [
+            {
+                "letter": "a",
+                "content": "The Customer shall indemnify and hold harmless the Company and its affiliates (\"Indemnified Parties\") from any claims, losses, liabilities, damages, or expenses (including legal fees) arising from:",
+                "sub_subsections": [
+                    {
+                        "roman": "i",
+                        "content": "any breach of these Terms;"
+                    },
+                    {
+                        "roman": "ii",
+                        "content": "any negligence, willful misconduct, or legal violation by the Customer or its representatives;"
+                    },
+                    {
+                        "roman": "iii",
+                        "content": "any misuse, unauthorized modification, or improper handling of the Products by the Customer or parties under its control;"
+                    },
+                    {
+                        "roman": "iv",
+                        "content": "any claim that Customer-provided specifications, drawings, or instructions infringe third-party intellectual property rights."
+                    }
+                ]
+            },
+            {
+                "letter": "b",
+                "content": "The Company shall not be liable for any indirect, incidental, consequential, punitive, or special damages, including loss of profits, data, or business, even if advised of such possibility. These limitations and exclusions apply regardless of the form or basis of the claim."
+            }
+        ]
+    },
+    {
+        "number": "10",
+        "title": "Term and Termination",
+        "content": "These Terms shall remain in effect until completion of the obligations by both Parties and may be terminated earlier by mutual written consent or for material breach not remedied within a reasonable period as discussed in writing by the Customer and the Company.",
+        "subsections": []
+    },
+    {
+        "number": "11",
+        "title": "Confidentiality Obligations",
+        "content": "The Customer agrees to keep confidential all technical, commercial, and business information received from the Company. The Customer must protect the confidentiality of any information shared by the Company for a period of two (2) years after termination. Breach may result in a fixed penalty (amount to be agreed) per violation, in addition to potential damage claims. The Company also retains the right to claim indemnification of damage caused to it by the disclosure of the information.",
+        "subsections": []
+    },
+    {
+        "number": "12",
+        "title": "Governing Law and Jurisdiction",
+        "content": "These Terms are governed by the laws of India. Disputes shall be subject to the exclusive jurisdiction of courts in Pune, Maharashtra, India.",
+        "subsections": []
+    }
+]
+
+
+def commercial_doc_template(target):
+    """Commercial quotation document with the standard A4 margins"""
+    # FIXED: Reduced topMargin
+    return BaseDocTemplate(
+        target,
+        pagesize=A4,
+        rightMargin=30,
+        leftMargin=30,
+        topMargin=95,      # FIXED: Reduced from 110 to 95
+        bottomMargin=100
+    )
+
+def general_conditions_sections(custom_gc_text):
+    """(title, content) pairs from saved conditions text ("Title: content" blocks) or the defaults"""
+    if custom_gc_text:
+        gc_sections = []
+        conditions = custom_gc_text.split('\n\n')
+        for condition in conditions:
+            if ':' in condition:
+                parts = condition.split(':', 1)
+                gc_sections.append((parts[0].strip(), parts[1].strip()))
+        return gc_sections
+    
+    # Flatten hierarchical structure
+    return flatten_general_conditions(DEFAULT_GENERAL_CONDITIONS)
+
+def general_conditions_pdf(custom_gc_text) -> Path:
+    """
+    Two-column General Conditions pages, rendered once per conditions text and logo
+    and reused by every commercial PDF that shares them
+    """
+    cache_dir = Path("data/quotations/cache")
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    digest = content_hash('general_conditions', custom_gc_text)
+    filepath = cache_dir / f"General_Conditions_{digest[:16]}.pdf"
+    if reuse_cached_pdf(filepath):
+        return filepath
+    
+    styles = commercial_styles()
+    small_bold = styles['small_bold']
+    small_text = styles['small_text']
+    condition_text_style = styles['condition_text']
+    condition_title_style = styles['condition_title']
+    
+    story = []
+    # FIXED: Removed Spacer(1, 100) that caused excessive whitespace
+    story.append(Paragraph("<b>General Conditions of Delivery and Payment for Customers</b>", small_bold))
+    story.append(Spacer(1, 5))
+    story.append(Paragraph("The following General Conditions of Delivery and Payment for Customers shall apply to all deliveries of our products, except as modified by express agreement accepted in writing by both parties", small_text))
+    story.append(Spacer(1, 10))
+    
+    # Add conditions - flows automatically across columns and pages
+    for title, content in general_conditions_sections(custom_gc_text):
+        story.append(Paragraph(f"<b>{title}</b>", condition_title_style))
+        story.append(Spacer(1, 3))
+        story.append(Paragraph(content, condition_text_style))
+        story.append(Spacer(1, 10))
+    
+    render_path = pending_path(filepath)
+    doc = commercial_doc_template(str(render_path))
+    doc.addPageTemplates(commercial_page_templates(doc)[1:])
+    try:
+        doc.build(story, canvasmaker=ConditionsCanvas)
+    except Exception:
+        render_path.unlink(missing_ok=True)
+        raise
+    publish_pdf(render_path, filepath)
+    return filepath
+
+
+def load_stored_text(column: str, quotation_number: str):
+    """Read the saved terms or general_conditions text for a quotation (None if unset)"""
+    db = SessionLocal()
+    try:
+        result = db.execute(text(f"""
+            SELECT {column} FROM commercial_quotations
+            WHERE quotation_number = :quotation_number
+        """), {'quotation_number': quotation_number}).fetchone()
+        if result and result[0]:
+            print(f"DEBUG: Loaded custom {column} from DB")
+            return result[0]
+        print(f"DEBUG: No custom {column} found for {quotation_number}")
+    except Exception as e:
+        print(f"Error loading {column}: {e}")
+    finally:
+        db.close()
+    return None
+
 def generate_commercial_pdf(quotation_number: str, form_data: dict):
     """Generate PDF matching exact quotation format"""
+    custom_terms_text = load_stored_text('terms', quotation_number)
+    custom_gc_text = load_stored_text('general_conditions', quotation_number)
+    return render_commercial_pdf(quotation_number, form_data, custom_terms_text, custom_gc_text)
+
+def render_commercial_pdf(quotation_number: str, form_data: dict, custom_terms_text=None, custom_gc_text=None):
+    """Render the commercial PDF from already-loaded data; top-level so it can run in a worker process"""
     try:
         output_dir = Path("data/quotations/commercial")
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        filename = f"Commercial_Quote_{quotation_number.replace('/', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        # Everything that goes into the document, hashed to reuse an identical earlier PDF
+        digest = pdf_input_hash('commercial', quotation_number, form_data, custom_terms_text, custom_gc_text)
+        
+        filename = f"Commercial_Quote_{quotation_number.replace('/', '_')}_{digest[:16]}.pdf"
         filepath = output_dir / filename
         
-        # FIXED: Reduced topMargin
-        doc = BaseDocTemplate(
-            str(filepath),
-            pagesize=A4,
-            rightMargin=30,
-            leftMargin=30,
-            topMargin=95,      # FIXED: Reduced from 110 to 95
-            bottomMargin=100
-        )
-        
-        # Frame 1: Single column for first page
-        frame_single = Frame(
-            doc.leftMargin, 
-            doc.bottomMargin, 
-            doc.width, 
-            doc.height,
-            id='single',
-            topPadding=0,
-            bottomPadding=0,
-            leftPadding=0,
-            rightPadding=0
-        )
-        
-        # FIXED: Frames for two-column layout - removed unnecessary height adjustment
-        frame_width = (doc.width - 10) / 2
-        
-        frame_left = Frame(
-            doc.leftMargin,
-            doc.bottomMargin,
-            frame_width,
-            doc.height,  # FIXED: Removed -110 subtraction
-            id='col1',
-            topPadding=0,  # FIXED: Changed from 10 to 0
-            bottomPadding=0,
-            leftPadding=0,
-            rightPadding=5
-        )
-        
-        frame_right = Frame(
-            doc.leftMargin + frame_width + 10,
-            doc.bottomMargin,
-            frame_width,
-            doc.height,  # FIXED: Removed -110 subtraction
-            id='col2',
-            topPadding=0,  # FIXED: Changed from 10 to 0
-            bottomPadding=0,
-            leftPadding=5,
-            rightPadding=0
-        )
-        
-        def add_page_elements(canvas, doc):
-            pass
-        
-        template_first = PageTemplate(
-            id='FirstPage', 
-            frames=[frame_single],
-            onPage=add_page_elements,
-            pagesize=A4
-        )
-        
-        template_twocol = PageTemplate(
-            id='TwoColumn', 
-            frames=[frame_left, frame_right],
-            onPage=add_page_elements,
-            pagesize=A4
-        )
-        
-        doc.addPageTemplates([template_first, template_twocol])
+        if reuse_cached_pdf(filepath):
+            return {
+                'success': True,
+                'filename': filename,
+                'filepath': str(filepath.absolute()),
+                'cached': True
+            }
+        
+        # Render to a temporary name; it is moved into place once complete
+        render_path = pending_path(filepath)
+        
+        quote_buffer = BytesIO()
+        doc = commercial_doc_template(quote_buffer)
+        doc.addPageTemplates(commercial_page_templates(doc)[:1])
         
         story = []
-        styles = getSampleStyleSheet()
-        
-        # Styles
-        company_name_style = ParagraphStyle(
-            'CompanyName',
-            parent=styles['Normal'],
-            fontSize=18,
-            fontName='Helvetica-Bold',
-            alignment=TA_LEFT,
-            spaceAfter=0
-        )
-        
-        title_style = ParagraphStyle(
-            'Title',
-            parent=styles['Heading1'],
-            fontSize=18,
-            fontName='Helvetica-Bold',
-            alignment=TA_CENTER,
-            spaceAfter=15,
-            spaceBefore=10
-        )
-        
-        small_bold = ParagraphStyle(
-            'SmallBold',
-            parent=styles['Normal'],
-            fontName='Helvetica-Bold',
-            fontSize=8
-        )
-        
-        small_text = ParagraphStyle(
-            'Small',
-            parent=styles['Normal'],
-            fontSize=8,
-            leading=11
-        )
+        styles = commercial_styles()
+        title_style = styles['title']
+        small_bold = styles['small_bold']
+        small_text = styles['small_text']
         
         # PAGE 1: Quotation
         
         # Header with logo
-        logo_path = Path("../frontend/public/assets/ringspann_logo2.png")
-        if not logo_path.exists():
-            logo_path = Path("D:/Irizpro/ringspann-desktop/frontend/public/assets/ringspann_logo2.png")
-        
-        if logo_path.exists():
-            logo = Image(str(logo_path), width=1.8*inch, height=0.47*inch)
+        logo = logo_flowable(width=1.8*inch, height=0.47*inch)
+        if logo:
             header_table_data = [[
                 logo,
                 "RINGSPANN Power Transmission India Pvt. Ltd."
@@ -252,14 +534,8 @@ def generate_commercial_pdf(quotation_number: str, form_data: dict):
                 ''
             ]]
         
-        header_table = Table(header_table_data, colWidths=[1.8*inch, 5.4*inch])
-        header_table.setStyle(TableStyle([
-            ('FONTNAME', (1, 0), (1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (1, 0), (1, 0), 16),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-            ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-        ]))
+        header_table = Table(header_table_data, colWidths=COMMERCIAL_HEADER_WIDTHS)
+        header_table.setStyle(styles['header_table'])
         
         story.append(header_table)
         story.append(Spacer(1, 5))
@@ -284,17 +560,8 @@ def generate_commercial_pdf(quotation_number: str, form_data: dict):
              form_data.get('quotation_date', datetime.now().strftime('%Y-%m-%d'))]
         ]
         
-        contact_table = Table(contact_data, colWidths=[1.2*inch, 2.3*inch, 1.1*inch, 2.4*inch])
-        contact_table.setStyle(TableStyle([
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 5),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 5),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ]))
+        contact_table = Table(contact_data, colWidths=COMMERCIAL_CONTACT_WIDTHS)
+        contact_table.setStyle(styles['contact_table'])
         
         story.append(contact_table)
         story.append(Spacer(1, 15))
@@ -326,43 +593,12 @@ def generate_commercial_pdf(quotation_number: str, form_data: dict):
                 f"{float(item.get('total_price', 0)):,.2f}"
             ])
         
-        items_table = Table(table_data, colWidths=[0.5*inch, 3.5*inch, 1.2*inch, 0.6*inch, 1.2*inch])
-        items_table.setStyle(TableStyle([
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-            ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
-            ('ALIGN', (3, 0), (3, -1), 'CENTER'),
-            ('ALIGN', (4, 0), (4, -1), 'RIGHT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 5),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 5),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        items_table = Table(table_data, colWidths=COMMERCIAL_ITEMS_WIDTHS)
+        items_table.setStyle(styles['items_table'])
         
         story.append(items_table)
         story.append(Spacer(1, 15))
         
-        # Load custom terms from database
-        db = SessionLocal()
-        custom_terms_text = None
-        try:
-            result = db.execute(text("""
-                SELECT terms FROM commercial_quotations
-                WHERE quotation_number = :quotation_number
-            """), {'quotation_number': quotation_number}).fetchone()
-            if result and result[0]:
-                custom_terms_text = result[0]
-                print(f"DEBUG: Loaded custom terms from DB: {custom_terms_text[:100]}...")
-            else:
-                print(f"DEBUG: No custom terms found for {quotation_number}")
-        except Exception as e:
-            print(f"Error loading terms: {e}")
-        finally:
-            db.close()
-        
         # Terms
         story.append(Paragraph("<b>Important Commercial Terms</b>", small_bold))
         story.append(Spacer(1, 6))
@@ -399,338 +635,20 @@ def generate_commercial_pdf(quotation_number: str, form_data: dict):
         story.append(Paragraph("NAME: _________________________", small_text))
         story.append(Paragraph("DESIGNATION: _________________________", small_text))
         
-        # FIXED: Single PageBreak - removed duplicate that caused blank page
-        story.append(NextPageTemplate('TwoColumn'))
-        story.append(PageBreak())
-        
-        # PAGE 2+: General Conditions
-        # FIXED: Removed Spacer(1, 100) that caused excessive whitespace
-        story.append(Paragraph("<b>General Conditions of Delivery and Payment for Customers</b>", small_bold))
-        story.append(Spacer(1, 5))
-        story.append(Paragraph("The following General Conditions of Delivery and Payment for Customers shall apply to all deliveries of our products, except as modified by express agreement accepted in writing by both parties", small_text))
-        story.append(Spacer(1, 10))
+        # Build the quotation pages, then append the (cached) General Conditions pages
+        doc.build(story, canvasmaker=FooteredCanvas)
+        conditions_path = general_conditions_pdf(custom_gc_text)
         
-        # Load custom general conditions
-        custom_gc_text = None
-        db = SessionLocal()
+        writer = PdfWriter()
+        writer.append(PdfReader(quote_buffer))
+        writer.append(PdfReader(str(conditions_path)))
         try:
-            result = db.execute(text("""
-                SELECT general_conditions FROM commercial_quotations
-                WHERE quotation_number = :quotation_number
-            """), {'quotation_number': quotation_number}).fetchone()
-            if result and result[0]:
-                custom_gc_text = result[0]
-                print(f"DEBUG: Loaded custom general conditions from DB")
-            else:
-                print(f"DEBUG: No custom general conditions found")
-        except Exception as e:
-            print(f"Error loading general conditions: {e}")
-        finally:
-            db.close()
-        
-        # Styles for conditions
-        condition_text_style = ParagraphStyle(
-            'ConditionText',
-            parent=styles['Normal'],
-            fontSize=8,
-            leading=10,
-            alignment=TA_JUSTIFY,
-            spaceBefore=0,
-            spaceAfter=0
-        )
-        
-        condition_title_style = ParagraphStyle(
-            'ConditionTitle',
-            parent=styles['Normal'],
-            fontSize=8,
-            fontName='Helvetica-Bold',
-            leading=10,
-            spaceBefore=3,
-            spaceAfter=2
-        )
-        
-        # Parse conditions
-        if custom_gc_text:
-            gc_sections = []
-            conditions = custom_gc_text.split('\n\n')
-            for condition in conditions:
-                if ':' in condition:
-                    parts = condition.split(':', 1)
-                    gc_sections.append((parts[0].strip(), parts[1].strip()))
-        else:
-            # Default 12 sections with hierarchical structure
-            gc_sections = [
-                {
-                    "number": "1",
-                    "title": "Scope of application",
-                    "content": "These Terms apply to the sale and supply of power transmission parts (\"Products\") as per purchase orders issued by the Customer and accepted by the Company. Where applicable, the Company may manufacture or modify Products based on the Customer's specific requirements, subject to a written agreement on design specifications, delivery timelines, and pricing. The following Terms shall apply to all deliveries of our products, except as modified by express agreement accepted in writing by both parties. These Terms do not cover installation, commissioning, or maintenance services, if provided by the Company.",
-                    "subsections": []
-                },
-                {
-                    "number": "2",
-                    "title": "Definitions",
-                    "content": "",
-                    "subsections": [
-                        {
-                            "letter": "a",
-                            "content": "Confidential Information shall mean any and all materials and information concerning the Company, including without limitation its directors, officers, employees, subsidiaries and/or group companies, vendors, users and customers or any third party with which the Company associates (collectively, \"Affiliates\"), disclosed by the Company whether or not such information is expressly marked or designated as confidential information, including, without limitation, computer programs, software (including source code, object code and machine code) relating to the foregoing, technical drawings, algorithms, pricing information."
-                        },
-                        {
-                            "letter": "b",
-                            "content": "Intellectual Property Rights (IPR) shall mean all drawings, designs, models, specifications, documentation, software, inventions, techniques, processes, business methods, know-how, mask-works, copyrights, copyrightable materials, patents, trademarks, trade secrets, and any other information or materials protected under any intellectual property laws in effect anywhere in the world, and any applications, registrations or filings relating thereto."
-                        }
-                    ]
-                },
-                {
-                    "number": "3",
-                    "title": "Governing Terms",
-                    "content": "",
-                    "subsections": [
-                        {
-                            "letter": "a",
-                            "content": "The following documents govern the transaction - Any Company-issued quotation, order acknowledgment, invoice, or written agreement."
-                        },
-                        {
-                            "letter": "b",
-                            "content": "To the extent possible, the terms contained in these documents shall be read harmoniously. However, in the event of any conflict between these Terms and another document, these Terms shall prevail. These Terms shall prevail over any contrary terms proposed by the Customer. No additional terms shall be deemed part of these Terms unless expressly agreed to in writing and signed by an authorized representative of the Company. For the avoidance of doubt, the following shall not form part of these Terms:",
-                            "sub_subsections": [
-                                {
-                                    "roman": "i",
-                                    "content": "Any terms referenced by the Customer in its purchase orders or other documents, except for product description, quantity, and pricing that align with the Company's quotation, acknowledgment, invoice, or a separate signed agreement;"
-                                },
-                                {
-                                    "roman": "ii",
-                                    "content": "Customer's standard terms and conditions of purchase, quality policy, supplier guidelines, or similar operational policies;"
-                                },
-                                {
-                                    "roman": "iii",
-                                    "content": "Any terms on the Customer's website or electronic procurement portal, even if the Company is required to click \"accept,\" \"agree,\" or similar prompts in order to access or submit order-related information."
-                                }
-                            ]
-                        }
-                    ]
-                },
-                {
-                    "number": "4",
-                    "title": "Terms of Payment and Pricing",
-                    "content": "",
-                    "subsections": [
-                        {
-                            "letter": "a",
-                            "content": "Unless otherwise agreed, Customer shall make payment of 100% of the invoiced amount in advance against a Proforma Invoice issued by the Company. In the event of any delay in payment beyond the agreed timeline, the Company reserves the right to charge interest on the overdue amount at a rate of 8% above the prevailing discount rate of the Reserve Bank of India."
-                        },
-                        {
-                            "letter": "b",
-                            "content": "The Customer shall not withhold payment or make any deductions from the invoiced amount on account of complaints regarding the Products, unless such liability is acknowledged in writing by the Company. Goods and Services Tax (GST) and any other applicable taxes or duties shall be levied in accordance with the relevant HSN Code and prevailing laws at the time of invoicing."
-                        },
-                        {
-                            "letter": "c",
-                            "content": "Unless otherwise agreed in writing, the Company reserves the right to revise prices or apply a surcharge at any time to reflect changes in input costs, including but not limited to raw material prices, labor costs."
-                        },
-                        {
-                            "letter": "d",
-                            "content": "In cases where specialized tools, gauges, or clamping devices are required to execute a custom order, such items shall be invoiced separately to the Customer. However, ownership of these tools and devices shall remain exclusively with the Company upon completion of the order. Ownership of the Products shall remain with the Company until full payment of the purchase price has been received."
-                        },
-                        {
-                            "letter": "e",
-                            "content": "A Packing and Forwarding (P&F) charge of 2% shall be applicable on the price per Purchase Order. In cases where no P&F charge is applicable, the Company shall utilize its standard packing method for dispatch. Any special packaging requirements requested by the Customer may attract additional charges, which will be communicated separately."
-                        }
-                    ]
-                },
-                {
-                    "number": "5",
-                    "title": "Orders and Acceptance",
-                    "content": "",
-                    "subsections": [
-                        {
-                            "letter": "a",
-                            "content": "All orders must be submitted in writing and clearly specify the type and quantity of Products, delivery address, required delivery date, and any applicable reference to quotations or prior correspondence."
-                        },
-                        {
-                            "letter": "b",
-                            "content": "Orders become binding only upon written acceptance by the Company. All dimensions, weights, illustrations, and technical drawings provided prior to order confirmation are indicative only and not contractually binding, unless confirmed in writing. The scope, specifications, and type of Products to be delivered shall be determined solely by the Company's written order confirmation."
-                        },
-                        {
-                            "letter": "c",
-                            "content": "Any modifications requested by the Customer after order confirmation must be approved in writing by the Company and may be subject to revised terms, including pricing and delivery schedule. The Customer may not cancel or amend an order after confirmation without the prior written consent of the Company. Any such change may be subject to charges as reasonably determined by the Company."
-                        }
-                    ]
-                },
-                {
-                    "number": "6",
-                    "title": "Delivery",
-                    "content": "",
-                    "subsections": [
-                        {
-                            "letter": "a",
-                            "content": "All prices are quoted on an EX Works Chakan basis (Incoterms 2020), unless otherwise agreed."
-                        },
-                        {
-                            "letter": "b",
-                            "content": "The delivery period shall commence only after all technical specifications and contractual details have been mutually agreed upon in writing by both Parties"
-                        }
-                    ]
-                },
-                {
-                    "number": "7",
-                    "title": "Force Majeure",
-                    "content": "",
-                    "subsections": [
-                        {
-                            "letter": "a",
-                            "content": "The Company shall not be liable for any delay in delivery or failure to fulfill an order caused by circumstances beyond its reasonable control, including but not limited to acts of God, natural disasters, pandemics, labor unrest, strikes, lockouts, supply chain disruptions, power or equipment failure, operating difficulties, delays by subcontractors or suppliers, transportation issues, port congestion, embargoes, or any governmental or regulatory actions (\"Force Majeure Event(s)\"). In the event of any such Force Majeure Event(s), the Company shall be entitled to an appropriate extension of the delivery period. The Company will notify the Customer of the occurrence and expected duration of such delay as soon as reasonably practicable. Any claims for penalties, liquidated damages, or other compensation due to delayed delivery shall be excluded unless specifically agreed upon in writing at the time of placing the order. The Customer shall not be entitled to cancel the order, reject, or refuse to accept delivery of the Products due to delays arising from Force Majeure Events or other reasons unless the Products, upon delivery, are found not to conform to the warranty obligations set forth in this Agreement."
-                        }
-                    ]
-                },
-                {
-                    "number": "8",
-                    "title": "Representations and Warranty",
-                    "content": "",
-                    "subsections": [
-                        {
-                            "letter": "a",
-                            "content": "The Customer shall inspect the Products immediately upon receipt. Any claims for defects or non-conformities must be reported to the Company in writing within seven (7) days of receipt of the shipment. Failure to notify the Company within this period shall constitute acceptance of the Products as delivered and a waiver of any such claims."
-                        },
-                        {
-                            "letter": "b",
-                            "content": "Unless otherwise expressly agreed in writing, each Product shall be covered under the limited warranty by the Company that every Product has been been manufactured in accordance with applicable law and that it meets its specifications, it will be free from defects in materials or workmanship, provided it is stored, used and handled under the conditions recommended by Company. The Company warranty is for a period of twelve (12) months from the date of commissioning or eighteen (18) months from the date of dispatch, whichever occurs earlier. In the event of a valid deficiency claim, the Company's sole obligation shall be, at its discretion, to either:",
-                            "sub_subsections": [
-                                {
-                                    "roman": "i",
-                                    "content": "Repair the defective component(s), or"
-                                },
-                                {
-                                    "roman": "ii",
-                                    "content": "Replace the defective component(s), free of charge, provided that such components are returned to the Company's premises in the original or equivalent protective packaging."
-                                }
-                            ]
-                        },
-                        {
-                            "letter": "c",
-                            "content": "The Company shall be liable only for:",
-                            "sub_subsections": [
-                                {
-                                    "roman": "i",
-                                    "content": "Defects arising from its own design or manufacturing faults; and"
-                                },
-                                {
-                                    "roman": "ii",
-                                    "content": "Material defects that the Company should have reasonably discovered through due diligence."
-                                }
-                            ]
-                        },
-                        {
-                            "letter": "d",
-                            "content": "The Company shall not be liable for any claims, losses, or damages arising out of or relating to the following circumstances, whether direct or indirect:",
-                            "sub_subsections": [
-                                {
-                                    "roman": "i",
-                                    "content": "Normal wear and tear of the Products under regular operating conditions, including deterioration due to environmental exposure, usage, or time;"
-                                },
-                                {
-                                    "roman": "ii",
-                                    "content": "Improper handling, incorrect storage, misuse, negligence, or operation of the Products in a manner inconsistent with the Product specifications, manuals, or any written instructions provided by the Company;"
-                                },
-                                {
-                                    "roman": "iii",
-                                    "content": "Any modification of the Products undertaken by the Customer or any third party;"
-                                },
-                                {
-                                    "roman": "iv",
-                                    "content": "Use of non-original replacement parts, components, or consumables with the Products;"
-                                },
-                                {
-                                    "roman": "v",
-                                    "content": "Any force majeure events including but not limited to fire, flood, act of God, civil unrest, strikes, war, pandemic, or government-imposed restrictions;"
-                                },
-                                {
-                                    "roman": "vi",
-                                    "content": "Consequential or indirect damages including, but not limited to, loss of production, business interruption, penalties for delay, freight costs, costs of disassembly/reassembly, or damage to other machinery or equipment."
-                                },
-                                {
-                                    "roman": "vii",
-                                    "content": "Any claims arising after the expiration of the applicable warranty period."
-                                }
-                            ]
-                        },
-                        {
-                            "letter": "e",
-                            "content": "All other terms and conditions shall be as specified in the Installation and Operating Manual issued by the Company."
-                        },
-                        {
-                            "letter": "f",
-                            "content": "The Customer represents that it has all the requisite power to execute these Terms and to perform its obligations hereunder, and the person(s) implementing these Terms on its behalf are duly authorised. These Terms are legally binding upon it and it does not conflict with any agreement, instrument or understanding, oral or written, to which it is a party or by which it may be bound."
-                        }
-                    ]
-                },
-                {
-                    "number": "9",
-                    "title": "Indemnity and Limitation of Liability",
-                    "content": "",
-                    "subsections": [
-                        {
-                            "letter": "a",
-                            "content": "The Customer shall indemnify and hold harmless the Company and its affiliates (\"Indemnified Parties\") from any claims, losses, liabilities, damages, or expenses (including legal fees) arising from:",
-                            "sub_subsections": [
-                                {
-                                    "roman": "i",
-                                    "content": "any breach of these Terms;"
-                                },
-                                {
-                                    "roman": "ii",
-                                    "content": "any negligence, willful misconduct, or legal violation by the Customer or its representatives;"
-                                },
-                                {
-                                    "roman": "iii",
-                                    "content": "any misuse, unauthorized modification, or improper handling of the Products by the Customer or parties under its control;"
-                                },
-                                {
-                                    "roman": "iv",
-                                    "content": "any claim that Customer-provided specifications, drawings, or instructions infringe third-party intellectual property rights."
-                                }
-                            ]
-                        },
-                        {
-                            "letter": "b",
-                            "content": "The Company shall not be liable for any indirect, incidental, consequential, punitive, or special damages, including loss of profits, data, or business, even if advised of such possibility. These limitations and exclusions apply regardless of the form or basis of the claim."
-                        }
-                    ]
-                },
-                {
-                    "number": "10",
-                    "title": "Term and Termination",
-                    "content": "These Terms shall remain in effect until completion of the obligations by both Parties and may be terminated earlier by mutual written consent or for material breach not remedied within a reasonable period as discussed in writing by the Customer and the Company.",
-                    "subsections": []
-                },
-                {
-                    "number": "11",
-                    "title": "Confidentiality Obligations",
-                    "content": "The Customer agrees to keep confidential all technical, commercial, and business information received from the Company. The Customer must protect the confidentiality of any information shared by the Company for a period of two (2) years after termination. Breach may result in a fixed penalty (amount to be agreed) per violation, in addition to potential damage claims. The Company also retains the right to claim indemnification of damage caused to it by the disclosure of the information.",
-                    "subsections": []
-                },
-                {
-                    "number": "12",
-                    "title": "Governing Law and Jurisdiction",
-                    "content": "These Terms are governed by the laws of India. Disputes shall be subject to the exclusive jurisdiction of courts in Pune, Maharashtra, India.",
-                    "subsections": []
-                }
-            ]
-
-        # Flatten hierarchical structure
-        gc_sections = flatten_general_conditions(gc_sections)
-        
-        # Add conditions - flows automatically across columns and pages
-        for title, content in gc_sections:
-            story.append(Paragraph(f"<b>{title}</b>", condition_title_style))
-            story.append(Spacer(1, 3))
-            story.append(Paragraph(content, condition_text_style))
-            story.append(Spacer(1, 10))
-        
-        # Store logo path as class variable
-        FooteredCanvas._logo_path = str(logo_path) if logo_path.exists() else None
-        
-        # Build PDF
-        doc.build(story, canvasmaker=FooteredCanvas)
+            with open(render_path, 'wb') as f:
+                writer.write(f)
+        except Exception:
+            render_path.unlink(missing_ok=True)
+            raise
+        publish_pdf(render_path, filepath)
         
         return {
             'success': True,
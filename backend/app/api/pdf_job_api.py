@@ -0,0 +1,195 @@
+"""
+PDF Job API
+Background PDF generation: submit returns a job id, progress is pushed to the
+frontend through the JS-exposed pdf_job_update callback
+"""
+import eel
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+from app.config import EXPORT_DIR
+from app.database.connection import SessionLocal
+from app.models.analytics_models import AnalyticsFilters
+from app.services.pdf_batch_service import BATCH_KINDS, PdfBatchService, write_batch_zip
+from app.services.pdf_job_service import PdfJobQueue
+from app.utils.logger import setup_logger
+
+logger = setup_logger()
+
+
+def notify_frontend(job: dict):
+    """Push a job snapshot to the React app (no-op until the page has exposed the callback)"""
+    eel.pdf_job_update(job)
+
+
+pdf_jobs = PdfJobQueue(spawn=eel.spawn, sleep=eel.sleep, notify=notify_frontend)
+
+
+@eel.expose
+def submit_commercial_pdf_job(quotation_number: str, form_data: dict):
+    """Queue commercial PDF generation; returns a job id immediately"""
+    from app.api.pdf_generator import load_stored_text, render_commercial_pdf
+    
+    try:
+        # Read the stored text here so the render worker never opens a database session
+        terms = load_stored_text('terms', quotation_number)
+        general_conditions = load_stored_text('general_conditions', quotation_number)
+        job_id = pdf_jobs.submit(
+            'commercial',
+            quotation_number,
+            [(render_commercial_pdf, (quotation_number, form_data, terms, general_conditions))],
+            _commercial_result
+        )
+        return {'success': True, 'job_id': job_id}
+    except Exception as e:
+        logger.error(f"Submit commercial PDF job failed: {e}")
+        return {'success': False, 'message': str(e)}
+
+
+@eel.expose
+def submit_technical_pdf_job(quotation_number, metadata, requirements, technical_quotes):
+    """Queue technical PDF generation (one task per part type); returns a job id immediately"""
+    from app.api.technical_pdf_generator import plan_technical_pdfs, collect_technical_pdfs, render_part_pdf
+    from app.api.technical_quote_api import technical_pdf_response
+    
+    try:
+        jobs = plan_technical_pdfs(quotation_number, metadata, requirements, technical_quotes,
+                                   Path("data/quotations/technical"))
+        if not jobs:
+            return {'success': False, 'message': 'No requirements to generate PDF'}
+        
+        job_id = pdf_jobs.submit(
+            'technical',
+            quotation_number,
+            [(render_part_pdf, args) for args in jobs],
+            lambda outcomes: technical_pdf_response(*collect_technical_pdfs(jobs, outcomes))
+        )
+        return {'success': True, 'job_id': job_id, 'total': len(jobs)}
+    except Exception as e:
+        logger.error(f"Submit technical PDF job failed: {e}")
+        return {'success': False, 'message': str(e)}
+
+
+@eel.expose
+def submit_batch_pdf_job(
+    kinds: Optional[List[str]] = None,
+    date_filter: str = "all",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    quote_status: str = "all",
+    customer: str = "all",
+    product_type: str = "all",
+    quotation_numbers: Optional[List[str]] = None
+):
+    """
+    Queue PDF regeneration for every project matching the filters; the job result
+    points to one ZIP in the export folder with a per-file manifest
+    """
+    from app.api.pdf_generator import render_commercial_pdf
+    from app.api.technical_pdf_generator import plan_technical_pdfs, render_part_pdf
+    
+    kinds = [k for k in (kinds or BATCH_KINDS) if k in BATCH_KINDS]
+    if not kinds:
+        return {'success': False, 'message': f"kinds must be any of {', '.join(BATCH_KINDS)}"}
+    
+    db = SessionLocal()
+    try:
+        filters = AnalyticsFilters(
+            date_filter=date_filter,
+            start_date=start_date,
+            end_date=end_date,
+            quote_status=quote_status,
+            customer=customer,
+            product_type=product_type
+        )
+        batch = PdfBatchService(db).load_batch(filters, kinds, quotation_numbers)
+    except Exception as e:
+        logger.error(f"Loading PDF batch failed: {e}")
+        return {'success': False, 'message': str(e)}
+    finally:
+        db.close()
+    
+    # One render task per commercial quote and per technical part type, with its manifest entry
+    tasks, entries = [], []
+    for project in batch:
+        quotation_number = project['quotation_number']
+        commercial = project['commercial']
+        if 'commercial' in kinds and commercial:
+            tasks.append((render_commercial_pdf, (
+                quotation_number, commercial['form_data'], commercial['terms'], commercial['general_conditions']
+            )))
+            entries.append({'quotation_number': quotation_number, 'kind': 'commercial', 'part_type': ''})
+        if 'technical' in kinds and project['requirements']:
+            for args in plan_technical_pdfs(quotation_number, {'quote_number': quotation_number},
+                                            project['requirements'], project['technical_quotes'],
+                                            Path("data/quotations/technical")):
+                tasks.append((render_part_pdf, args))
+                entries.append({'quotation_number': quotation_number, 'kind': 'technical', 'part_type': args[0]})
+    
+    if not tasks:
+        return {'success': False, 'message': 'No quotations with PDF data match the filters'}
+    
+    try:
+        job_id = pdf_jobs.submit(
+            'batch',
+            f"{len(batch)} quotations",
+            tasks,
+            lambda outcomes: _batch_result(entries, outcomes)
+        )
+        return {'success': True, 'job_id': job_id, 'total': len(tasks)}
+    except Exception as e:
+        logger.error(f"Submit batch PDF job failed: {e}")
+        return {'success': False, 'message': str(e)}
+
+
+@eel.expose
+def get_pdf_job_status(job_id: str):
+    """Get status, progress and (when finished) the result of a PDF job"""
+    job = pdf_jobs.status(job_id)
+    if job is None:
+        return {'success': False, 'message': 'Job not found'}
+    return {'success': True, 'data': job}
+
+
+@eel.expose
+def cancel_pdf_job(job_id: str):
+    """Cancel a queued or running PDF job"""
+    job = pdf_jobs.cancel(job_id)
+    if job is None:
+        return {'success': False, 'message': 'Job not found'}
+    return {'success': True, 'data': job}
+
+
+def _commercial_result(outcomes):
+    """Job result for a commercial PDF: the generator's own response dict"""
+    result, error = outcomes[0]
+    if error is not None:
+        return {'success': False, 'message': str(error)}
+    return result
+
+
+def _batch_result(entries, outcomes):
+    """Job result for a batch: the ZIP written to the export folder and its manifest"""
+    manifest = []
+    for entry, (result, error) in zip(entries, outcomes):
+        if error is None and isinstance(result, dict):
+            # render_commercial_pdf reports failures in its response instead of raising
+            error = None if result.get('success') else result.get('message')
+            result = result.get('filepath')
+        status = 'success' if error is None and result else 'failed'
+        manifest.append({**entry, 'status': status, 'file': result if status == 'success' else '',
+                         'error': str(error) if error is not None else ''})
+    
+    zip_path = EXPORT_DIR / f"quotation_pdfs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+    write_batch_zip(zip_path, manifest, idle=lambda: eel.sleep(0))
+    
+    succeeded = sum(1 for entry in manifest if entry['status'] == 'success')
+    return {
+        'success': succeeded > 0,
+        'message': f"Exported {succeeded} of {len(manifest)} PDF(s) to {zip_path.name}",
+        'filename': zip_path.name,
+        'filepath': str(zip_path),
+        'succeeded': succeeded,
+        'failed': len(manifest) - succeeded,
+        'manifest': manifest
+    }
@@ -0,0 +1,169 @@
+"""
+PDF Styles
+Paragraph and table styles shared by the PDF generators, built once on first use.
+Styles are shared between documents, so callers must not modify them.
+"""
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_JUSTIFY
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch, mm
+from reportlab.platypus import Frame, PageTemplate, TableStyle
+
+# Commercial quotation column widths
+COMMERCIAL_HEADER_WIDTHS = (1.8*inch, 5.4*inch)
+COMMERCIAL_CONTACT_WIDTHS = (1.2*inch, 2.3*inch, 1.1*inch, 2.4*inch)
+COMMERCIAL_ITEMS_WIDTHS = (0.5*inch, 3.5*inch, 1.2*inch, 0.6*inch, 1.2*inch)
+
+# Gap between the two General Conditions columns
+COMMERCIAL_COLUMN_GAP = 10
+
+
+@lru_cache(maxsize=None)
+def commercial_styles() -> Dict[str, object]:
+    """Paragraph and table styles of the commercial quotation"""
+    styles = getSampleStyleSheet()
+    return {
+        'title': ParagraphStyle(
+            'Title',
+            parent=styles['Heading1'],
+            fontSize=18,
+            fontName='Helvetica-Bold',
+            alignment=TA_CENTER,
+            spaceAfter=15,
+            spaceBefore=10
+        ),
+        'small_bold': ParagraphStyle(
+            'SmallBold',
+            parent=styles['Normal'],
+            fontName='Helvetica-Bold',
+            fontSize=8
+        ),
+        'small_text': ParagraphStyle(
+            'Small',
+            parent=styles['Normal'],
+            fontSize=8,
+            leading=11
+        ),
+        'condition_text': ParagraphStyle(
+            'ConditionText',
+            parent=styles['Normal'],
+            fontSize=8,
+            leading=10,
+            alignment=TA_JUSTIFY,
+            spaceBefore=0,
+            spaceAfter=0
+        ),
+        'condition_title': ParagraphStyle(
+            'ConditionTitle',
+            parent=styles['Normal'],
+            fontSize=8,
+            fontName='Helvetica-Bold',
+            leading=10,
+            spaceBefore=3,
+            spaceAfter=2
+        ),
+        'header_table': TableStyle([
+            ('FONTNAME', (1, 0), (1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (1, 0), (1, 0), 16),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+            ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
+        ]),
+        'contact_table': TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 5),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 5),
+            ('TOPPADDING', (0, 0), (-1, -1), 4),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ]),
+        'items_table': TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+            ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
+            ('ALIGN', (3, 0), (3, -1), 'CENTER'),
+            ('ALIGN', (4, 0), (4, -1), 'RIGHT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 5),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 5),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ]),
+    }
+
+
+def commercial_page_templates(doc) -> List[PageTemplate]:
+    """
+    First-page and two-column templates for a commercial document. Frames keep
+    layout state while a document builds, so these are made per document.
+    """
+    frame_single = Frame(
+        doc.leftMargin, doc.bottomMargin, doc.width, doc.height,
+        id='single', topPadding=0, bottomPadding=0, leftPadding=0, rightPadding=0
+    )
+
+    frame_width = (doc.width - COMMERCIAL_COLUMN_GAP) / 2
+    frame_left = Frame(
+        doc.leftMargin, doc.bottomMargin, frame_width, doc.height,
+        id='col1', topPadding=0, bottomPadding=0, leftPadding=0, rightPadding=5
+    )
+    frame_right = Frame(
+        doc.leftMargin + frame_width + COMMERCIAL_COLUMN_GAP, doc.bottomMargin, frame_width, doc.height,
+        id='col2', topPadding=0, bottomPadding=0, leftPadding=5, rightPadding=0
+    )
+
+    return [
+        PageTemplate(id='FirstPage', frames=[frame_single], pagesize=doc.pagesize),
+        PageTemplate(id='TwoColumn', frames=[frame_left, frame_right], pagesize=doc.pagesize)
+    ]
+
+
+@lru_cache(maxsize=None)
+def technical_styles() -> Dict[str, object]:
+    """Header, metadata and footer styles shared by the technical quotation templates"""
+    boxed_padding = [
+        ('BOX', (0, 0), (-1, -1), 1, colors.black),
+        ('TOPPADDING', (0, 0), (-1, -1), 2*mm),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 2*mm),
+    ]
+    return {
+        'company': ParagraphStyle('Company', fontSize=6.5, alignment=TA_RIGHT, leading=8),
+        'title': ParagraphStyle('Title', fontSize=10, fontName='Helvetica-Bold', alignment=TA_CENTER),
+        'meta': ParagraphStyle('Meta', fontSize=7.5, leading=10),
+        'footer': ParagraphStyle('Footer', fontSize=6.5, leading=8),
+        'header_table': TableStyle([
+            ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+            ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]),
+        'header_box': TableStyle(boxed_padding + [
+            ('LEFTPADDING', (0, 0), (-1, -1), 2*mm),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 2*mm),
+        ]),
+        'title_box': TableStyle(boxed_padding),
+        'meta_box': TableStyle(boxed_padding + [
+            ('LEFTPADDING', (0, 0), (-1, -1), 2*mm),
+        ]),
+        'footer_table': TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('TOPPADDING', (0, 0), (-1, -1), 1.5),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 1.5),
+            ('LEFTPADDING', (0, 0), (-1, -1), 2),
+        ]),
+    }
+
+
+@lru_cache(maxsize=None)
+def cell_styles(font_size: float, leading: float) -> Tuple[ParagraphStyle, ParagraphStyle]:
+    """(cell, header) paragraph styles for a technical requirements table"""
+    return (
+        ParagraphStyle('CellStyle', fontSize=font_size, alignment=TA_CENTER, leading=leading),
+        ParagraphStyle('HeaderStyle', fontSize=font_size, alignment=TA_CENTER, leading=leading, fontName='Helvetica-Bold')
+    )
@@ -1,45 +1,89 @@
 import eel
+import base64
+import json
+from sqlalchemy import String, tuple_, type_coerce
 from app.services.project_service import ProjectService
-from app.database.connection import SessionLocal
+from app.services.requirement_service import RequirementService
+from app.database.connection import SessionLocal, WriterSession
+from app.database.search_index import match_phrase, project_matches, ranked_customer_ids
 from app.models.project import Project, QuoteStatus
 from app.models.customer import Customer
+from app.services.analytics_rollup_service import AnalyticsRollupService
+from app.services.analytics_cache import AnalyticsCache, analytics_cache
 from app.utils.logger import setup_logger
 
 logger = setup_logger()
 project_service = ProjectService()
+requirement_service = RequirementService()
+project_count_cache = AnalyticsCache(256)
+
+def invalidate_project_caches():
+    """Drop cached analytics and search counts after a write to projects or their requirements"""
+    analytics_cache.invalidate()
+    project_count_cache.invalidate()
+
+# updated_at as stored text: server defaults omit microseconds, so comparing against a bound
+# datetime would miss equal timestamps; comparing the raw text keeps the index usable
+_updated_at_raw = type_coerce(Project.updated_at, String)
 
 # UPDATED: Get projects with pagination and search
 @eel.expose
-def get_projects_paginated(page=1, per_page=10, search_query=''):
-    """Get projects with pagination and search"""
+def get_projects_paginated(page=1, per_page=10, search_query='', cursor=None, direction='next'):
+    """Get projects with pagination and search; pass a cursor to seek instead of OFFSET"""
     db = SessionLocal()
     try:
-        query = db.query(Project)
+        query = db.query(Project, _updated_at_raw.label('updated_at_raw'))
         
         # Apply search filter if provided
-        if search_query and search_query.strip():
-            search_term = f"%{search_query.strip()}%"
+        search_term = search_query.strip() if search_query else ''
+        phrase = match_phrase(search_term)
+        if phrase:
+            query = query.filter(Project.id.in_(project_matches(phrase)))
+        elif search_term:
+            like_term = f"%{search_term}%"
             query = query.filter(
-                (Project.quotation_number.ilike(search_term)) |
-                (Project.customer_name.ilike(search_term))
+                (Project.quotation_number.ilike(like_term)) |
+                (Project.customer_name.ilike(like_term))
             )
         
-        # Order by most recent first
-        query = query.order_by(Project.updated_at.desc())
-        
-        # Get total count
-        total_count = query.count()
+        # Get total count (cached per search term until a write changes the indexed text)
+        total_count = project_count_cache.get_or_compute(
+            project_count_cache.make_key("project_count", None, search_term),
+            query.count
+        )
         
         # Calculate pagination
         total_pages = (total_count + per_page - 1) // per_page  # Ceiling division
-        offset = (page - 1) * per_page
         
-        # Get paginated results
-        projects = query.offset(offset).limit(per_page).all()
+        if cursor:
+            # Keyset mode: seek past the (updated_at, id) of the first/last row of the current page
+            cursor_updated_at, cursor_id = _decode_cursor(cursor)
+            key = tuple_(_updated_at_raw, Project.id)
+            if direction == 'prev':
+                query = query.filter(key > tuple_(cursor_updated_at, cursor_id))
+                query = query.order_by(_updated_at_raw.asc(), Project.id.asc())
+            else:
+                query = query.filter(key < tuple_(cursor_updated_at, cursor_id))
+                query = query.order_by(_updated_at_raw.desc(), Project.id.desc())
+            
+            rows = query.limit(per_page + 1).all()
+            has_more = len(rows) > per_page
+            rows = rows[:per_page]
+            if direction == 'prev':
+                rows.reverse()
+                has_prev, has_next = has_more, True
+            else:
+                has_prev, has_next = True, has_more
+        else:
+            # Order by most recent first
+            query = query.order_by(_updated_at_raw.desc(), Project.id.desc())
+            offset = (page - 1) * per_page
+            rows = query.offset(offset).limit(per_page).all()
+            has_prev, has_next = page > 1, page < total_pages
         
         # Format results
         project_list = []
-        for project in projects:
+        for project, _ in rows:
             project_list.append({
                 'id': project.id,
                 'quotation_number': project.quotation_number,
@@ -57,7 +101,11 @@ def get_projects_paginated(page=1, per_page=10, search_query=''):
                 'current_page': page,
                 'total_pages': total_pages,
                 'total_count': total_count,
-                'per_page': per_page
+                'per_page': per_page,
+                'has_next': has_next,
+                'has_prev': has_prev,
+                'next_cursor': _encode_cursor(*rows[-1]) if rows and has_next else None,
+                'prev_cursor': _encode_cursor(*rows[0]) if rows and has_prev else None
             }
         }
     except Exception as e:
@@ -67,11 +115,22 @@ def get_projects_paginated(page=1, per_page=10, search_query=''):
         db.close()
 
 
+def _encode_cursor(project, updated_at_raw):
+    """Opaque page cursor for a project row"""
+    return base64.urlsafe_b64encode(json.dumps([updated_at_raw, project.id]).encode()).decode()
+
+
+def _decode_cursor(cursor):
+    """Inverse of _encode_cursor; returns (updated_at as stored, id)"""
+    updated_at_raw, project_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    return updated_at_raw, int(project_id)
+
+
 # NEW: Update project quote status
 @eel.expose
 def update_project_quote_status(project_id: int, quote_status: str):
     """Update project quote status"""
-    db = SessionLocal()
+    db = WriterSession()
     try:
         project = db.query(Project).filter(Project.id == project_id).first()
         if not project:
@@ -84,7 +143,9 @@ def update_project_quote_status(project_id: int, quote_status: str):
         
         # Update status
         project.quote_status = QuoteStatus[quote_status.lower()]
+        AnalyticsRollupService(db).refresh_quotation(project.quotation_number)
         db.commit()
+        analytics_cache.invalidate()
         
         return {
             'success': True,
@@ -118,6 +179,7 @@ def delete_project(project_id: int):
     """Delete project permanently"""
     try:
         project_service.delete(project_id)
+        project_count_cache.invalidate()
         return {'success': True, 'message': 'Project deleted successfully'}
     except Exception as e:
         logger.error(f"Delete project failed: {e}")
@@ -153,9 +215,15 @@ def search_customers(search_term: str):
     """Search customers by name"""
     db = SessionLocal()
     try:
-        customers = db.query(Customer).filter(
-            Customer.name.ilike(f'%{search_term}%')
-        ).limit(10).all()
+        phrase = match_phrase(search_term)
+        if phrase:
+            customer_ids = ranked_customer_ids(db, search_term, phrase, 10)
+            by_id = {c.id: c for c in db.query(Customer).filter(Customer.id.in_(customer_ids))}
+            customers = [by_id[i] for i in customer_ids if i in by_id]
+        else:
+            customers = db.query(Customer).filter(
+                Customer.name.ilike(f'%{search_term}%')
+            ).limit(10).all()
         
         return {
             'success': True,
@@ -170,7 +238,7 @@ def search_customers(search_term: str):
 @eel.expose
 def create_project(quotation_number: str, customer_name: str, quote_status: str = 'Budgetary'):
     """Create new project with quote status"""
-    db = SessionLocal()
+    db = WriterSession()
     try:
         # Check if quotation number exists
         exists = db.query(Project).filter(
@@ -193,7 +261,9 @@ def create_project(quotation_number: str, customer_name: str, quote_status: str
             quote_status=QuoteStatus[quote_status.lower()]
         )
         db.add(project)
+        AnalyticsRollupService(db).refresh_quotation(quotation_number)
         db.commit()
+        invalidate_project_caches()
         db.refresh(project)
         
         return {
@@ -214,25 +284,69 @@ def create_project(quotation_number: str, customer_name: str, quote_status: str
 
 @eel.expose
 def save_requirements(project_id: int, requirements: list):
-    """Save customer requirements for project"""
-    db = SessionLocal()
+    """Save customer requirements for project, writing only the rows that changed"""
+    db = WriterSession()
     try:
         project = db.query(Project).filter(Project.id == project_id).first()
         if not project:
             return {'success': False, 'error': 'Project not found'}
         
-        # Store requirements as JSON in project
-        import json
-        project.requirements_data = json.dumps(requirements)
+        counts = requirement_service.save(project, requirements)
         db.commit()
+        if counts['unchanged'] != sum(counts.values()):
+            invalidate_project_caches()
         
-        return {'success': True, 'message': 'Requirements saved successfully'}
+        return {'success': True, 'message': 'Requirements saved successfully', 'changes': counts}
     except Exception as e:
         db.rollback()
         logger.error(f"Save requirements failed: {e}")
         return {'success': False, 'error': str(e)}
     finally:
         db.close()
+
+@eel.expose
+def save_requirement(project_id: int, requirement: dict, position=None):
+    """Insert or update a single requirement of a project"""
+    db = WriterSession()
+    try:
+        project = db.query(Project).filter(Project.id == project_id).first()
+        if not project:
+            return {'success': False, 'error': 'Project not found'}
+        
+        counts = requirement_service.upsert(project, requirement, position)
+        db.commit()
+        if not counts['unchanged']:
+            invalidate_project_caches()
+        
+        return {'success': True, 'message': 'Requirement saved successfully', 'changes': counts}
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Save requirement failed: {e}")
+        return {'success': False, 'error': str(e)}
+    finally:
+        db.close()
+
+@eel.expose
+def delete_requirement(project_id: int, requirement_id: int):
+    """Delete a single requirement of a project"""
+    db = WriterSession()
+    try:
+        project = db.query(Project).filter(Project.id == project_id).first()
+        if not project:
+            return {'success': False, 'error': 'Project not found'}
+        
+        deleted = requirement_service.delete(project, requirement_id)
+        db.commit()
+        if deleted:
+            invalidate_project_caches()
+        
+        return {'success': True, 'message': 'Requirement deleted successfully', 'deleted': deleted}
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Delete requirement failed: {e}")
+        return {'success': False, 'error': str(e)}
+    finally:
+        db.close()
         
         
 #---------------------------------------------        
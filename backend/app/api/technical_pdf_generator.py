@@ -3,6 +3,7 @@ Part-Type Specific Technical Quotation PDF Generator
 Each part type gets its own PDF with specific template
 """
 from datetime import datetime
+from functools import lru_cache
 from reportlab.lib.pagesizes import A4, landscape
 from reportlab.lib import colors
 from reportlab.lib.units import mm
@@ -11,6 +12,9 @@ from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.pdfgen import canvas
 from pathlib import Path
+from app.api.pdf_styles import technical_styles, cell_styles
+from app.utils.assets import logo_flowable
+from app.services.pdf_cache import pdf_input_hash, reuse_cached_pdf, pending_path, publish_pdf
 
 class NumberedCanvas(canvas.Canvas):
     def __init__(self, *args, **kwargs):
@@ -57,120 +61,39 @@ def get_field_value(data_dict, *possible_keys):
 
 def add_header_and_metadata(story, title_text, metadata):
     """Add common header and metadata sections"""
-    logo_path = Path("../frontend/public/assets/ringspann_logo2.png")
-    if not logo_path.exists():
-        logo_path = Path("D:/Irizpro/ringspann-desktop/frontend/public/assets/ringspann_logo2.png")
-    
-    company_style = ParagraphStyle('Company', fontSize=6.5, alignment=TA_RIGHT, leading=8)
-    company_text = """RINGSPANN Power Transmission India Pvt. Ltd.<br/>
-Gat No: 679/2/1, Village Kuruli, Taluka Khed,<br/>
-Chakan-Alandi Road, District Pune-410501.<br/>
-Phone: +91 2135 677500, Fax: +91 2135 677505<br/>
-www.ringspann-india.com"""
-    
-    if logo_path.exists():
-        logo = Image(str(logo_path), width=50*mm, height=12*mm)
-        header_data = [[logo, Paragraph(company_text, company_style)]]
-    else:
-        header_data = [["RINGSPANN", Paragraph(company_text, company_style)]]
-    
-    header_table = Table(header_data, colWidths=[60*mm, 217*mm])
-    header_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
-    
-    header_box = Table([[header_table]], colWidths=[277*mm])
-    header_box.setStyle(TableStyle([
-        ('BOX', (0, 0), (-1, -1), 1, colors.black),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2*mm),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 2*mm),
-        ('TOPPADDING', (0, 0), (-1, -1), 2*mm),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2*mm),
-    ]))
-    story.append(header_box)
-    
-    # Title
-    title_table = Table([[Paragraph(f"<b>{title_text}</b>", 
-                        ParagraphStyle('Title', fontSize=10, fontName='Helvetica-Bold', alignment=TA_CENTER))]], 
-                        colWidths=[277*mm])
-    title_table.setStyle(TableStyle([
-        ('BOX', (0, 0), (-1, -1), 1, colors.black),
-        ('TOPPADDING', (0, 0), (-1, -1), 2*mm),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2*mm),
-    ]))
-    story.append(title_table)
-    
-    # Metadata
-    meta_style = ParagraphStyle('Meta', fontSize=7.5, leading=10)
-    meta_content = f"""<b>Quote number:</b> {metadata.get('quote_number', '')}<br/>
-<b>Project name:</b> {metadata.get('project_name', '')}<br/>
-<b>End-user name / location:</b> {metadata.get('end_user_name', '')}<br/>
-<b>EPC / location:</b> {metadata.get('epc_location', '')}<br/>
-<b>OEM name / location:</b> {metadata.get('oem_name', '')}<br/>
-<b>Prepared by:</b> {metadata.get('prepared_by', 'Ringspann')}<br/>
-<b>Date:</b> {metadata.get('date', datetime.now().strftime('%Y-%m-%d'))}"""
-    
-    meta_table = Table([[Paragraph(meta_content, meta_style)]], colWidths=[277*mm])
-    meta_table.setStyle(TableStyle([
-        ('BOX', (0, 0), (-1, -1), 1, colors.black),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2*mm),
-        ('TOPPADDING', (0, 0), (-1, -1), 2*mm),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2*mm),
-    ]))
-    story.append(meta_table)
+    add_header_and_metadata_wide(story, title_text, metadata, content_width=277)
 
 
 def add_header_and_metadata_wide(story, title_text, metadata, content_width=287):
     """Add header and metadata sections for wider tables (e.g., Locking Element)"""
-    logo_path = Path("../frontend/public/assets/ringspann_logo2.png")
-    if not logo_path.exists():
-        logo_path = Path("D:/Irizpro/ringspann-desktop/frontend/public/assets/ringspann_logo2.png")
+    styles = technical_styles()
     
-    company_style = ParagraphStyle('Company', fontSize=6.5, alignment=TA_RIGHT, leading=8)
     company_text = """RINGSPANN Power Transmission India Pvt. Ltd.<br/>
 Gat No: 679/2/1, Village Kuruli, Taluka Khed,<br/>
 Chakan-Alandi Road, District Pune-410501.<br/>
 Phone: +91 2135 677500, Fax: +91 2135 677505<br/>
 www.ringspann-india.com"""
     
-    if logo_path.exists():
-        logo = Image(str(logo_path), width=50*mm, height=12*mm)
-        header_data = [[logo, Paragraph(company_text, company_style)]]
+    logo = logo_flowable(width=50*mm, height=12*mm)
+    if logo:
+        header_data = [[logo, Paragraph(company_text, styles['company'])]]
     else:
-        header_data = [["RINGSPANN", Paragraph(company_text, company_style)]]
+        header_data = [["RINGSPANN", Paragraph(company_text, styles['company'])]]
     
     header_table = Table(header_data, colWidths=[60*mm, (content_width-60)*mm])
-    header_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
+    header_table.setStyle(styles['header_table'])
     
     header_box = Table([[header_table]], colWidths=[content_width*mm])
-    header_box.setStyle(TableStyle([
-        ('BOX', (0, 0), (-1, -1), 1, colors.black),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2*mm),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 2*mm),
-        ('TOPPADDING', (0, 0), (-1, -1), 2*mm),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2*mm),
-    ]))
+    header_box.setStyle(styles['header_box'])
     story.append(header_box)
     
     # Title
-    title_table = Table([[Paragraph(f"<b>{title_text}</b>", 
-                        ParagraphStyle('Title', fontSize=10, fontName='Helvetica-Bold', alignment=TA_CENTER))]], 
+    title_table = Table([[Paragraph(f"<b>{title_text}</b>", styles['title'])]], 
                         colWidths=[content_width*mm])
-    title_table.setStyle(TableStyle([
-        ('BOX', (0, 0), (-1, -1), 1, colors.black),
-        ('TOPPADDING', (0, 0), (-1, -1), 2*mm),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2*mm),
-    ]))
+    title_table.setStyle(styles['title_box'])
     story.append(title_table)
     
     # Metadata
-    meta_style = ParagraphStyle('Meta', fontSize=7.5, leading=10)
     meta_content = f"""<b>Quote number:</b> {metadata.get('quote_number', '')}<br/>
 <b>Project name:</b> {metadata.get('project_name', '')}<br/>
 <b>End-user name / location:</b> {metadata.get('end_user_name', '')}<br/>
@@ -179,61 +102,45 @@ www.ringspann-india.com"""
 <b>Prepared by:</b> {metadata.get('prepared_by', 'Ringspann')}<br/>
 <b>Date:</b> {metadata.get('date', datetime.now().strftime('%Y-%m-%d'))}"""
     
-    meta_table = Table([[Paragraph(meta_content, meta_style)]], colWidths=[content_width*mm])
-    meta_table.setStyle(TableStyle([
-        ('BOX', (0, 0), (-1, -1), 1, colors.black),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2*mm),
-        ('TOPPADDING', (0, 0), (-1, -1), 2*mm),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2*mm),
-    ]))
+    meta_table = Table([[Paragraph(meta_content, styles['meta'])]], colWidths=[content_width*mm])
+    meta_table.setStyle(styles['meta_box'])
     story.append(meta_table)
 
 
 def add_footer_sections(story, part_type):
     """Add common footer sections"""
-    footer_style = ParagraphStyle('Footer', fontSize=6.5, leading=8)
+    add_footer_sections_wide(story, part_type, content_width=277)
+
+
+def add_footer_sections_wide(story, part_type, content_width=287):
+    """Add footer sections for wider tables (e.g., Locking Element)"""
+    styles = technical_styles()
+    footer_style = styles['footer']
+    col_widths = [25*mm, (content_width - 25)*mm]  # First column is 25mm
     
     # General points
     general_table = Table([
         [Paragraph('<b>General points</b>', footer_style), Paragraph('<b>Description</b>', footer_style)],
         [Paragraph('1', footer_style), 
          Paragraph('Technical selection are based on information provided in above survey sheet, if any change in value customer to provide same to check selection', footer_style)]
-    ], colWidths=[25*mm, 252*mm])
-    general_table.setStyle(TableStyle([
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 1.5),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 1.5),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-    ]))
+    ], colWidths=col_widths)
+    general_table.setStyle(styles['footer_table'])
     story.append(general_table)
     
     # Technical points
     tech_points_table = Table([
         [Paragraph('<b>Technical points</b>', footer_style), Paragraph('<b>Description</b>', footer_style)],
         *[[Paragraph(str(i), footer_style), Paragraph('', footer_style)] for i in range(1, 5)]
-    ], colWidths=[25*mm, 252*mm])
-    tech_points_table.setStyle(TableStyle([
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 1.5),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 1.5),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-    ]))
+    ], colWidths=col_widths)
+    tech_points_table.setStyle(styles['footer_table'])
     story.append(tech_points_table)
     
     # Revision Status
     revision_table = Table([
         [Paragraph('<b>Revision Status</b>', footer_style), Paragraph('<b>Description</b>', footer_style)],
         [Paragraph('<b>R0</b><br/>Date', footer_style), Paragraph('Initial offer.', footer_style)]
-    ], colWidths=[25*mm, 252*mm])
-    revision_table.setStyle(TableStyle([
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 1.5),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 1.5),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-    ]))
+    ], colWidths=col_widths)
+    revision_table.setStyle(styles['footer_table'])
     story.append(revision_table)
     
     # Issue footer
@@ -241,57 +148,35 @@ def add_footer_sections(story, part_type):
     story.append(Paragraph(f'<font size=6>{issue_text}</font>', footer_style))
 
 
-def add_footer_sections_wide(story, part_type, content_width=287):
-    """Add footer sections for wider tables (e.g., Locking Element)"""
-    footer_style = ParagraphStyle('Footer', fontSize=6.5, leading=8)
-    desc_width = (content_width - 25)  # First column is 25mm
-    
-    # General points
-    general_table = Table([
-        [Paragraph('<b>General points</b>', footer_style), Paragraph('<b>Description</b>', footer_style)],
-        [Paragraph('1', footer_style), 
-         Paragraph('Technical selection are based on information provided in above survey sheet, if any change in value customer to provide same to check selection', footer_style)]
-    ], colWidths=[25*mm, desc_width*mm])
-    general_table.setStyle(TableStyle([
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 1.5),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 1.5),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-    ]))
-    story.append(general_table)
-    
-    # Technical points
-    tech_points_table = Table([
-        [Paragraph('<b>Technical points</b>', footer_style), Paragraph('<b>Description</b>', footer_style)],
-        *[[Paragraph(str(i), footer_style), Paragraph('', footer_style)] for i in range(1, 5)]
-    ], colWidths=[25*mm, desc_width*mm])
-    tech_points_table.setStyle(TableStyle([
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 1.5),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 1.5),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-    ]))
-    story.append(tech_points_table)
+def _brake_table_spec():
+    """Column widths and style of the brake requirements table"""
+    # Column widths for brake template
+    col_widths = [
+        7*mm, 13*mm, 16*mm, 9*mm, 9*mm, 10*mm, 10*mm, 9*mm, 10*mm, 9*mm,
+        9*mm, 8*mm, 8*mm, 8*mm, 12*mm, 9*mm, 8*mm, 11*mm, 9*mm, 9*mm,
+        11*mm, 11*mm, 16*mm, 10*mm, 9*mm, 13*mm, 14*mm
+    ]
     
-    # Revision Status
-    revision_table = Table([
-        [Paragraph('<b>Revision Status</b>', footer_style), Paragraph('<b>Description</b>', footer_style)],
-        [Paragraph('<b>R0</b><br/>Date', footer_style), Paragraph('Initial offer.', footer_style)]
-    ], colWidths=[25*mm, desc_width*mm])
-    revision_table.setStyle(TableStyle([
+    table_style = TableStyle([
         ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 1.5),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 1.5),
+        ('SPAN', (0, 0), (0, 1)), ('SPAN', (1, 0), (1, 1)), ('SPAN', (2, 0), (2, 1)),
+        ('SPAN', (3, 0), (3, 1)), ('SPAN', (4, 0), (4, 1)), ('SPAN', (5, 0), (6, 0)),
+        ('SPAN', (7, 0), (9, 0)), ('SPAN', (10, 0), (10, 1)), ('SPAN', (11, 0), (13, 0)),
+        ('SPAN', (14, 0), (14, 1)), ('SPAN', (15, 0), (15, 1)), ('SPAN', (16, 0), (16, 1)),
+        ('SPAN', (17, 0), (17, 1)), ('SPAN', (18, 0), (18, 1)), ('SPAN', (19, 0), (19, 1)),
+        ('SPAN', (20, 0), (20, 1)), ('SPAN', (21, 0), (21, 1)), ('SPAN', (22, 0), (22, 1)),
+        ('SPAN', (23, 0), (23, 1)), ('SPAN', (24, 0), (24, 1)), ('SPAN', (25, 0), (25, 1)),
+        ('SPAN', (26, 0), (26, 1)),
+        ('FONTSIZE', (0, 0), (-1, -1), 5.5),
+        ('FONTNAME', (0, 0), (-1, 1), 'Helvetica-Bold'),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 2),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
         ('LEFTPADDING', (0, 0), (-1, -1), 2),
-    ]))
-    story.append(revision_table)
-    
-    # Issue footer
-    issue_text = f'Issue date: {datetime.now().strftime("%d/%b/%y")} Version: 0, Created by: SRK, Checked by: CVS, Doc. No. U 01.458, Description: {part_type} quote template'
-    story.append(Paragraph(f'<font size=6>{issue_text}</font>', footer_style))
+        ('RIGHTPADDING', (0, 0), (-1, -1), 2),
+    ])
+    return col_widths, table_style
 
 
 def generate_brake_technical_pdf(quotation_number, metadata, requirements, technical_quotes, filepath):
@@ -312,8 +197,7 @@ def generate_brake_technical_pdf(quotation_number, metadata, requirements, techn
     add_header_and_metadata(story, "BRAKE TECHNICAL QUOTATION", metadata)
     
     # ==================== BRAKE-SPECIFIC TABLE ====================
-    cell_style = ParagraphStyle('CellStyle', fontSize=5.5, alignment=TA_CENTER, leading=6)
-    header_style = ParagraphStyle('HeaderStyle', fontSize=5.5, alignment=TA_CENTER, leading=6, fontName='Helvetica-Bold')
+    cell_style, header_style = cell_styles(5.5, 6)
     
     # BRAKE-SPECIFIC COLUMN HEADERS
     header_row = [
@@ -414,38 +298,72 @@ def generate_brake_technical_pdf(quotation_number, metadata, requirements, techn
     total_row = [''] * 16 + [Paragraph('<b>Total</b>', header_style), Paragraph('<b>0</b>', cell_style)] + [''] * 9
     table_data.append(total_row)
     
-    # Column widths for brake template
+    
+    col_widths, table_style = part_table_spec('brake')
+    main_table = Table(table_data, colWidths=col_widths, repeatRows=2)
+    main_table.setStyle(table_style)
+    
+    story.append(KeepTogether(main_table))
+    add_footer_sections(story, 'Brake')
+    doc.build(story, canvasmaker=NumberedCanvas)
+    print(f"✓ Brake PDF generated: {filepath}\n")
+
+
+def _backstop_table_spec():
+    """Column widths and style of the backstop requirements table"""
+    # Column widths for backstop template (16 columns total = 277mm)
     col_widths = [
-        7*mm, 13*mm, 16*mm, 9*mm, 9*mm, 10*mm, 10*mm, 9*mm, 10*mm, 9*mm,
-        9*mm, 8*mm, 8*mm, 8*mm, 12*mm, 9*mm, 8*mm, 11*mm, 9*mm, 9*mm,
-        11*mm, 11*mm, 16*mm, 10*mm, 9*mm, 13*mm, 14*mm
+        10*mm,   # SL No
+        18*mm,   # Tag number
+        25*mm,   # Application
+        18*mm,   # Shaft diameter
+        16*mm,   # Torque Min
+        16*mm,   # Torque Max
+        16*mm,   # Speed Min
+        16*mm,   # Speed Rated
+        16*mm,   # Speed Max
+        18*mm,   # Operating hours
+        16*mm,   # Service factor
+        12*mm,   # Qty
+        22*mm,   # Product code
+        18*mm,   # Size
+        18*mm,   # Type
+        22*mm,   # Technical points
     ]
     
-    main_table = Table(table_data, colWidths=col_widths, repeatRows=2)
-    main_table.setStyle(TableStyle([
+    table_style = TableStyle([
         ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-        ('SPAN', (0, 0), (0, 1)), ('SPAN', (1, 0), (1, 1)), ('SPAN', (2, 0), (2, 1)),
-        ('SPAN', (3, 0), (3, 1)), ('SPAN', (4, 0), (4, 1)), ('SPAN', (5, 0), (6, 0)),
-        ('SPAN', (7, 0), (9, 0)), ('SPAN', (10, 0), (10, 1)), ('SPAN', (11, 0), (13, 0)),
-        ('SPAN', (14, 0), (14, 1)), ('SPAN', (15, 0), (15, 1)), ('SPAN', (16, 0), (16, 1)),
-        ('SPAN', (17, 0), (17, 1)), ('SPAN', (18, 0), (18, 1)), ('SPAN', (19, 0), (19, 1)),
-        ('SPAN', (20, 0), (20, 1)), ('SPAN', (21, 0), (21, 1)), ('SPAN', (22, 0), (22, 1)),
-        ('SPAN', (23, 0), (23, 1)), ('SPAN', (24, 0), (24, 1)), ('SPAN', (25, 0), (25, 1)),
-        ('SPAN', (26, 0), (26, 1)),
+        
+        # SECTION HEADER SPANS (Row 0)
+        ('SPAN', (0, 0), (0, 2)),   # SL No spans all 3 header rows
+        ('SPAN', (1, 0), (10, 0)),  # "Customer Datasheet" spans columns 1-10
+        ('SPAN', (11, 0), (15, 0)), # "RINGSPANN Product" spans columns 11-15
+        
+        # COLUMN HEADER SPANS (Rows 1-2)
+        ('SPAN', (1, 1), (1, 2)),   # Tag number
+        ('SPAN', (2, 1), (2, 2)),   # Application
+        ('SPAN', (3, 1), (3, 2)),   # Shaft diameter
+        ('SPAN', (4, 1), (5, 1)),   # Torque (Min, Max)
+        ('SPAN', (6, 1), (8, 1)),   # Speed (Min, Rated, Max)
+        ('SPAN', (9, 1), (9, 2)),   # Operating hours
+        ('SPAN', (10, 1), (10, 2)), # Service factor
+        ('SPAN', (11, 1), (11, 2)), # Qty
+        ('SPAN', (12, 1), (12, 2)), # Product code
+        ('SPAN', (13, 1), (13, 2)), # Size
+        ('SPAN', (14, 1), (14, 2)), # Type
+        ('SPAN', (15, 1), (15, 2)), # Technical points
+        
+        # Font and styling
         ('FONTSIZE', (0, 0), (-1, -1), 5.5),
-        ('FONTNAME', (0, 0), (-1, 1), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 0), (-1, 2), 'Helvetica-Bold'),
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
         ('TOPPADDING', (0, 0), (-1, -1), 2),
         ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
         ('LEFTPADDING', (0, 0), (-1, -1), 2),
         ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-    ]))
-    
-    story.append(KeepTogether(main_table))
-    add_footer_sections(story, 'Brake')
-    doc.build(story, canvasmaker=NumberedCanvas)
-    print(f"✓ Brake PDF generated: {filepath}\n")
+    ])
+    return col_widths, table_style
 
 
 def generate_backstop_technical_pdf(quotation_number, metadata, requirements, technical_quotes, filepath):
@@ -464,8 +382,7 @@ def generate_backstop_technical_pdf(quotation_number, metadata, requirements, te
     add_header_and_metadata(story, "BACKSTOP TECHNICAL QUOTATION", metadata)
     
     # ==================== BACKSTOP-SPECIFIC TABLE ====================
-    cell_style = ParagraphStyle('CellStyle', fontSize=5.5, alignment=TA_CENTER, leading=6)
-    header_style = ParagraphStyle('HeaderStyle', fontSize=5.5, alignment=TA_CENTER, leading=6, fontName='Helvetica-Bold')
+    cell_style, header_style = cell_styles(5.5, 6)
     
     # BACKSTOP EXACT COLUMNS FROM TEMPLATE
     # Row 1: Main section headers with proper spanning
@@ -558,64 +475,79 @@ def generate_backstop_technical_pdf(quotation_number, metadata, requirements, te
     total_row = [''] * 11 + [Paragraph('<b>Total</b>', header_style), Paragraph('<b>0</b>', cell_style)] + [''] * 3
     table_data.append(total_row)
     
-    # Column widths for backstop template (16 columns total = 277mm)
+    
+    col_widths, table_style = part_table_spec('backstop')
+    main_table = Table(table_data, colWidths=col_widths, repeatRows=3)
+    main_table.setStyle(table_style)
+    
+    story.append(KeepTogether(main_table))
+    add_footer_sections(story, 'Backstop')
+    doc.build(story, canvasmaker=NumberedCanvas)
+    print(f"✓ Backstop PDF generated: {filepath}\n")
+
+
+def _clutch_table_spec():
+    """Column widths and style of the over running clutch requirements table"""
+    # Column widths for clutch template (23 columns total = 277mm)
     col_widths = [
-        10*mm,   # SL No
-        18*mm,   # Tag number
-        25*mm,   # Application
-        18*mm,   # Shaft diameter
-        16*mm,   # Torque Min
-        16*mm,   # Torque Max
-        16*mm,   # Speed Min
-        16*mm,   # Speed Rated
-        16*mm,   # Speed Max
-        18*mm,   # Operating hours
-        16*mm,   # Service factor
-        12*mm,   # Qty
-        22*mm,   # Product code
-        18*mm,   # Size
-        18*mm,   # Type
-        22*mm,   # Technical points
+        8*mm,    # SL No
+        13*mm,   # Tag number
+        17*mm,   # Application
+        11*mm,   # Main Drive Drive
+        11*mm,   # Main Drive Driven
+        11*mm,   # Aux Drive Drive
+        11*mm,   # Aux Drive Driven
+        11*mm,   # Torque Main Min
+        11*mm,   # Torque Main Max
+        11*mm,   # Torque Aux Min
+        11*mm,   # Torque Aux Max
+        11*mm,   # Speed Main Min
+        11*mm,   # Speed Main Rated
+        11*mm,   # Speed Main Max
+        11*mm,   # Speed Aux Min
+        11*mm,   # Speed Aux Rated
+        11*mm,   # Speed Aux Max
+        14*mm,   # Operating hours
+        12*mm,   # Direction Main
+        12*mm,   # Direction Aux
+        17*mm,   # Product code
+        12*mm,   # Size
+        18*mm,   # Technical points
     ]
     
-    main_table = Table(table_data, colWidths=col_widths, repeatRows=3)
-    main_table.setStyle(TableStyle([
+    table_style = TableStyle([
         ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
         
-        # SECTION HEADER SPANS (Row 0)
-        ('SPAN', (0, 0), (0, 2)),   # SL No spans all 3 header rows
-        ('SPAN', (1, 0), (10, 0)),  # "Customer Datasheet" spans columns 1-10
-        ('SPAN', (11, 0), (15, 0)), # "RINGSPANN Product" spans columns 11-15
+        # ROW 0: Main section headers
+        ('SPAN', (0, 0), (0, 2)),    # SL No - INDIVIDUAL span
+        ('SPAN', (1, 0), (1, 2)),    # Tag number - INDIVIDUAL span
+        ('SPAN', (2, 0), (2, 2)),    # Application - INDIVIDUAL span
+        ('SPAN', (3, 0), (16, 0)),   # "Customer Datasheet" spans columns 3-16 in row 0
+        ('SPAN', (17, 0), (17, 2)),  # Operating hours - INDIVIDUAL span
+        ('SPAN', (18, 0), (19, 0)),  # "Direction of rotation" spans columns 18-19 in row 0
+        ('SPAN', (20, 0), (22, 0)),  # "RINGSPANN Product" spans columns 20-22 in row 0
         
-        # COLUMN HEADER SPANS (Rows 1-2)
-        ('SPAN', (1, 1), (1, 2)),   # Tag number
-        ('SPAN', (2, 1), (2, 2)),   # Application
-        ('SPAN', (3, 1), (3, 2)),   # Shaft diameter
-        ('SPAN', (4, 1), (5, 1)),   # Torque (Min, Max)
-        ('SPAN', (6, 1), (8, 1)),   # Speed (Min, Rated, Max)
-        ('SPAN', (9, 1), (9, 2)),   # Operating hours
-        ('SPAN', (10, 1), (10, 2)), # Service factor
-        ('SPAN', (11, 1), (11, 2)), # Qty
-        ('SPAN', (12, 1), (12, 2)), # Product code
-        ('SPAN', (13, 1), (13, 2)), # Size
-        ('SPAN', (14, 1), (14, 2)), # Type
-        ('SPAN', (15, 1), (15, 2)), # Technical points
+        # ROW 1: Sub-section headers
+        ('SPAN', (3, 1), (6, 1)),    # Shaft diameter spans 4 columns
+        ('SPAN', (7, 1), (10, 1)),   # Torque spans 4 columns
+        ('SPAN', (11, 1), (16, 1)),  # Speed spans 6 columns
+        ('SPAN', (18, 1), (18, 2)),  # Main drive - INDIVIDUAL span to row 2
+        ('SPAN', (19, 1), (19, 2)),  # Auxiliary drive - INDIVIDUAL span to row 2
+        ('SPAN', (20, 1), (20, 2)),  # Product code - INDIVIDUAL span to row 2
+        ('SPAN', (21, 1), (21, 2)),  # Size - INDIVIDUAL span to row 2
+        ('SPAN', (22, 1), (22, 2)),  # Technical points - INDIVIDUAL span to row 2
         
         # Font and styling
-        ('FONTSIZE', (0, 0), (-1, -1), 5.5),
+        ('FONTSIZE', (0, 0), (-1, -1), 5),
         ('FONTNAME', (0, 0), (-1, 2), 'Helvetica-Bold'),
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
         ('TOPPADDING', (0, 0), (-1, -1), 2),
         ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-    ]))
-    
-    story.append(KeepTogether(main_table))
-    add_footer_sections(story, 'Backstop')
-    doc.build(story, canvasmaker=NumberedCanvas)
-    print(f"✓ Backstop PDF generated: {filepath}\n")
+        ('LEFTPADDING', (0, 0), (-1, -1), 1.5),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 1.5),
+    ])
+    return col_widths, table_style
 
 
 def generate_clutch_technical_pdf(quotation_number, metadata, requirements, technical_quotes, filepath):
@@ -634,8 +566,7 @@ def generate_clutch_technical_pdf(quotation_number, metadata, requirements, tech
     add_header_and_metadata(story, "OVER RUNNING CLUTCH TECHNICAL QUOTATION", metadata)
     
     # ==================== CLUTCH-SPECIFIC TABLE ====================
-    cell_style = ParagraphStyle('CellStyle', fontSize=5, alignment=TA_CENTER, leading=5.5)
-    header_style = ParagraphStyle('HeaderStyle', fontSize=5, alignment=TA_CENTER, leading=5.5, fontName='Helvetica-Bold')
+    cell_style, header_style = cell_styles(5, 5.5)
     
     # CLUTCH - CORRECTED 3-ROW HEADER
     
@@ -749,72 +680,71 @@ def generate_clutch_technical_pdf(quotation_number, metadata, requirements, tech
         empty_row = [Paragraph(str(len(table_data) - 2), cell_style)] + [Paragraph('-', cell_style) for _ in range(22)]
         table_data.append(empty_row)
     
-    # Column widths for clutch template (23 columns total = 277mm)
-    col_widths = [
-        8*mm,    # SL No
-        13*mm,   # Tag number
-        17*mm,   # Application
-        11*mm,   # Main Drive Drive
-        11*mm,   # Main Drive Driven
-        11*mm,   # Aux Drive Drive
-        11*mm,   # Aux Drive Driven
-        11*mm,   # Torque Main Min
-        11*mm,   # Torque Main Max
-        11*mm,   # Torque Aux Min
-        11*mm,   # Torque Aux Max
-        11*mm,   # Speed Main Min
-        11*mm,   # Speed Main Rated
-        11*mm,   # Speed Main Max
-        11*mm,   # Speed Aux Min
-        11*mm,   # Speed Aux Rated
-        11*mm,   # Speed Aux Max
-        14*mm,   # Operating hours
-        12*mm,   # Direction Main
-        12*mm,   # Direction Aux
-        17*mm,   # Product code
-        12*mm,   # Size
-        18*mm,   # Technical points
-    ]
     
+    col_widths, table_style = part_table_spec('clutch')
     main_table = Table(table_data, colWidths=col_widths, repeatRows=3)
-    main_table.setStyle(TableStyle([
+    main_table.setStyle(table_style)
+    
+    story.append(KeepTogether(main_table))
+    add_footer_sections(story, 'Over Running Clutch')
+    doc.build(story, canvasmaker=NumberedCanvas)
+    print(f"✓ Over Running Clutch PDF generated: {filepath}\n")
+
+
+
+def _coupling_table_spec():
+    """Column widths and style of the coupling and torque limiter requirements table"""
+    # Column widths for coupling template (15 columns total = 277mm)
+    col_widths = [
+        10*mm,   # SL No
+        19*mm,   # Tag number
+        26*mm,   # Application
+        16*mm,   # Motor KW
+        16*mm,   # Number of drive
+        18*mm,   # Torque Min
+        18*mm,   # Torque Max
+        18*mm,   # Speed Min
+        18*mm,   # Speed Rated
+        18*mm,   # Speed Max
+        18*mm,   # Service factor
+        12*mm,   # Qty
+        22*mm,   # Model
+        24*mm,   # Special requirement
+        24*mm,   # Technical points
+    ]
+    
+    table_style = TableStyle([
         ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
         
         # ROW 0: Main section headers
-        ('SPAN', (0, 0), (0, 2)),    # SL No - INDIVIDUAL span
-        ('SPAN', (1, 0), (1, 2)),    # Tag number - INDIVIDUAL span
-        ('SPAN', (2, 0), (2, 2)),    # Application - INDIVIDUAL span
-        ('SPAN', (3, 0), (16, 0)),   # "Customer Datasheet" spans columns 3-16 in row 0
-        ('SPAN', (17, 0), (17, 2)),  # Operating hours - INDIVIDUAL span
-        ('SPAN', (18, 0), (19, 0)),  # "Direction of rotation" spans columns 18-19 in row 0
-        ('SPAN', (20, 0), (22, 0)),  # "RINGSPANN Product" spans columns 20-22 in row 0
+        ('SPAN', (0, 0), (0, 2)),    # SL No spans all 3 header rows
+        ('SPAN', (1, 0), (10, 0)),   # "Customer Datasheet" spans columns 1-10
+        ('SPAN', (11, 0), (14, 0)),  # "RINGSPANN Product" spans columns 11-14
         
-        # ROW 1: Sub-section headers
-        ('SPAN', (3, 1), (6, 1)),    # Shaft diameter spans 4 columns
-        ('SPAN', (7, 1), (10, 1)),   # Torque spans 4 columns
-        ('SPAN', (11, 1), (16, 1)),  # Speed spans 6 columns
-        ('SPAN', (18, 1), (18, 2)),  # Main drive - INDIVIDUAL span to row 2
-        ('SPAN', (19, 1), (19, 2)),  # Auxiliary drive - INDIVIDUAL span to row 2
-        ('SPAN', (20, 1), (20, 2)),  # Product code - INDIVIDUAL span to row 2
-        ('SPAN', (21, 1), (21, 2)),  # Size - INDIVIDUAL span to row 2
-        ('SPAN', (22, 1), (22, 2)),  # Technical points - INDIVIDUAL span to row 2
+        # ROW 1-2: Column headers
+        ('SPAN', (1, 1), (1, 2)),    # Tag number
+        ('SPAN', (2, 1), (2, 2)),    # Application
+        ('SPAN', (3, 1), (3, 2)),    # Motor KW
+        ('SPAN', (4, 1), (4, 2)),    # Number of drive
+        ('SPAN', (5, 1), (6, 1)),    # Torque (Min, Max)
+        ('SPAN', (7, 1), (9, 1)),    # Speed at coupling (Min, Rated, Max)
+        ('SPAN', (10, 1), (10, 2)),  # Service factor
+        ('SPAN', (11, 1), (11, 2)),  # Qty
+        ('SPAN', (12, 1), (12, 2)),  # Model
+        ('SPAN', (13, 1), (13, 2)),  # Special requirement
+        ('SPAN', (14, 1), (14, 2)),  # Technical points
         
         # Font and styling
-        ('FONTSIZE', (0, 0), (-1, -1), 5),
+        ('FONTSIZE', (0, 0), (-1, -1), 5.5),
         ('FONTNAME', (0, 0), (-1, 2), 'Helvetica-Bold'),
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
         ('TOPPADDING', (0, 0), (-1, -1), 2),
         ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-        ('LEFTPADDING', (0, 0), (-1, -1), 1.5),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 1.5),
-    ]))
-    
-    story.append(KeepTogether(main_table))
-    add_footer_sections(story, 'Over Running Clutch')
-    doc.build(story, canvasmaker=NumberedCanvas)
-    print(f"✓ Over Running Clutch PDF generated: {filepath}\n")
-
+        ('LEFTPADDING', (0, 0), (-1, -1), 2),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 2),
+    ])
+    return col_widths, table_style
 
 
 def generate_coupling_technical_pdf(quotation_number, metadata, requirements, technical_quotes, filepath):
@@ -833,8 +763,7 @@ def generate_coupling_technical_pdf(quotation_number, metadata, requirements, te
     add_header_and_metadata(story, "COUPLING AND TORQUE LIMITER TECHNICAL QUOTATION", metadata)
     
     # ==================== COUPLING-SPECIFIC TABLE ====================
-    cell_style = ParagraphStyle('CellStyle', fontSize=5.5, alignment=TA_CENTER, leading=6)
-    header_style = ParagraphStyle('HeaderStyle', fontSize=5.5, alignment=TA_CENTER, leading=6, fontName='Helvetica-Bold')
+    cell_style, header_style = cell_styles(5.5, 6)
     
     # COUPLING EXACT COLUMNS FROM TEMPLATE
     # Two-row header structure with section headers
@@ -925,62 +854,101 @@ def generate_coupling_technical_pdf(quotation_number, metadata, requirements, te
         empty_row = [Paragraph(str(len(table_data) - 2), cell_style)] + [Paragraph('-', cell_style) for _ in range(14)]
         table_data.append(empty_row)
     
-    # Column widths for coupling template (15 columns total = 277mm)
+    
+    col_widths, table_style = part_table_spec('coupling')
+    main_table = Table(table_data, colWidths=col_widths, repeatRows=3)
+    main_table.setStyle(table_style)
+    
+    story.append(KeepTogether(main_table))
+    add_footer_sections(story, 'Coupling and Torque Limiter')
+    doc.build(story, canvasmaker=NumberedCanvas)
+    print(f"✓ Coupling and Torque Limiter PDF generated: {filepath}\n")
+
+def _locking_element_table_spec():
+    """Column widths and style of the locking element for conveyor requirements table"""
+    # Column widths for locking element template (31 columns total = 287mm for 5mm margins)
     col_widths = [
-        10*mm,   # SL No
-        19*mm,   # Tag number
-        26*mm,   # Application
-        16*mm,   # Motor KW
-        16*mm,   # Number of drive
-        18*mm,   # Torque Min
-        18*mm,   # Torque Max
-        18*mm,   # Speed Min
-        18*mm,   # Speed Rated
-        18*mm,   # Speed Max
-        18*mm,   # Service factor
-        12*mm,   # Qty
-        22*mm,   # Model
-        24*mm,   # Special requirement
-        24*mm,   # Technical points
+        7*mm,    # SL No
+        9*mm,    # Pulley type
+        10*mm,   # Tag number
+        12*mm,   # Application
+        8*mm,    # Pulley Qty
+        10*mm,   # Hub material
+        9*mm,    # Shaft diameter
+        9*mm,    # Outer diameter pulley
+        9*mm,    # Running T1
+        9*mm,    # Running T2
+        9*mm,    # Starting T1
+        9*mm,    # Starting T2
+        9*mm,    # Arm length
+        9*mm,    # Wrap angle
+        9*mm,    # Factor running
+        9*mm,    # Factor starting
+        9*mm,    # Running Torque
+        9*mm,    # Running Bending
+        9*mm,    # Starting Torque
+        9*mm,    # Starting Bending
+        9*mm,    # Locking element Qty
+        12*mm,   # Product code
+        9*mm,    # Size
+        9*mm,    # Hub inner
+        9*mm,    # Hub outer
+        9*mm,    # Hub length
+        9*mm,    # Torque Macl
+        9*mm,    # Bending Mb
+        9*mm,    # Screw torque
+        9*mm,    # Shaft pressure
+        12*mm,   # Technical points
     ]
     
-    main_table = Table(table_data, colWidths=col_widths, repeatRows=3)
-    main_table.setStyle(TableStyle([
+    table_style = TableStyle([
         ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
         
         # ROW 0: Main section headers
-        ('SPAN', (0, 0), (0, 2)),    # SL No spans all 3 header rows
-        ('SPAN', (1, 0), (10, 0)),   # "Customer Datasheet" spans columns 1-10
-        ('SPAN', (11, 0), (14, 0)),  # "RINGSPANN Product" spans columns 11-14
+        ('SPAN', (0, 0), (0, 2)),    # SL No
+        ('SPAN', (1, 0), (1, 2)),    # Pulley type
+        ('SPAN', (2, 0), (2, 2)),    # Tag number
+        ('SPAN', (3, 0), (3, 2)),    # Application
+        ('SPAN', (4, 0), (4, 2)),    # Pulley Qty
+        ('SPAN', (5, 0), (19, 0)),   # "Customer Datasheet" spans columns 5-19
+        ('SPAN', (20, 0), (30, 0)),  # "RINGSPANN Product" spans columns 20-30
         
-        # ROW 1-2: Column headers
-        ('SPAN', (1, 1), (1, 2)),    # Tag number
-        ('SPAN', (2, 1), (2, 2)),    # Application
-        ('SPAN', (3, 1), (3, 2)),    # Motor KW
-        ('SPAN', (4, 1), (4, 2)),    # Number of drive
-        ('SPAN', (5, 1), (6, 1)),    # Torque (Min, Max)
-        ('SPAN', (7, 1), (9, 1)),    # Speed at coupling (Min, Rated, Max)
-        ('SPAN', (10, 1), (10, 2)),  # Service factor
-        ('SPAN', (11, 1), (11, 2)),  # Qty
-        ('SPAN', (12, 1), (12, 2)),  # Model
-        ('SPAN', (13, 1), (13, 2)),  # Special requirement
-        ('SPAN', (14, 1), (14, 2)),  # Technical points
+        # ROW 1: Sub-section headers
+        ('SPAN', (5, 1), (5, 2)),    # Hub material
+        ('SPAN', (6, 1), (6, 2)),    # Shaft diameter
+        ('SPAN', (7, 1), (7, 2)),    # Outer diameter pulley
+        ('SPAN', (8, 1), (9, 1)),    # Running condition spans 2
+        ('SPAN', (10, 1), (11, 1)),  # Starting condition spans 2
+        ('SPAN', (12, 1), (12, 2)),  # Arm length
+        ('SPAN', (13, 1), (13, 2)),  # Wrap angle
+        ('SPAN', (14, 1), (14, 2)),  # start-up factor Running
+        ('SPAN', (15, 1), (15, 2)),  # start-up factor starting
+        ('SPAN', (16, 1), (17, 1)),  # Running condition (torque) spans 2
+        ('SPAN', (18, 1), (19, 1)),  # Starting condition (torque) spans 2
+        ('SPAN', (20, 1), (20, 2)),  # Locking element Qty
+        ('SPAN', (21, 1), (21, 2)),  # Product code
+        ('SPAN', (22, 1), (22, 2)),  # Size
+        ('SPAN', (23, 1), (23, 2)),  # Hub inner diameter
+        ('SPAN', (24, 1), (24, 2)),  # Hub outer diameter
+        ('SPAN', (25, 1), (25, 2)),  # Hub length
+        ('SPAN', (26, 1), (26, 2)),  # Torque
+        ('SPAN', (27, 1), (27, 2)),  # Bending moment
+        ('SPAN', (28, 1), (28, 2)),  # Screw Tightening torque
+        ('SPAN', (29, 1), (29, 2)),  # Shaft pressure
+        ('SPAN', (30, 1), (30, 2)),  # Technical points
         
         # Font and styling
-        ('FONTSIZE', (0, 0), (-1, -1), 5.5),
+        ('FONTSIZE', (0, 0), (-1, -1), 4),
         ('FONTNAME', (0, 0), (-1, 2), 'Helvetica-Bold'),
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 2),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-        ('LEFTPADDING', (0, 0), (-1, -1), 2),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-    ]))
-    
-    story.append(KeepTogether(main_table))
-    add_footer_sections(story, 'Coupling and Torque Limiter')
-    doc.build(story, canvasmaker=NumberedCanvas)
-    print(f"✓ Coupling and Torque Limiter PDF generated: {filepath}\n")
+        ('TOPPADDING', (0, 0), (-1, -1), 1),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
+        ('LEFTPADDING', (0, 0), (-1, -1), 0.5),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 0.5),
+    ])
+    return col_widths, table_style
+
 
 def generate_locking_element_technical_pdf(quotation_number, metadata, requirements, technical_quotes, filepath):
     """Generate Locking Element for Conveyor Technical Quotation PDF - CORRECTED STRUCTURE"""
@@ -999,8 +967,7 @@ def generate_locking_element_technical_pdf(quotation_number, metadata, requireme
     add_header_and_metadata_wide(story, "LOCKING ELEMENT FOR CONVEYOR TECHNICAL QUOTATION", metadata, content_width=287)
     
     # ==================== LOCKING ELEMENT-SPECIFIC TABLE ====================
-    cell_style = ParagraphStyle('CellStyle', fontSize=4, alignment=TA_CENTER, leading=4.5)
-    header_style = ParagraphStyle('HeaderStyle', fontSize=4, alignment=TA_CENTER, leading=4.5, fontName='Helvetica-Bold')
+    cell_style, header_style = cell_styles(4, 4.5)
     
     # LOCKING ELEMENT - CORRECTED STRUCTURE (31 columns)
     
@@ -1151,88 +1118,10 @@ def generate_locking_element_technical_pdf(quotation_number, metadata, requireme
         empty_row = [Paragraph(str(len(table_data) - 2), cell_style)] + [Paragraph('-', cell_style) for _ in range(30)]
         table_data.append(empty_row)
     
-    # Column widths for locking element template (31 columns total = 287mm for 5mm margins)
-    col_widths = [
-        7*mm,    # SL No
-        9*mm,    # Pulley type
-        10*mm,   # Tag number
-        12*mm,   # Application
-        8*mm,    # Pulley Qty
-        10*mm,   # Hub material
-        9*mm,    # Shaft diameter
-        9*mm,    # Outer diameter pulley
-        9*mm,    # Running T1
-        9*mm,    # Running T2
-        9*mm,    # Starting T1
-        9*mm,    # Starting T2
-        9*mm,    # Arm length
-        9*mm,    # Wrap angle
-        9*mm,    # Factor running
-        9*mm,    # Factor starting
-        9*mm,    # Running Torque
-        9*mm,    # Running Bending
-        9*mm,    # Starting Torque
-        9*mm,    # Starting Bending
-        9*mm,    # Locking element Qty
-        12*mm,   # Product code
-        9*mm,    # Size
-        9*mm,    # Hub inner
-        9*mm,    # Hub outer
-        9*mm,    # Hub length
-        9*mm,    # Torque Macl
-        9*mm,    # Bending Mb
-        9*mm,    # Screw torque
-        9*mm,    # Shaft pressure
-        12*mm,   # Technical points
-    ]
     
+    col_widths, table_style = part_table_spec('locking_element')
     main_table = Table(table_data, colWidths=col_widths, repeatRows=3)
-    main_table.setStyle(TableStyle([
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-        
-        # ROW 0: Main section headers
-        ('SPAN', (0, 0), (0, 2)),    # SL No
-        ('SPAN', (1, 0), (1, 2)),    # Pulley type
-        ('SPAN', (2, 0), (2, 2)),    # Tag number
-        ('SPAN', (3, 0), (3, 2)),    # Application
-        ('SPAN', (4, 0), (4, 2)),    # Pulley Qty
-        ('SPAN', (5, 0), (19, 0)),   # "Customer Datasheet" spans columns 5-19
-        ('SPAN', (20, 0), (30, 0)),  # "RINGSPANN Product" spans columns 20-30
-        
-        # ROW 1: Sub-section headers
-        ('SPAN', (5, 1), (5, 2)),    # Hub material
-        ('SPAN', (6, 1), (6, 2)),    # Shaft diameter
-        ('SPAN', (7, 1), (7, 2)),    # Outer diameter pulley
-        ('SPAN', (8, 1), (9, 1)),    # Running condition spans 2
-        ('SPAN', (10, 1), (11, 1)),  # Starting condition spans 2
-        ('SPAN', (12, 1), (12, 2)),  # Arm length
-        ('SPAN', (13, 1), (13, 2)),  # Wrap angle
-        ('SPAN', (14, 1), (14, 2)),  # start-up factor Running
-        ('SPAN', (15, 1), (15, 2)),  # start-up factor starting
-        ('SPAN', (16, 1), (17, 1)),  # Running condition (torque) spans 2
-        ('SPAN', (18, 1), (19, 1)),  # Starting condition (torque) spans 2
-        ('SPAN', (20, 1), (20, 2)),  # Locking element Qty
-        ('SPAN', (21, 1), (21, 2)),  # Product code
-        ('SPAN', (22, 1), (22, 2)),  # Size
-        ('SPAN', (23, 1), (23, 2)),  # Hub inner diameter
-        ('SPAN', (24, 1), (24, 2)),  # Hub outer diameter
-        ('SPAN', (25, 1), (25, 2)),  # Hub length
-        ('SPAN', (26, 1), (26, 2)),  # Torque
-        ('SPAN', (27, 1), (27, 2)),  # Bending moment
-        ('SPAN', (28, 1), (28, 2)),  # Screw Tightening torque
-        ('SPAN', (29, 1), (29, 2)),  # Shaft pressure
-        ('SPAN', (30, 1), (30, 2)),  # Technical points
-        
-        # Font and styling
-        ('FONTSIZE', (0, 0), (-1, -1), 4),
-        ('FONTNAME', (0, 0), (-1, 2), 'Helvetica-Bold'),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 1),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0.5),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0.5),
-    ]))
+    main_table.setStyle(table_style)
     
     story.append(KeepTogether(main_table))
     # Use wide footer for locking element (287mm content width)
@@ -1242,28 +1131,61 @@ def generate_locking_element_technical_pdf(quotation_number, metadata, requireme
 
 
 
-def generate_technical_pdf_dispatch(quotation_number, metadata, requirements, technical_quotes, output_dir):
+PART_TABLE_SPECS = {
+    'brake': _brake_table_spec,
+    'backstop': _backstop_table_spec,
+    'clutch': _clutch_table_spec,
+    'coupling': _coupling_table_spec,
+    'locking_element': _locking_element_table_spec,
+}
+
+
+@lru_cache(maxsize=None)
+def _cached_table_spec(kind):
+    col_widths, table_style = PART_TABLE_SPECS[kind]()
+    return tuple(col_widths), table_style
+
+
+def part_table_spec(kind):
     """
-    Main dispatcher: Groups requirements by part type and generates separate PDFs
-    
-    Args:
-        quotation_number: Quote number
-        metadata: Quote metadata (project, customer, etc)
-        requirements: List of ALL requirements
-        technical_quotes: Dict of ALL technical quotes
-        output_dir: Directory to save PDFs
-        
-    Returns:
-        List of generated PDF file paths
+    (column widths, TableStyle) of a part type's requirements table, built on first use.
+    The widths come back as a fresh list because ReportLab pads a short width list in place.
     """
-    
-    print(f"\n{'='*60}")
-    print(f"TECHNICAL PDF GENERATION DISPATCH")
-    print(f"{'='*60}")
-    print(f"Total requirements: {len(requirements)}")
-    print(f"Total technical quotes: {len(technical_quotes)}")
-    
-    # Group requirements by part type
+    col_widths, table_style = _cached_table_spec(kind)
+    return list(col_widths), table_style
+
+
+def render_part_pdf(part_type, quotation_number, metadata, part_reqs, part_tech_quotes, filepath):
+    """Render one part type's PDF; top-level so it can run in a worker process"""
+    filepath = Path(filepath)
+    if reuse_cached_pdf(filepath):
+        return str(filepath)
+    
+    # Render to a temporary name; it is moved into place once complete
+    render_path = str(pending_path(filepath))
+    try:
+        if 'Brake' in part_type:
+            generate_brake_technical_pdf(quotation_number, metadata, part_reqs, part_tech_quotes, render_path)
+        elif 'Backstop' in part_type:
+            generate_backstop_technical_pdf(quotation_number, metadata, part_reqs, part_tech_quotes, render_path)
+        elif 'Clutch' in part_type:
+            generate_clutch_technical_pdf(quotation_number, metadata, part_reqs, part_tech_quotes, render_path)
+        elif 'Coupling' in part_type or 'Torque Limiter' in part_type:
+            generate_coupling_technical_pdf(quotation_number, metadata, part_reqs, part_tech_quotes, render_path)
+        elif 'Locking' in part_type or 'Conveyor' in part_type:
+            generate_locking_element_technical_pdf(quotation_number, metadata, part_reqs, part_tech_quotes, render_path)
+        else:
+            print(f"⚠ Unknown part type: {part_type}, using brake template")
+            generate_brake_technical_pdf(quotation_number, metadata, part_reqs, part_tech_quotes, render_path)
+    except Exception:
+        Path(render_path).unlink(missing_ok=True)
+        raise
+    publish_pdf(Path(render_path), filepath)
+    return str(filepath)
+
+
+def group_requirements_by_part(requirements, technical_quotes):
+    """Group requirements by part type, each with the technical quotes of its requirements"""
     grouped_reqs = {}
     for req in requirements:
         part_type = req.get('partType', 'Unknown')
@@ -1271,15 +1193,7 @@ def generate_technical_pdf_dispatch(quotation_number, metadata, requirements, te
             grouped_reqs[part_type] = []
         grouped_reqs[part_type].append(req)
     
-    print(f"\nGrouped by part type:")
-    for part_type, reqs in grouped_reqs.items():
-        print(f"  - {part_type}: {len(reqs)} requirements")
-    
-    generated_files = []
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Generate separate PDF for each part type
+    groups = []
     for part_type, part_reqs in grouped_reqs.items():
         # Filter technical quotes for this part type
         part_tech_quotes = {}
@@ -1287,42 +1201,71 @@ def generate_technical_pdf_dispatch(quotation_number, metadata, requirements, te
             req_id = str(req.get('id', ''))
             if req_id in technical_quotes:
                 part_tech_quotes[req_id] = technical_quotes[req_id]
-        
-        # Generate filename
+        groups.append((part_type, part_reqs, part_tech_quotes))
+    return groups
+
+
+def plan_technical_pdfs(quotation_number, metadata, requirements, technical_quotes, output_dir):
+    """Argument tuples for render_part_pdf, one per part type"""
+    groups = group_requirements_by_part(requirements, technical_quotes)
+    print(f"\nTechnical PDF generation: {len(requirements)} requirements in {len(groups)} part type(s)")
+    
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    jobs = []
+    for part_type, part_reqs, part_tech_quotes in groups:
+        # Name the file after a hash of its inputs so an unchanged part reuses the earlier PDF
         part_type_clean = part_type.replace(' ', '_').replace('Quotation', '').strip('_')
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"Technical_Quote_{part_type_clean}_{quotation_number}_{timestamp}.pdf"
-        filepath = output_dir / filename
+        digest = pdf_input_hash('technical', part_type, quotation_number, metadata, part_reqs, part_tech_quotes)
+        filename = f"Technical_Quote_{part_type_clean}_{quotation_number}_{digest[:16]}.pdf"
+        jobs.append((part_type, quotation_number, metadata, part_reqs, part_tech_quotes, output_dir / filename))
+    return jobs
+
+
+def collect_technical_pdfs(jobs, outcomes):
+    """Split per-part (path, error) outcomes into generated paths and error entries"""
+    generated_files = []
+    errors = []
+    for job, (filepath, error) in zip(jobs, outcomes):
+        if error is None:
+            generated_files.append(filepath)
+            print(f"  ✓ {Path(filepath).name}")
+        else:
+            print(f"✗ ERROR generating {job[0]} PDF: {error}")
+            errors.append({'part_type': job[0], 'error': str(error)})
+    return generated_files, errors
+
+
+def render_technical_pdfs(quotation_number, metadata, requirements, technical_quotes, output_dir, idle=None):
+    """
+    Render one PDF per part type in the shared worker pool
+    
+    Args:
+        idle: Optional callable run while waiting (eel.sleep keeps the UI responsive)
         
-        try:
-            # Dispatch to appropriate generator
-            if 'Brake' in part_type:
-                generate_brake_technical_pdf(quotation_number, metadata, part_reqs, part_tech_quotes, filepath)
-            elif 'Backstop' in part_type:
-                generate_backstop_technical_pdf(quotation_number, metadata, part_reqs, part_tech_quotes, filepath)
-            elif 'Clutch' in part_type:
-                generate_clutch_technical_pdf(quotation_number, metadata, part_reqs, part_tech_quotes, filepath)
-            elif 'Coupling' in part_type or 'Torque Limiter' in part_type:
-                generate_coupling_technical_pdf(quotation_number, metadata, part_reqs, part_tech_quotes, filepath)
-            elif 'Locking' in part_type or 'Conveyor' in part_type:
-                generate_locking_element_technical_pdf(quotation_number, metadata, part_reqs, part_tech_quotes, filepath)
-            else:
-                print(f"⚠ Unknown part type: {part_type}, using brake template")
-                generate_brake_technical_pdf(quotation_number, metadata, part_reqs, part_tech_quotes, filepath)
-            
-            generated_files.append(str(filepath))
-            
-        except Exception as e:
-            print(f"✗ ERROR generating {part_type} PDF: {str(e)}")
-            import traceback
-            traceback.print_exc()
+    Returns:
+        (generated file paths, [{'part_type': ..., 'error': ...}] for parts that failed)
+    """
+    from app.services.pdf_service import run_in_pool
     
-    print(f"\n{'='*60}")
-    print(f"GENERATION COMPLETE")
-    print(f"{'='*60}")
-    print(f"Generated {len(generated_files)} PDF(s):")
-    for f in generated_files:
-        print(f"  ✓ {Path(f).name}")
-    print()
+    jobs = plan_technical_pdfs(quotation_number, metadata, requirements, technical_quotes, output_dir)
+    return collect_technical_pdfs(jobs, run_in_pool(render_part_pdf, jobs, idle))
+
+
+def generate_technical_pdf_dispatch(quotation_number, metadata, requirements, technical_quotes, output_dir):
+    """
+    Main dispatcher: Groups requirements by part type and generates separate PDFs
     
+    Args:
+        quotation_number: Quote number
+        metadata: Quote metadata (project, customer, etc)
+        requirements: List of ALL requirements
+        technical_quotes: Dict of ALL technical quotes
+        output_dir: Directory to save PDFs
+        
+    Returns:
+        List of generated PDF file paths
+    """
+    generated_files, _ = render_technical_pdfs(quotation_number, metadata, requirements, technical_quotes, output_dir)
     return generated_files
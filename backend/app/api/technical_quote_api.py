@@ -3,25 +3,32 @@ Technical Quote API - UPDATED FOR MULTI-PDF GENERATION
 """
 import eel
 import json
-from app.database.connection import SessionLocal
+from app.database.connection import SessionLocal, WriterSession
+from app.services.analytics_rollup_service import AnalyticsRollupService
+from app.services.analytics_cache import analytics_cache
+from app.services.quotation_service import QuotationService
 from sqlalchemy import text
 
+quotation_service = QuotationService()
+
 @eel.expose
 def get_technical_quotes(quotation_number):
     """Get all technical quotes for a quotation"""
     db = SessionLocal()
     try:
         result = db.execute(text("""
-            SELECT requirement_id, technical_data
+            SELECT requirement_id, technical_data, version
             FROM technical_quotations
             WHERE quotation_number = :quotation_number
         """), {'quotation_number': quotation_number}).fetchall()
         
         quotes = {}
+        versions = {}
         for row in result:
             quotes[row[0]] = json.loads(row[1]) if row[1] else {}
+            versions[row[0]] = row[2]
         
-        return {'success': True, 'data': quotes}
+        return {'success': True, 'data': quotes, 'versions': versions}
     except Exception as e:
         return {'success': False, 'message': str(e)}
     finally:
@@ -30,46 +37,86 @@ def get_technical_quotes(quotation_number):
 @eel.expose
 def save_technical_quote(quotation_number, requirement_id, quote_data):
     """Save technical quote for a specific requirement"""
-    db = SessionLocal()
+    return write_technical_quote(quotation_number, requirement_id, lambda current: quote_data)
+
+@eel.expose
+def patch_technical_quote(quotation_number, requirement_id, changes, version=None):
+    """
+    Apply only the changed fields of a technical quote (technical_fields merge key by key).
+    With a version, the patch is refused if the quote was saved since that version.
+    """
+    return write_technical_quote(
+        quotation_number,
+        requirement_id,
+        lambda current: quotation_service.merge_technical_data(current, changes),
+        version
+    )
+
+def write_technical_quote(quotation_number, requirement_id, update, version=None):
+    """Store update(current data) for one requirement, skipping the write if nothing changed"""
+    db = WriterSession()
     try:
         # Check if exists
         result = db.execute(text("""
-            SELECT id FROM technical_quotations
+            SELECT id, technical_data, version FROM technical_quotations
             WHERE quotation_number = :quotation_number AND requirement_id = :requirement_id
         """), {'quotation_number': quotation_number, 'requirement_id': requirement_id}).fetchone()
         
+        if result and version is not None and result[2] != int(version):
+            return version_conflict(result[2])
+        
+        current = json.loads(result[1]) if result and result[1] else {}
+        quote_data = update(current)
+        
         if result:
-            # Update
-            db.execute(text("""
+            if quote_data == current:
+                return {'success': True, 'message': 'Technical quote unchanged', 'changed': False, 'version': result[2]}
+            
+            # Update, unless another writer saved since it was read
+            updated = db.execute(text("""
                 UPDATE technical_quotations
-                SET technical_data = :data, updated_at = CURRENT_TIMESTAMP
-                WHERE quotation_number = :quotation_number AND requirement_id = :requirement_id
-            """), {
-                'quotation_number': quotation_number,
-                'requirement_id': requirement_id,
-                'data': json.dumps(quote_data)
-            })
+                SET technical_data = :data, version = version + 1, updated_at = CURRENT_TIMESTAMP
+                WHERE id = :id AND version = :version
+            """), {'id': result[0], 'version': result[2], 'data': json.dumps(quote_data)})
+            if updated.rowcount == 0:
+                db.rollback()
+                return version_conflict(db.execute(text("""
+                    SELECT version FROM technical_quotations WHERE id = :id
+                """), {'id': result[0]}).scalar())
+            new_version = result[2] + 1
         else:
             # Insert - ADD part_type
             db.execute(text("""
                 INSERT INTO technical_quotations 
-                (quotation_number, requirement_id, part_type, technical_data, created_at, updated_at)
-                VALUES (:quotation_number, :requirement_id, :part_type, :data, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                (quotation_number, requirement_id, part_type, technical_data, version, created_at, updated_at)
+                VALUES (:quotation_number, :requirement_id, :part_type, :data, 1, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
             """), {
                 'quotation_number': quotation_number,
                 'requirement_id': requirement_id,
                 'part_type': requirement_id,
                 'data': json.dumps(quote_data)
             })
+            new_version = 1
+            AnalyticsRollupService(db).refresh_quotation(quotation_number)
         
         db.commit()
-        return {'success': True, 'message': 'Technical quote saved'}
+        analytics_cache.invalidate()
+        return {'success': True, 'message': 'Technical quote saved', 'changed': True, 'version': new_version}
     except Exception as e:
         db.rollback()
         return {'success': False, 'message': str(e)}
     finally:
         db.close()
 
+def version_conflict(version):
+    """Response for an edit made against an outdated version of a technical quote"""
+    return {
+        'success': False,
+        'conflict': True,
+        'version': version,
+        'message': 'This technical quote was changed elsewhere. Reload it and apply your edit again.'
+    }
+
 # ============================================================
 # UPDATED FUNCTION - HANDLES MULTIPLE PDFs
 # ============================================================
@@ -89,36 +136,23 @@ def generate_technical_pdf(quotation_number, metadata, requirements, technical_q
     """
     from pathlib import Path
     from datetime import datetime
-    from app.api.technical_pdf_generator import generate_technical_pdf_dispatch
+    from app.api.technical_pdf_generator import render_technical_pdfs
     
     try:
         output_dir = Path("data/quotations/technical")
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # CHANGED: Pass output_dir instead of filepath
-        # CHANGED: Returns list of files instead of boolean
-        generated_files = generate_technical_pdf_dispatch(
+        # Part types render in parallel worker processes; eel.sleep keeps the UI responsive meanwhile
+        generated_files, errors = render_technical_pdfs(
             quotation_number, 
             metadata, 
             requirements, 
             technical_quotes, 
-            output_dir  # Directory, not filepath
+            output_dir,  # Directory, not filepath
+            idle=lambda: eel.sleep(0.05)
         )
         
-        # CHANGED: Check for list of files
-        if generated_files and len(generated_files) > 0:
-            # Extract just filenames for display
-            filenames = [Path(f).name for f in generated_files]
-            
-            return {
-                'success': True,
-                'count': len(generated_files),      # NEW: Number of PDFs
-                'files': generated_files,            # NEW: Full paths
-                'filenames': filenames,              # NEW: Just names
-                'message': f'Generated {len(generated_files)} technical PDF(s)'
-            }
-        else:
-            return {'success': False, 'message': 'No requirements to generate PDF'}
+        return technical_pdf_response(generated_files, errors)
             
     except Exception as e:
         import traceback
@@ -126,4 +160,29 @@ def generate_technical_pdf(quotation_number, metadata, requirements, technical_q
             'success': False, 
             'message': str(e),
             'traceback': traceback.format_exc()
-        }
\ No newline at end of file
+        }
+
+
+def technical_pdf_response(generated_files, errors):
+    """Response for generate_technical_pdf (also the result of a technical PDF job)"""
+    from pathlib import Path
+    
+    # CHANGED: Check for list of files
+    if generated_files and len(generated_files) > 0:
+        # Extract just filenames for display
+        filenames = [Path(f).name for f in generated_files]
+        
+        result = {
+            'success': True,
+            'count': len(generated_files),      # NEW: Number of PDFs
+            'files': generated_files,            # NEW: Full paths
+            'filenames': filenames,              # NEW: Just names
+            'message': f'Generated {len(generated_files)} technical PDF(s)'
+        }
+        if errors:
+            result['errors'] = errors
+        return result
+    elif errors:
+        return {'success': False, 'message': '; '.join(f"{e['part_type']}: {e['error']}" for e in errors), 'errors': errors}
+    else:
+        return {'success': False, 'message': 'No requirements to generate PDF'}
@@ -4,7 +4,9 @@ Terms & Conditions API
 import eel
 import json
 from pathlib import Path
-from app.database.connection import SessionLocal
+from app.database.connection import SessionLocal, WriterSession
+from app.services.analytics_rollup_service import AnalyticsRollupService
+from app.services.analytics_cache import analytics_cache
 from sqlalchemy import text
 
 # Default dropdown options
@@ -89,7 +91,7 @@ def add_terms_dropdown_option(field, value):
 @eel.expose
 def save_custom_terms(quotation_number, terms_text):
     """Save custom terms for a quotation"""
-    db = SessionLocal()
+    db = WriterSession()
     try:
         # Check if commercial quote exists
         result = db.execute(text("""
@@ -110,8 +112,10 @@ def save_custom_terms(quotation_number, terms_text):
                 INSERT INTO commercial_quotations (quotation_number, terms, created_at, updated_at)
                 VALUES (:quotation_number, :terms, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
             """), {'quotation_number': quotation_number, 'terms': terms_text})
+            AnalyticsRollupService(db).refresh_quotation(quotation_number)
         
         db.commit()
+        analytics_cache.invalidate()
         return {'success': True, 'message': 'Terms saved successfully'}
     except Exception as e:
         db.rollback()
@@ -140,7 +144,7 @@ def get_quote_terms(quotation_number):
 @eel.expose
 def save_general_conditions(quotation_number, conditions_text):
     """Save general conditions for a quotation"""
-    db = SessionLocal()
+    db = WriterSession()
     try:
         # Check if commercial quote exists
         result = db.execute(text("""
@@ -161,8 +165,10 @@ def save_general_conditions(quotation_number, conditions_text):
                 INSERT INTO commercial_quotations (quotation_number, general_conditions, created_at, updated_at)
                 VALUES (:quotation_number, :conditions, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
             """), {'quotation_number': quotation_number, 'conditions': conditions_text})
+            AnalyticsRollupService(db).refresh_quotation(quotation_number)
         
         db.commit()
+        analytics_cache.invalidate()
         return {'success': True, 'message': 'General conditions saved successfully'}
     except Exception as e:
         db.rollback()
@@ -1,6 +1,6 @@
 """
 Database Package
 """
-from app.database.connection import engine, SessionLocal, get_db, init_database
+from app.database.connection import engine, writer_engine, SessionLocal, WriterSession, get_db, get_pool_metrics, init_database
 
-__all__ = ['engine', 'SessionLocal', 'get_db', 'init_database']
+__all__ = ['engine', 'writer_engine', 'SessionLocal', 'WriterSession', 'get_db', 'get_pool_metrics', 'init_database']
@@ -1,25 +1,128 @@
 """
 Database Connection and Session Management
 """
-from sqlalchemy import create_engine
+import threading
+import time
+from sqlalchemy import create_engine, event, exc
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
-from app.config import DATABASE_URL, DATABASE_PATH
-from app.models.base import Base
+from sqlalchemy.pool import QueuePool
+from app.config import (
+    DATABASE_URL, DATABASE_PATH,
+    SQLITE_JOURNAL_MODE, SQLITE_SYNCHRONOUS, SQLITE_CACHE_SIZE, SQLITE_MMAP_SIZE,
+    SQLITE_TEMP_STORE, SQLITE_FOREIGN_KEYS, SQLITE_BUSY_TIMEOUT,
+    DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT
+)
+from app.database.search_index import ensure_search_index
 from app.utils.logger import setup_logger
 
 logger = setup_logger()
 
-# Create engine
+class MeteredQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._metrics_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            wait = time.perf_counter() - start
+            with self._metrics_lock:
+                self.checkouts += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+
+    def metrics(self) -> dict:
+        """Pool occupancy and checkout wait statistics"""
+        with self._metrics_lock:
+            return {
+                "size": self.size(),
+                "checked_out": self.checkedout(),
+                "checked_in": self.checkedin(),
+                "overflow": max(self.overflow(), 0),
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3)
+            }
+
+# Reader engine: a bounded pool so analytics, exports and PDF builds run side by side under WAL
 engine = create_engine(
     DATABASE_URL,
     echo=False,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool
+    poolclass=MeteredQueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT
+)
+
+# Writer engine: one connection, so saves queue in Python instead of racing for SQLite's write lock
+writer_engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    connect_args={"check_same_thread": False},
+    poolclass=MeteredQueuePool,
+    pool_size=1,
+    max_overflow=0,
+    pool_timeout=DB_POOL_TIMEOUT
 )
 
-# Session factory
+# Allowed values for the text pragmas, since they are interpolated into SQL
+JOURNAL_MODES = {'DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'}
+SYNCHRONOUS_MODES = {'OFF', 'NORMAL', 'FULL', 'EXTRA'}
+TEMP_STORE_MODES = {'DEFAULT', 'FILE', 'MEMORY'}
+
+def sqlite_pragmas() -> dict:
+    """Connection pragmas from config, with invalid text values left at SQLite defaults"""
+    pragmas = {
+        'busy_timeout': SQLITE_BUSY_TIMEOUT,
+        'journal_mode': SQLITE_JOURNAL_MODE.upper(),
+        'synchronous': SQLITE_SYNCHRONOUS.upper(),
+        'cache_size': SQLITE_CACHE_SIZE,
+        'mmap_size': SQLITE_MMAP_SIZE,
+        'temp_store': SQLITE_TEMP_STORE.upper(),
+        'foreign_keys': 'ON' if SQLITE_FOREIGN_KEYS else 'OFF'
+    }
+    for name, allowed in [('journal_mode', JOURNAL_MODES), ('synchronous', SYNCHRONOUS_MODES), ('temp_store', TEMP_STORE_MODES)]:
+        if pragmas[name] not in allowed:
+            logger.warning(f"Ignoring invalid SQLite {name}: {pragmas[name]}")
+            del pragmas[name]
+    return pragmas
+
+def configure_sqlite_connection(dbapi_connection, connection_record):
+    """Apply the configured pragmas to each new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in sqlite_pragmas().items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+event.listen(engine, "connect", configure_sqlite_connection)
+event.listen(writer_engine, "connect", configure_sqlite_connection)
+
+# Session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+WriterSession = sessionmaker(autocommit=False, autoflush=False, bind=writer_engine)
+
+def get_pool_metrics() -> dict:
+    """Connection pool metrics for the reader and writer engines"""
+    return {
+        "reader": engine.pool.metrics(),
+        "writer": writer_engine.pool.metrics()
+    }
 
 def get_db():
     """Get database session"""
@@ -29,20 +132,64 @@ def get_db():
     finally:
         db.close()
 
+def expected_schema_version() -> int:
+    """
+    The Alembic head revision as a number (revision ids are zero-padded sequence
+    numbers). Stamped in PRAGMA user_version once the full startup check has run, so
+    a new revision makes existing databases run the migrations, the seed and the
+    backfills again on their next launch.
+    """
+    from app.database.migrate import head_revision
+    return int(head_revision())
+
+def get_schema_version() -> int:
+    """Schema version stamped on the database file (0 for new or unversioned databases)"""
+    with engine.connect() as connection:
+        return connection.exec_driver_sql("PRAGMA user_version").scalar() or 0
+
+def set_schema_version(version: int):
+    """Stamp the database file with a schema version"""
+    with engine.begin() as connection:
+        connection.exec_driver_sql(f"PRAGMA user_version = {int(version)}")
+
 def init_database():
-    """Initialize database - create all tables"""
+    """Initialize database - create tables, seed and backfill unless the schema is already current"""
     try:
         # Import all models to register them
-        from app.models import User, Customer, Project, CommercialQuotation, TechnicalQuotation
+        from app.models import User, Customer, Project, ProjectRequirement, CommercialQuotation, CommercialQuotationItem, TechnicalQuotation, AnalyticsRollup
+        
+        # Fast path: the database was fully set up for this schema version on an earlier launch
+        version = get_schema_version()
+        expected = expected_schema_version()
+        if version == expected:
+            ensure_search_index(engine)
+            logger.info(f"Database schema is current (version {version})")
+            return
+        logger.info(f"Upgrading database schema from version {version} to {expected}")
         
-        # Create all tables
-        Base.metadata.create_all(bind=engine)
+        # Create or upgrade the tables through the migration chain
+        from app.database.migrate import run_migrations
+        run_migrations()
+        ensure_search_index(engine)
         
         logger.info("✅ Database tables created successfully")
         
         # Create default admin user if not exists
         from app.database.seed import create_default_admin
-        create_default_admin()
+        seeded = create_default_admin()
+        
+        # Build the analytics rollups for databases that predate the table
+        from app.services.analytics_rollup_service import AnalyticsRollupService
+        db = SessionLocal()
+        try:
+            AnalyticsRollupService(db).rebuild_if_empty()
+            db.commit()
+        finally:
+            db.close()
+        
+        # Leave the version unset if seeding failed so the next launch tries again
+        if seeded:
+            set_schema_version(expected)
         
     except Exception as e:
         logger.error(f"❌ Database initialization failed: {e}")
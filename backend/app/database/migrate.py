@@ -0,0 +1,75 @@
+"""
+Database Migrations
+Runs the Alembic revisions in app/database/migrations. The whole upgrade is one
+IMMEDIATE transaction with foreign keys off, so copy-table rebuilds never cascade
+deletes and a failed upgrade leaves the database exactly as it was.
+"""
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+from app.config import DATABASE_URL, SQLITE_BUSY_TIMEOUT
+from app.utils.logger import setup_logger
+
+logger = setup_logger()
+
+MIGRATIONS_DIR = Path(__file__).parent / 'migrations'
+
+
+def alembic_config(connection=None) -> Config:
+    """Alembic config for the app's migrations; env.py reuses connection when given"""
+    config = Config()
+    config.set_main_option('script_location', str(MIGRATIONS_DIR))
+    config.attributes['connection'] = connection
+    return config
+
+
+@contextmanager
+def migration_connection():
+    """A dedicated connection inside one IMMEDIATE transaction, committed on success"""
+    engine = create_engine(DATABASE_URL, poolclass=NullPool, connect_args={"check_same_thread": False})
+    try:
+        with engine.connect() as connection:
+            # foreign_keys can only be changed outside a transaction
+            connection.exec_driver_sql(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT}")
+            connection.exec_driver_sql("PRAGMA foreign_keys = OFF")
+            connection.commit()
+
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                yield connection
+                violations = connection.exec_driver_sql("PRAGMA foreign_key_check").fetchall()
+                if violations:
+                    tables = sorted({row[0] for row in violations})
+                    logger.warning(f"{len(violations)} rows reference missing parent rows in: {', '.join(tables)}")
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+    finally:
+        engine.dispose()
+
+
+def head_revision() -> str:
+    """Latest revision in the migrations directory"""
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def current_revision(connection) -> Optional[str]:
+    return MigrationContext.configure(connection).get_current_revision()
+
+
+def run_migrations():
+    """Upgrade the database to the latest revision"""
+    with migration_connection() as connection:
+        before = current_revision(connection)
+        command.upgrade(alembic_config(connection), 'head')
+        after = current_revision(connection)
+
+    if before != after:
+        logger.info(f"Database migrated from revision {before or 'none'} to {after}")
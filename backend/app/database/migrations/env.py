@@ -0,0 +1,34 @@
+"""
+Alembic Environment
+Migrates the connection handed over by app.database.migrate, or opens one the same
+way when run from the alembic command line (cd backend && alembic upgrade head)
+"""
+from logging.config import fileConfig
+from alembic import context
+from app.models import Base
+
+if context.config.config_file_name:
+    fileConfig(context.config.config_file_name, disable_existing_loggers=False)
+
+
+def run_migrations(connection):
+    context.configure(
+        connection=connection,
+        target_metadata=Base.metadata,
+        render_as_batch=True,  # SQLite alters tables by copying them
+        transactional_ddl=True
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    raise RuntimeError("Offline (--sql) migrations are not supported")
+
+connection = context.config.attributes.get('connection')
+if connection is not None:
+    run_migrations(connection)
+else:
+    from app.database.migrate import migration_connection
+    with migration_connection() as connection:
+        run_migrations(connection)
@@ -0,0 +1,257 @@
+"""Baseline schema
+
+Creates the tables of a new database, and brings databases set up by create_all and
+the old one-off fix_*/migrate_* scripts to the same schema. Missing columns are added
+in place. A table whose foreign keys or NOT NULL columns differ is rebuilt in one copy
+(CREATE, INSERT ... SELECT, DROP, RENAME), and any extra legacy columns are kept.
+
+The table definitions are frozen here on purpose. Later schema changes get their
+own revisions.
+
+This revision is irreversible. It adopts tables and data that existed before it, so
+there is no earlier schema to go back to and dropping the tables would delete that
+data; downgrade raises instead. Restore a copy of the database file to undo it.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Value for NOT NULL columns that legacy tables left empty or did not have
+NOT_NULL_FILL = {
+    'created_at': sa.text('CURRENT_TIMESTAMP'),
+    'updated_at': sa.text('CURRENT_TIMESTAMP'),
+    'region': 'NORTH',
+}
+
+# Full-text search tables whose sync triggers are dropped with their source table;
+# init_database recreates and repopulates them
+SEARCH_TABLES = {'projects': 'projects_fts', 'customers': 'customers_fts'}
+
+
+def timestamps():
+    return [
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    ]
+
+
+def baseline_tables(metadata: sa.MetaData):
+    """The schema as of this revision, in dependency order"""
+    return [
+        sa.Table(
+            'users', metadata,
+            sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column('name', sa.String(100), nullable=False),
+            sa.Column('username', sa.String(100), nullable=False),
+            sa.Column('region', sa.Enum('EAST', 'WEST', 'NORTH', 'SOUTH', name='userregion'), nullable=False),
+            sa.Column('password_hash', sa.String(255), nullable=False),
+            sa.Column('role', sa.String(20)),
+            sa.Column('is_active', sa.Boolean()),
+            *timestamps(),
+            sa.Index('ix_users_username', 'username', unique=True),
+        ),
+        sa.Table(
+            'customers', metadata,
+            sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column('name', sa.String(200), nullable=False),
+            sa.Column('email', sa.String(100)),
+            sa.Column('phone', sa.String(20)),
+            sa.Column('address', sa.Text()),
+            sa.Column('city', sa.String(100)),
+            sa.Column('state', sa.String(100)),
+            sa.Column('country', sa.String(100)),
+            sa.Column('gstin', sa.String(15)),
+            sa.Column('contact_person', sa.String(100)),
+            sa.Column('notes', sa.Text()),
+            *timestamps(),
+            sa.Index('ix_customers_name', 'name'),
+        ),
+        sa.Table(
+            'projects', metadata,
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('quotation_number', sa.String(100), nullable=False),
+            sa.Column('customer_name', sa.String(200), nullable=False),
+            sa.Column('customer_id', sa.Integer(), sa.ForeignKey('customers.id'), nullable=True),
+            sa.Column('status', sa.Enum('draft', 'in_progress', 'completed', 'archived', name='projectstatus')),
+            sa.Column('quote_status', sa.Enum('budgetary', 'active', 'lost', 'won', name='quotestatus'), nullable=True),
+            sa.Column('requirements_data', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Index('ix_projects_id', 'id'),
+            sa.Index('ix_projects_quotation_number', 'quotation_number', unique=True),
+            sa.Index('ix_projects_created_at', 'created_at'),
+            sa.Index('ix_projects_updated_at', 'updated_at'),
+            sa.Index('ix_projects_quote_status_created_at', 'quote_status', 'created_at'),
+            sa.Index('ix_projects_customer_name_created_at', 'customer_name', 'created_at'),
+        ),
+        sa.Table(
+            'commercial_quotations', metadata,
+            sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column('quotation_number', sa.String(50),
+                      sa.ForeignKey('projects.quotation_number', ondelete='CASCADE'), nullable=False),
+            sa.Column('to', sa.String(200)),
+            sa.Column('attn', sa.String(100)),
+            sa.Column('email_to', sa.String(100)),
+            sa.Column('your_inquiry_ref', sa.String(100)),
+            sa.Column('pages', sa.Integer()),
+            sa.Column('your_partner', sa.String(100)),
+            sa.Column('mobile_no', sa.String(20)),
+            sa.Column('fax_no', sa.String(20)),
+            sa.Column('email_partner', sa.String(100)),
+            sa.Column('items', sa.JSON()),
+            sa.Column('terms', sa.JSON()),
+            sa.Column('general_conditions', sa.Text()),  # written by terms_api through SQL, not mapped
+            sa.Column('subtotal', sa.Float()),
+            sa.Column('tax_amount', sa.Float()),
+            sa.Column('total_amount', sa.Float()),
+            *timestamps(),
+            sa.Index('ix_commercial_quotations_quotation_number', 'quotation_number'),
+        ),
+        sa.Table(
+            'commercial_quotation_items', metadata,
+            sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column('commercial_quotation_id', sa.Integer(),
+                      sa.ForeignKey('commercial_quotations.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('quotation_number', sa.String(50), nullable=False),
+            sa.Column('sr_no', sa.Integer()),
+            sa.Column('part_type', sa.String(100)),
+            sa.Column('description', sa.Text()),
+            sa.Column('qty', sa.Float()),
+            sa.Column('unit_price', sa.Float()),
+            sa.Column('amount', sa.Float()),
+            sa.Index('ix_commercial_quotation_items_commercial_quotation_id', 'commercial_quotation_id'),
+            sa.Index('ix_commercial_quotation_items_quotation_number', 'quotation_number'),
+        ),
+        sa.Table(
+            'technical_quotations', metadata,
+            sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column('quotation_number', sa.String(50),
+                      sa.ForeignKey('projects.quotation_number', ondelete='CASCADE'), nullable=False),
+            sa.Column('requirement_id', sa.Integer(), nullable=True),
+            sa.Column('part_type', sa.String(100), nullable=False),
+            sa.Column('part_label', sa.String(200)),
+            sa.Column('customer_requirements', sa.Text()),
+            sa.Column('specifications', sa.JSON()),
+            sa.Column('technical_data', sa.Text()),
+            sa.Column('notes', sa.Text()),
+            *timestamps(),
+            sa.UniqueConstraint('quotation_number', 'requirement_id', name='uq_quotation_requirement'),
+            sa.Index('ix_technical_quotations_quotation_number', 'quotation_number'),
+            sa.Index('ix_technical_quotations_requirement_id', 'requirement_id'),
+            sa.Index('ix_technical_quotations_part_type', 'part_type'),
+            sa.Index('ix_technical_quotations_quotation_part_type', 'quotation_number', 'part_type'),
+        ),
+        sa.Table(
+            'analytics_rollups', metadata,
+            sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column('month', sa.String(7), nullable=True),
+            sa.Column('part_type', sa.String(100), nullable=False),
+            sa.Column('customer_name', sa.String(200), nullable=False),
+            sa.Column('quote_status', sa.String(20), nullable=True),
+            sa.Column('quote_count', sa.Integer()),
+            sa.Column('tech_count', sa.Integer()),
+            sa.Column('commercial_count', sa.Integer()),
+            sa.Column('total_amount', sa.Float()),
+            sa.Column('processing_hours', sa.Float()),
+            sa.Column('last_quote_at', sa.DateTime(), nullable=True),
+            sa.UniqueConstraint('month', 'part_type', 'customer_name', 'quote_status', name='uq_analytics_rollup_key'),
+            sa.Index('ix_analytics_rollups_month', 'month'),
+        ),
+    ]
+
+
+def foreign_keys(columns, referred_table, referred_columns, ondelete):
+    return (tuple(columns), referred_table, tuple(referred_columns), (ondelete or '').upper())
+
+
+def needs_rebuild(table: sa.Table, inspector) -> bool:
+    """True if the existing table's NOT NULL columns or foreign keys differ from table"""
+    nullable = {c['name']: c['nullable'] for c in inspector.get_columns(table.name)}
+    for column in table.columns:
+        if not column.primary_key and nullable.get(column.name) != column.nullable:
+            return True
+
+    existing = {
+        foreign_keys(fk['constrained_columns'], fk['referred_table'], fk['referred_columns'],
+                     fk.get('options', {}).get('ondelete'))
+        for fk in inspector.get_foreign_keys(table.name)
+    }
+    wanted = {
+        foreign_keys([e.parent.name for e in fk.elements], fk.referred_table.name,
+                     [e.column.name for e in fk.elements], fk.ondelete)
+        for fk in table.foreign_key_constraints
+    }
+    return existing != wanted
+
+
+def conform_table(table: sa.Table):
+    """Bring an existing table to the baseline definition without losing rows or extra columns"""
+    bind = op.get_bind()
+    existing = {c['name']: c for c in sa.inspect(bind).get_columns(table.name)}
+
+    for column in table.columns:
+        if column.name not in existing:
+            op.add_column(table.name, sa.Column(column.name, column.type, nullable=True))
+
+    if needs_rebuild(table, sa.inspect(bind)):
+        for column in table.columns:
+            if not column.nullable and not column.primary_key:
+                op.execute(
+                    sa.table(table.name, sa.column(column.name))
+                    .update()
+                    .where(sa.column(column.name).is_(None))
+                    .values({column.name: NOT_NULL_FILL.get(column.name, '')})
+                )
+
+        # Rebuild from the baseline definition plus the legacy columns it does not know
+        target = table.to_metadata(sa.MetaData())
+        for name, reflected in existing.items():
+            if name not in target.columns:
+                target.append_column(sa.Column(name, reflected['type'], nullable=True))
+
+        if table.name in SEARCH_TABLES:
+            op.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLES[table.name]}")
+        with op.batch_alter_table(table.name, copy_from=target, recreate='always'):
+            pass
+    else:
+        indexes = {i['name'] for i in sa.inspect(bind).get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in indexes:
+                index.create(bind)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    existing = set(sa.inspect(bind).get_table_names())
+
+    for table in baseline_tables(sa.MetaData()):
+        if table.name not in existing:
+            table.create(bind)
+        else:
+            conform_table(table)
+
+    # Quote statuses were once stored by display value ('Budgetary'); the enum stores names
+    op.execute(
+        "UPDATE projects SET quote_status = lower(quote_status) "
+        "WHERE quote_status IS NOT NULL AND quote_status <> lower(quote_status)"
+    )
+
+
+def downgrade() -> None:
+    raise RuntimeError(
+        "Revision 0001 (baseline schema) is irreversible: downgrading it would drop every "
+        "table and its data. Restore a copy of the database file instead."
+    )
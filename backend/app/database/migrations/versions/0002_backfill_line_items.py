@@ -0,0 +1,78 @@
+"""Backfill line items
+
+Fills commercial_quotation_items for commercial quotations saved before the table
+existed. One INSERT ... SELECT over json_each does the work, instead of loading and
+flushing every quotation through the ORM. It maps items the same way as
+QuotationService._to_line_item.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# items is usually stored double-encoded (a JSON string holding the JSON array).
+# Nested CASEs because json_type raises on malformed JSON and AND does not short-circuit.
+ITEMS_ARRAY = """
+    CASE WHEN json_valid(cq.items) THEN
+        CASE WHEN json_type(cq.items) = 'text' THEN json_extract(cq.items, '$') ELSE cq.items END
+    END
+"""
+
+
+def number(expression: str) -> str:
+    """float(value or 0), with text and other non-numbers as 0"""
+    return f"COALESCE(CAST({expression} AS REAL), 0.0)"
+
+
+def first_present(key: str, fallback: str) -> str:
+    """item.get(key, item.get(fallback))"""
+    return (f"CASE WHEN json_type(item.value, '$.{key}') IS NOT NULL "
+            f"THEN json_extract(item.value, '$.{key}') ELSE json_extract(item.value, '$.{fallback}') END")
+
+
+def upgrade() -> None:
+    op.execute(sa.text(f"""
+        INSERT INTO commercial_quotation_items
+            (commercial_quotation_id, quotation_number, sr_no, part_type, description, qty, unit_price, amount)
+        SELECT
+            quote.id,
+            quote.quotation_number,
+            item.key + 1,
+            json_extract(item.value, '$.part_type'),
+            json_extract(item.value, '$.description'),
+            {number(first_present('qty', 'unit'))},
+            {number("json_extract(item.value, '$.unit_price')")},
+            {number(first_present('total_price', 'amount'))}
+        FROM (
+            SELECT cq.id, cq.quotation_number, {ITEMS_ARRAY} AS items
+            FROM commercial_quotations AS cq
+            WHERE cq.items IS NOT NULL
+              AND NOT EXISTS (
+                  SELECT 1 FROM commercial_quotation_items AS existing
+                  WHERE existing.commercial_quotation_id = cq.id
+              )
+        ) AS quote
+        JOIN json_each(
+            CASE WHEN json_valid(quote.items) THEN
+                CASE WHEN json_type(quote.items) = 'array' THEN quote.items END
+            END
+        ) AS item
+        WHERE item.type = 'object'
+        ORDER BY quote.id, item.key
+    """))
+
+
+def downgrade() -> None:
+    pass
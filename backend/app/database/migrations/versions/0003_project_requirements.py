@@ -0,0 +1,152 @@
+"""Project requirements table
+
+Moves the requirements list out of projects.requirements_data into one row per
+requirement. Common fields get typed, indexed columns; the full form entry stays in
+field_values. The data move is one INSERT ... SELECT over json_each, mapped the same
+way as RequirementService._to_columns. The project search index is dropped here so
+init_database rebuilds it from the new table.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Typed columns and the form labels they are copied from, as of this revision
+TEXT_FIELDS = {
+    'tag_number': ('Tag Number', 'Tag number'),
+    'application': ('Application',),
+}
+NUMBER_FIELDS = {
+    'motor_kw': ('Motor KW',),
+    'torque_min_nm': ('Torque (Mn) Min (Nm)', 'Stopping Torque (Mn) Min (Nm)', 'Torque  Main drive - Min (Nm)'),
+    'torque_max_nm': ('Torque (Mn) Max (Nm)', 'Stopping Torque (Mn) Max (Nm)', 'Torque Main drive - Max (Nm)'),
+    'service_factor': ('Service Factor',),
+}
+
+SEARCH_TRIGGERS = ['projects_fts_insert', 'projects_fts_update', 'projects_fts_delete']
+
+
+def requirements_array(row: str) -> str:
+    """requirements_data as a JSON array, or NULL (json_type raises on malformed JSON)"""
+    return (
+        f"CASE WHEN json_valid({row}.requirements_data) THEN "
+        f"CASE WHEN json_type({row}.requirements_data) = 'array' THEN {row}.requirements_data END END"
+    )
+
+
+def text_value(path: str) -> str:
+    """str(value).strip() or None"""
+    return f"NULLIF(trim(CAST(json_extract(fields, '{path}') AS TEXT)), '')"
+
+
+def number_value(path: str) -> str:
+    """float(value), None for blanks, text and booleans"""
+    return (
+        f"CASE WHEN json_type(fields, '{path}') IN ('integer', 'real') THEN json_extract(fields, '{path}') "
+        f"WHEN json_type(fields, '{path}') = 'text' AND trim(json_extract(fields, '{path}')) <> '' "
+        f"AND trim(json_extract(fields, '{path}')) NOT GLOB '*[^0-9.eE+-]*' "
+        f"THEN CAST(trim(json_extract(fields, '{path}')) AS REAL) END"
+    )
+
+
+def first_label(labels, value) -> str:
+    """The value of the first label present in the form entry"""
+    paths = [f'$."{label}"' for label in labels]
+    whens = ' '.join(f"WHEN json_type(fields, '{path}') IS NOT NULL THEN {value(path)}" for path in paths)
+    return f"CASE {whens} END"
+
+
+def upgrade() -> None:
+    for trigger in SEARCH_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS projects_fts")
+
+    op.create_table(
+        'project_requirements',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('project_id', sa.Integer(), sa.ForeignKey('projects.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('requirement_id', sa.Integer(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('part_type', sa.String(100)),
+        sa.Column('tag_number', sa.String(100)),
+        sa.Column('application', sa.String(200)),
+        sa.Column('motor_kw', sa.Float()),
+        sa.Column('torque_min_nm', sa.Float()),
+        sa.Column('torque_max_nm', sa.Float()),
+        sa.Column('service_factor', sa.Float()),
+        sa.Column('field_values', sa.JSON()),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_project_requirements_part_type', 'project_requirements', ['part_type'])
+    op.create_index('ix_project_requirements_application', 'project_requirements', ['application'])
+    op.create_index('ix_project_requirements_project_position', 'project_requirements', ['project_id', 'position'])
+    op.create_index('ix_project_requirements_project_requirement', 'project_requirements',
+                    ['project_id', 'requirement_id'])
+
+    typed = [
+        (column, first_label(labels, text_value)) for column, labels in TEXT_FIELDS.items()
+    ] + [
+        (column, first_label(labels, number_value)) for column, labels in NUMBER_FIELDS.items()
+    ]
+
+    op.execute(sa.text(f"""
+        INSERT INTO project_requirements
+            (project_id, requirement_id, position, part_type, field_values, created_at, updated_at,
+             {', '.join(column for column, _ in typed)})
+        SELECT project_id, requirement_id, position, part_type, fields, created_at, updated_at,
+               {', '.join(expression for _, expression in typed)}
+        FROM (
+            SELECT
+                p.id AS project_id,
+                CASE
+                    WHEN json_type(item.value, '$.id') IN ('integer', 'real')
+                        THEN CAST(json_extract(item.value, '$.id') AS INTEGER)
+                    WHEN json_type(item.value, '$.id') = 'text'
+                         AND trim(json_extract(item.value, '$.id')) GLOB '[0-9]*'
+                         AND trim(json_extract(item.value, '$.id')) NOT GLOB '*[^0-9]*'
+                        THEN CAST(trim(json_extract(item.value, '$.id')) AS INTEGER)
+                    ELSE item.key + 1
+                END AS requirement_id,
+                item.key + 1 AS position,
+                COALESCE(NULLIF(json_extract(item.value, '$.partType'), ''),
+                         NULLIF(json_extract(item.value, '$.part_type'), '')) AS part_type,
+                CASE WHEN json_type(item.value, '$.fieldValues') = 'object'
+                     THEN json_extract(item.value, '$.fieldValues') ELSE '{{}}' END AS fields,
+                COALESCE(p.created_at, CURRENT_TIMESTAMP) AS created_at,
+                COALESCE(p.updated_at, CURRENT_TIMESTAMP) AS updated_at
+            FROM projects AS p
+            JOIN json_each({requirements_array('p')}) AS item
+            WHERE item.type = 'object'
+            ORDER BY p.id, item.key
+        )
+    """))
+
+    # The rows are the source now; only unreadable legacy text is left in place
+    op.execute(f"UPDATE projects SET requirements_data = NULL WHERE ({requirements_array('projects')}) IS NOT NULL")
+
+
+def downgrade() -> None:
+    op.execute("""
+        UPDATE projects SET requirements_data = (
+            SELECT json_group_array(json_object(
+                'id', r.requirement_id, 'partType', COALESCE(r.part_type, ''),
+                'fieldValues', json(COALESCE(r.field_values, '{}'))))
+            FROM (SELECT * FROM project_requirements
+                  WHERE project_id = projects.id ORDER BY position, id) AS r
+        )
+        WHERE EXISTS (SELECT 1 FROM project_requirements WHERE project_id = projects.id)
+    """)
+    op.drop_table('project_requirements')
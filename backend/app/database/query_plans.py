@@ -0,0 +1,98 @@
+"""
+Query Plan Checks
+EXPLAIN QUERY PLAN guards for the hot analytics and dashboard queries
+"""
+import re
+from typing import Dict, List, NamedTuple, Tuple
+from sqlalchemy.orm import Session
+
+
+class HotQuery(NamedTuple):
+    """A registered query; index_scans names tables it may read in full through an index"""
+    sql: str
+    params: tuple = ()
+    index_scans: Tuple[str, ...] = ()
+
+
+# Kept in step with the paginated dashboard queries in project_api
+DASHBOARD_QUERIES: Dict[str, HotQuery] = {
+    "dashboard_recent_projects": HotQuery(
+        "SELECT id, quotation_number FROM projects ORDER BY updated_at DESC LIMIT ? OFFSET ?",
+        (10, 0),
+        index_scans=('projects',)
+    ),
+    "dashboard_projects_after_cursor": HotQuery(
+        "SELECT id, quotation_number FROM projects WHERE (updated_at, id) < (?, ?) "
+        "ORDER BY updated_at DESC, id DESC LIMIT ?",
+        ("2025-06-01 10:00:00", 100, 11)
+    ),
+}
+
+# The per-quote part type and commercial total subqueries group whole tables; that
+# is fine as long as they walk the quotation_number indexes instead of sorting
+QUOTE_SUBQUERY_SCANS = ('technical_quotations', 'commercial_quotations')
+
+# "SCAN <table>" reads every row (or every index entry); "SEARCH" uses an index lookup
+SCAN = re.compile(r"^SCAN (\w+)")
+INDEX_SCAN = re.compile(r"^SCAN \w+ USING (COVERING )?INDEX")
+TEMP_SORT = re.compile(r"USE TEMP B-TREE FOR (ORDER|GROUP) BY")
+
+
+def compiled_sql(query, dialect) -> str:
+    """SQL text of an ORM query with its parameters inlined, as the app sends it"""
+    return str(query.statement.compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+
+
+def analytics_queries(session: Session) -> Dict[str, HotQuery]:
+    """The analytics and export queries, compiled from the services that run them"""
+    from app.models.analytics_models import AnalyticsFilters
+    from app.services.analytics_service import AnalyticsService
+    from app.services.detail_export_service import DetailExportService
+
+    dialect = session.get_bind().dialect
+    analytics = AnalyticsService(session)
+    year = dict(date_filter="custom", start_date="2025-01-01", end_date="2025-12-31")
+    cases = {
+        "analytics_facts_date_range": analytics.quote_facts_query(AnalyticsFilters(**year)),
+        "analytics_facts_status_in_range": analytics.quote_facts_query(AnalyticsFilters(**year, quote_status="won")),
+        "analytics_facts_customer_in_range": analytics.quote_facts_query(AnalyticsFilters(**year, customer="ACME")),
+        "detail_export_quotes": DetailExportService(session).quote_query(AnalyticsFilters(**year)),
+    }
+    return {
+        name: HotQuery(compiled_sql(query, dialect), index_scans=QUOTE_SUBQUERY_SCANS)
+        for name, query in cases.items()
+    }
+
+
+def hot_queries(session: Session) -> Dict[str, HotQuery]:
+    """Every registered hot query"""
+    return {**analytics_queries(session), **DASHBOARD_QUERIES}
+
+
+def explain(connection, sql: str, params: tuple) -> List[str]:
+    """Return the EXPLAIN QUERY PLAN detail lines for a query"""
+    return [row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def plan_regressed(plan: List[str], query: HotQuery) -> bool:
+    """True if the plan scans a table it should search, or sorts in a temp B-tree"""
+    for line in plan:
+        if TEMP_SORT.search(line):
+            return True
+        scan = SCAN.match(line)
+        if scan and not (scan.group(1) in query.index_scans and INDEX_SCAN.match(line)):
+            return True
+    return False
+
+
+def check_query_plans(engine) -> Tuple[Dict[str, List[str]], List[str]]:
+    """Return every hot query's plan lines, and the names of those that regressed"""
+    plans, failures = {}, []
+    with engine.connect() as connection:
+        with Session(bind=connection) as session:
+            queries = hot_queries(session)
+        for name, query in queries.items():
+            plans[name] = explain(connection, query.sql, query.params)
+            if plan_regressed(plans[name], query):
+                failures.append(name)
+    return plans, failures
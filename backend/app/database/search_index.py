@@ -0,0 +1,111 @@
+"""
+Full-Text Search Index
+FTS5 trigram tables over projects and customers, kept in sync by triggers
+"""
+from typing import Optional
+from sqlalchemy import Integer, column, exc, text
+from app.utils.logger import setup_logger
+
+logger = setup_logger()
+
+# Trigram tokens need at least three characters; shorter terms fall back to LIKE
+MIN_TERM_LENGTH = 3
+
+# Part types and form field values of the project's requirements
+REQUIREMENTS_TEXT = (
+    "(SELECT group_concat(value, ' ') FROM ("
+    "SELECT r.part_type AS value FROM project_requirements AS r WHERE r.project_id = {row}.id "
+    "UNION ALL SELECT field.value FROM project_requirements AS r, json_tree("
+    "CASE WHEN json_valid(r.field_values) THEN r.field_values ELSE json_object() END) AS field "
+    "WHERE r.project_id = {row}.id AND field.atom IS NOT NULL))"
+)
+
+PROJECT_FTS_VALUES = (
+    "{row}.id, {row}.quotation_number, {row}.customer_name, " + REQUIREMENTS_TEXT
+)
+
+# Re-index one project (after any change to its requirements)
+REINDEX_PROJECT = (
+    "DELETE FROM projects_fts WHERE rowid = {project_id}; "
+    "INSERT INTO projects_fts(rowid, quotation_number, customer_name, requirements) "
+    "SELECT " + PROJECT_FTS_VALUES.format(row="projects") + " FROM projects WHERE projects.id = {project_id};"
+)
+
+SEARCH_INDEX_DDL = {
+    "projects_fts": [
+        "CREATE VIRTUAL TABLE projects_fts USING fts5("
+        "quotation_number, customer_name, requirements, tokenize='trigram')",
+        "CREATE TRIGGER projects_fts_insert AFTER INSERT ON projects BEGIN "
+        "INSERT INTO projects_fts(rowid, quotation_number, customer_name, requirements) "
+        "VALUES (" + PROJECT_FTS_VALUES.format(row="new") + "); END",
+        "CREATE TRIGGER projects_fts_update AFTER UPDATE OF quotation_number, customer_name "
+        "ON projects BEGIN " + REINDEX_PROJECT.format(project_id="new.id") + " END",
+        "CREATE TRIGGER projects_fts_delete AFTER DELETE ON projects BEGIN "
+        "DELETE FROM projects_fts WHERE rowid = old.id; END",
+        "CREATE TRIGGER projects_fts_requirement_insert AFTER INSERT ON project_requirements BEGIN "
+        + REINDEX_PROJECT.format(project_id="new.project_id") + " END",
+        "CREATE TRIGGER projects_fts_requirement_update AFTER UPDATE ON project_requirements BEGIN "
+        + REINDEX_PROJECT.format(project_id="new.project_id") + " END",
+        "CREATE TRIGGER projects_fts_requirement_delete AFTER DELETE ON project_requirements BEGIN "
+        + REINDEX_PROJECT.format(project_id="old.project_id") + " END",
+        "INSERT INTO projects_fts(rowid, quotation_number, customer_name, requirements) "
+        "SELECT " + PROJECT_FTS_VALUES.format(row="projects") + " FROM projects",
+    ],
+    "customers_fts": [
+        "CREATE VIRTUAL TABLE customers_fts USING fts5(name, tokenize='trigram')",
+        "CREATE TRIGGER customers_fts_insert AFTER INSERT ON customers BEGIN "
+        "INSERT INTO customers_fts(rowid, name) VALUES (new.id, new.name); END",
+        "CREATE TRIGGER customers_fts_update AFTER UPDATE OF name ON customers BEGIN "
+        "DELETE FROM customers_fts WHERE rowid = old.id; "
+        "INSERT INTO customers_fts(rowid, name) VALUES (new.id, new.name); END",
+        "CREATE TRIGGER customers_fts_delete AFTER DELETE ON customers BEGIN "
+        "DELETE FROM customers_fts WHERE rowid = old.id; END",
+        "INSERT INTO customers_fts(rowid, name) SELECT id, name FROM customers",
+    ],
+}
+
+_available = False
+
+
+def ensure_search_index(engine) -> bool:
+    """Create and populate any missing FTS table with its triggers; False if FTS5 is unavailable"""
+    global _available
+    try:
+        with engine.begin() as connection:
+            existing = {
+                row[0] for row in connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'table'")
+            }
+            for name, statements in SEARCH_INDEX_DDL.items():
+                if name not in existing:
+                    for statement in statements:
+                        connection.exec_driver_sql(statement)
+                    logger.info(f"Created search index {name}")
+        _available = True
+    except exc.OperationalError as e:
+        logger.warning(f"Full-text search unavailable, falling back to LIKE: {e}")
+        _available = False
+    return _available
+
+
+def match_phrase(term: str) -> Optional[str]:
+    """FTS5 MATCH expression for a substring search, or None when the index cannot serve it"""
+    term = (term or '').strip()
+    if not _available or len(term) < MIN_TERM_LENGTH:
+        return None
+    return '"' + term.replace('"', '""') + '"'
+
+
+def project_matches(phrase: str):
+    """Subquery of project ids whose indexed text contains the phrase"""
+    return text(
+        "SELECT rowid FROM projects_fts WHERE projects_fts MATCH :phrase"
+    ).bindparams(phrase=phrase).columns(column('rowid', Integer))
+
+
+def ranked_customer_ids(connection, term: str, phrase: str, limit: int) -> list:
+    """Customer ids matching the phrase, names starting with the term first, then by bm25 rank"""
+    rows = connection.execute(text(
+        "SELECT rowid FROM customers_fts WHERE customers_fts MATCH :phrase "
+        "ORDER BY (name LIKE :prefix) DESC, rank LIMIT :limit"
+    ), {'phrase': phrase, 'prefix': term.strip().replace('%', '').replace('_', '') + '%', 'limit': limit})
+    return [row[0] for row in rows]
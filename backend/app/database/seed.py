@@ -8,8 +8,8 @@ from app.utils.logger import setup_logger
 
 logger = setup_logger()
 
-def create_default_admin():
-    """Create default admin user"""
+def create_default_admin() -> bool:
+    """Create default admin user; False if it could not be created"""
     db = SessionLocal()
     
     try:
@@ -35,9 +35,11 @@ def create_default_admin():
             logger.info("   ⚠️  Please change password after first login!")
         else:
             logger.info("Admin user already exists")
+        return True
             
     except Exception as e:
         logger.error(f"Failed to create admin user: {e}")
         db.rollback()
+        return False
     finally:
         db.close()
\ No newline at end of file
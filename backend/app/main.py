@@ -1,30 +1,31 @@
-import eel
+import time
+STARTED = time.perf_counter()
+
 import sys
 import os
+import multiprocessing
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.database.connection import init_database
+from app.startup import run_app
 from app.utils.logger import setup_logger
-from app.api import auth_api, customer_api, quotation_api, analytics_api, project_api, commercial_quote_api, terms_api, technical_quote_api
 
 logger = setup_logger()
 
 def start_app():
     try:
         logger.info("Starting Ringspann Desktop")
-        init_database()
-        logger.info("Database initialized")
         
         # Get paths
         backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         frontend_path = os.path.join(os.path.dirname(backend_dir), 'frontend', 'dist')
         
-        eel.init(frontend_path)
         logger.info("Starting desktop application on port 8080")
         
-        eel.start(
-            'index.html',
+        # Database setup and API modules load after the window opens unless STARTUP_MODE=eager
+        run_app(
+            frontend_path,
+            STARTED,
             mode='chrome',
             host='localhost',
             port=8080,
@@ -37,11 +38,12 @@ def start_app():
                 '--window-size=1400,900',
                 '--app=http://localhost:8080'
             ],
-            block=True,
             close_callback=lambda *args: None
         )
     except Exception as e:
         logger.error(f"Failed to start: {e}")
 
 if __name__ == '__main__':
-    start_app()
\ No newline at end of file
+    # Needed for the PDF worker pool in frozen (PyInstaller) Windows builds
+    multiprocessing.freeze_support()
+    start_app()
@@ -5,14 +5,20 @@ from app.models.base import Base
 from app.models.user import User
 from app.models.customer import Customer
 from app.models.project import Project
+from app.models.project_requirement import ProjectRequirement
 from app.models.commercial_quotation import CommercialQuotation
+from app.models.commercial_quotation_item import CommercialQuotationItem
 from app.models.technical_quotation import TechnicalQuotation
+from app.models.analytics_rollup import AnalyticsRollup
 
 __all__ = [
     'Base',
     'User',
     'Customer', 
     'Project',
+    'ProjectRequirement',
     'CommercialQuotation',
-    'TechnicalQuotation'
+    'CommercialQuotationItem',
+    'TechnicalQuotation',
+    'AnalyticsRollup'
 ]
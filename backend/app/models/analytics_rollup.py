@@ -0,0 +1,35 @@
+"""
+Analytics Rollup Model
+Pre-aggregated monthly totals used by the analytics dashboards
+"""
+from sqlalchemy import Column, Integer, String, Float, DateTime, UniqueConstraint
+from app.models.base import Base
+
+# part_type value for rows that total the whole quote rather than one product
+ALL_PRODUCTS = '*'
+
+class AnalyticsRollup(Base):
+    __tablename__ = 'analytics_rollups'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Group key
+    month = Column(String(7), nullable=True, index=True)  # YYYY-MM of project creation
+    part_type = Column(String(100), nullable=False)  # Product name or ALL_PRODUCTS
+    customer_name = Column(String(200), nullable=False)
+    quote_status = Column(String(20), nullable=True)
+
+    # Aggregates
+    quote_count = Column(Integer, default=0)  # Projects in the group
+    tech_count = Column(Integer, default=0)  # Technical quotation rows
+    commercial_count = Column(Integer, default=0)  # Commercial quotation rows
+    total_amount = Column(Float, default=0.0)  # Sum of commercial total_amount
+    processing_hours = Column(Float, default=0.0)  # Sum of created -> updated hours
+    last_quote_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint('month', 'part_type', 'customer_name', 'quote_status', name='uq_analytics_rollup_key'),
+    )
+
+    def __repr__(self):
+        return f"<AnalyticsRollup {self.month} {self.part_type} {self.customer_name} {self.quote_status}>"
@@ -33,8 +33,14 @@ class CommercialQuotation(Base, TimestampMixin):
     tax_amount = Column(Float, default=0.0)
     total_amount = Column(Float, default=0.0)
     
+    # Bumped on every write, so an edit can check it was made against the current row
+    version = Column(Integer, nullable=False, default=1, server_default='1')
+    
     # Relationships
     project = relationship("Project", back_populates="commercial_quotations")
+    line_items = relationship("CommercialQuotationItem", back_populates="commercial_quotation", cascade="all, delete-orphan")
+    
+    __mapper_args__ = {'version_id_col': version}
     
     def __repr__(self):
         return f"<CommercialQuotation {self.quotation_number}>"
@@ -0,0 +1,27 @@
+"""
+Commercial Quotation Item Model
+"""
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Text
+from sqlalchemy.orm import relationship
+from app.models.base import Base
+
+class CommercialQuotationItem(Base):
+    __tablename__ = 'commercial_quotation_items'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    commercial_quotation_id = Column(Integer, ForeignKey('commercial_quotations.id', ondelete='CASCADE'), nullable=False, index=True)
+    quotation_number = Column(String(50), nullable=False, index=True)
+
+    # Line item fields (normalized copy of CommercialQuotation.items)
+    sr_no = Column(Integer)
+    part_type = Column(String(100))
+    description = Column(Text)
+    qty = Column(Float, default=0.0)
+    unit_price = Column(Float, default=0.0)
+    amount = Column(Float, default=0.0)
+
+    # Relationships
+    commercial_quotation = relationship("CommercialQuotation", back_populates="line_items")
+
+    def __repr__(self):
+        return f"<CommercialQuotationItem {self.quotation_number} #{self.sr_no}>"
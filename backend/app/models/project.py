@@ -1,7 +1,7 @@
 """
 Project Model
 """
-from sqlalchemy import Column, Integer, String, DateTime, Text, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, Enum as SQLEnum, ForeignKey, Index
 
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -32,11 +32,20 @@ class Project(Base):
     customer_id = Column(Integer, ForeignKey('customers.id'), nullable=True)
     status = Column(SQLEnum(ProjectStatus), default=ProjectStatus.draft)
     quote_status = Column(SQLEnum(QuoteStatus), default=QuoteStatus.budgetary, nullable=True)
-    requirements_data = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     customer = relationship("Customer", back_populates="projects")
     commercial_quotations = relationship("CommercialQuotation", back_populates="project")
-    technical_quotations = relationship("TechnicalQuotation", back_populates="project")
\ No newline at end of file
+    technical_quotations = relationship("TechnicalQuotation", back_populates="project")
+    requirements = relationship("ProjectRequirement", back_populates="project", order_by="ProjectRequirement.position",
+                                cascade="all, delete-orphan")
+
+    # Indexes for analytics date filters, dashboard ordering and per-status/customer grouping
+    __table_args__ = (
+        Index('ix_projects_created_at', 'created_at'),
+        Index('ix_projects_updated_at', 'updated_at'),
+        Index('ix_projects_quote_status_created_at', 'quote_status', 'created_at'),
+        Index('ix_projects_customer_name_created_at', 'customer_name', 'created_at'),
+    )
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Project Requirement Model
+"""
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, JSON, Index
+from sqlalchemy.orm import relationship
+from app.models.base import Base, TimestampMixin
+
+class ProjectRequirement(Base, TimestampMixin):
+    __tablename__ = 'project_requirements'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    project_id = Column(Integer, ForeignKey('projects.id', ondelete='CASCADE'), nullable=False)
+
+    # Row id from the requirements form (technical quotes link to it) and display order
+    requirement_id = Column(Integer, nullable=False)
+    position = Column(Integer, nullable=False, default=0)
+
+    # Common fields, copied out of field_values so analytics can filter and aggregate them
+    part_type = Column(String(100), index=True)
+    tag_number = Column(String(100))
+    application = Column(String(200), index=True)
+    motor_kw = Column(Float)
+    torque_min_nm = Column(Float)
+    torque_max_nm = Column(Float)
+    service_factor = Column(Float)
+
+    # Every form field as entered ({label: value}), the source for the typed columns
+    field_values = Column(JSON)
+
+    # Relationships
+    project = relationship("Project", back_populates="requirements")
+
+    __table_args__ = (
+        Index('ix_project_requirements_project_position', 'project_id', 'position'),
+        Index('ix_project_requirements_project_requirement', 'project_id', 'requirement_id'),
+    )
+
+    def __repr__(self):
+        return f"<ProjectRequirement {self.project_id} #{self.requirement_id} {self.part_type}>"
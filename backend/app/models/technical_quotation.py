@@ -1,7 +1,7 @@
 """
 Technical Quotation Model
 """
-from sqlalchemy import Column, Integer, String, ForeignKey, Text, JSON, UniqueConstraint
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, JSON, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from app.models.base import Base, TimestampMixin
 
@@ -30,13 +30,19 @@ class TechnicalQuotation(Base, TimestampMixin):
     # Additional data
     notes = Column(Text)
     
+    # Bumped on every write, so an edit can check it was made against the current row
+    version = Column(Integer, nullable=False, default=1, server_default='1')
+
     # Relationships
     project = relationship("Project", back_populates="technical_quotations")
 
     # Constraints
     __table_args__ = (
         UniqueConstraint('quotation_number', 'requirement_id', name='uq_quotation_requirement'),
+        Index('ix_technical_quotations_quotation_part_type', 'quotation_number', 'part_type'),
     )
 
+    __mapper_args__ = {'version_id_col': version}
+
     def __repr__(self):
         return f"<TechnicalQuotation {self.quotation_number} - {self.part_type}>"
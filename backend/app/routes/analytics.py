@@ -169,8 +169,19 @@ async def get_monthly_revenue_trend(
     db: Session = Depends(get_db)
 ):
     """Get monthly revenue trend for last N months"""
+    today = datetime.now()
+    start = today.replace(day=1)
+    for _ in range(months - 1):
+        start = (start - timedelta(days=1)).replace(day=1)
+    filters = AnalyticsFilters(
+        date_filter="custom",
+        start_date=start.strftime("%Y-%m-%d"),
+        end_date=today.strftime("%Y-%m-%d"),
+        quote_status=quote_status
+    )
+    
     service = AnalyticsService(db)
-    return service.get_monthly_revenue_trend(months, quote_status)
+    return service.get_monthly_revenue_trend(filters)
 
 
 @router.get("/finance/quote-value-distribution")
@@ -0,0 +1,83 @@
+"""
+Analytics Cache
+In-process LRU cache for analytics responses, invalidated by data writes
+"""
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, Optional
+from app.config import ANALYTICS_CACHE_SIZE
+from app.models.analytics_models import AnalyticsFilters
+from app.utils.logger import setup_logger
+
+logger = setup_logger()
+
+
+class AnalyticsCache:
+    """
+    Size-bounded LRU cache keyed by endpoint, filters and a data version.
+
+    Any write to projects or quotations bumps the version, so cached payloads
+    are only served while the underlying data is unchanged.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def make_key(self, name: str, filters: Optional[AnalyticsFilters] = None, *args) -> Hashable:
+        """Cache key for an endpoint call; includes today's date for relative ranges"""
+        filter_values = tuple(sorted(filters.model_dump().items())) if filters else ()
+        return (name, filter_values, args, date.today().isoformat())
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing and storing it on a miss"""
+        with self._lock:
+            version = self.version
+            entry_key = (version, key)
+            if entry_key in self._entries:
+                self._entries.move_to_end(entry_key)
+                self.hits += 1
+                return self._entries[entry_key]
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            # Skip storing if a write landed while computing
+            if self.version == version:
+                self._entries[entry_key] = value
+                self._entries.move_to_end(entry_key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+
+        return value
+
+    def invalidate(self):
+        """Bump the data version after a committed write"""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "version": self.version,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups * 100, 2) if lookups else 0.0
+            }
+
+
+analytics_cache = AnalyticsCache(ANALYTICS_CACHE_SIZE)
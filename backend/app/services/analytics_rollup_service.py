@@ -0,0 +1,143 @@
+"""
+Analytics Rollup Service
+Maintains the analytics_rollups summary table from projects and quotations
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from typing import List, Optional, Tuple
+from app.models import Project, CommercialQuotation, TechnicalQuotation, AnalyticsRollup
+from app.models.analytics_rollup import ALL_PRODUCTS
+from app.services.analytics_service import PART_TYPE_MAPPING
+from app.utils.logger import setup_logger
+
+logger = setup_logger()
+
+
+class AnalyticsRollupService:
+    """Keeps per (month, product, customer, status) aggregates in sync with writes"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_slice(self, quotation_number: str) -> Optional[Tuple[Optional[str], str]]:
+        """(month, customer_name) group a project currently belongs to"""
+        self.db.flush()
+        row = self.db.query(
+            func.strftime('%Y-%m', Project.created_at).label('month'),
+            Project.customer_name
+        ).filter(Project.quotation_number == quotation_number).first()
+        return (row.month, row.customer_name) if row else None
+
+    def refresh_quotation(self, quotation_number: str, previous_slice: Optional[Tuple[Optional[str], str]] = None):
+        """Recompute the rollups touched by a write to one quotation"""
+        slices = {previous_slice, self.get_slice(quotation_number)} - {None}
+        for month, customer_name in slices:
+            self.refresh_slice(month, customer_name)
+
+    def refresh_slice(self, month: Optional[str], customer_name: str):
+        """Replace the rollup rows of one (month, customer) group"""
+        self.db.flush()
+        self.db.query(AnalyticsRollup).filter(
+            AnalyticsRollup.month == month,
+            AnalyticsRollup.customer_name == customer_name
+        ).delete(synchronize_session=False)
+
+        self.db.add_all(self._aggregate(
+            func.strftime('%Y-%m', Project.created_at) == month,
+            Project.customer_name == customer_name
+        ))
+        self.db.flush()
+
+    def rebuild(self) -> int:
+        """Recompute every rollup row from scratch, returns the number of rows written"""
+        self.db.flush()
+        self.db.query(AnalyticsRollup).delete(synchronize_session=False)
+        rollups = self._aggregate()
+        self.db.add_all(rollups)
+        self.db.flush()
+        logger.info(f"Rebuilt {len(rollups)} analytics rollup rows")
+        return len(rollups)
+
+    def rebuild_if_empty(self) -> int:
+        """Build the rollups for databases created before the table existed"""
+        if self.db.query(AnalyticsRollup.id).first() or not self.db.query(Project.id).first():
+            return 0
+        return self.rebuild()
+
+    def _aggregate(self, *criteria) -> List[AnalyticsRollup]:
+        """Aggregate the projects matching criteria into rollup rows"""
+        projects = self.db.query(
+            Project.quotation_number,
+            Project.customer_name,
+            Project.quote_status,
+            Project.created_at,
+            Project.updated_at,
+            func.strftime('%Y-%m', Project.created_at).label('month')
+        ).filter(*criteria).all()
+
+        commercial = {
+            c.quotation_number: c
+            for c in self.db.query(
+                CommercialQuotation.quotation_number,
+                func.count(CommercialQuotation.id).label('commercial_count'),
+                func.coalesce(func.sum(CommercialQuotation.total_amount), 0).label('total_amount')
+            ).join(
+                Project, CommercialQuotation.quotation_number == Project.quotation_number
+            ).filter(*criteria).group_by(CommercialQuotation.quotation_number).all()
+        }
+
+        technical = self.db.query(
+            TechnicalQuotation.quotation_number,
+            TechnicalQuotation.part_type,
+            func.count(TechnicalQuotation.id).label('tech_count')
+        ).join(
+            Project, TechnicalQuotation.quotation_number == Project.quotation_number
+        ).filter(*criteria).group_by(
+            TechnicalQuotation.quotation_number, TechnicalQuotation.part_type
+        ).all()
+
+        # Technical row counts per quotation and product name (codes and names merged)
+        parts = {}
+        for t in technical:
+            product = PART_TYPE_MAPPING.get(t.part_type, t.part_type)
+            quote_parts = parts.setdefault(t.quotation_number, {})
+            quote_parts[product] = quote_parts.get(product, 0) + t.tech_count
+
+        groups = {}
+        for p in projects:
+            status = p.quote_status.value if hasattr(p.quote_status, 'value') else p.quote_status
+            processing_hours = (
+                (p.updated_at - p.created_at).total_seconds() / 3600
+                if p.created_at and p.updated_at else 0.0
+            )
+            quote_parts = parts.get(p.quotation_number, {})
+            quote_commercial = commercial.get(p.quotation_number)
+            commercial_count = quote_commercial.commercial_count if quote_commercial else 0
+            total_amount = float(quote_commercial.total_amount) if quote_commercial else 0.0
+
+            # One quote-level row plus one row per product quoted
+            for product, tech_count in [(ALL_PRODUCTS, sum(quote_parts.values()))] + list(quote_parts.items()):
+                key = (p.month, product, p.customer_name, status)
+                rollup = groups.get(key)
+                if rollup is None:
+                    rollup = groups[key] = AnalyticsRollup(
+                        month=p.month,
+                        part_type=product,
+                        customer_name=p.customer_name,
+                        quote_status=status,
+                        quote_count=0,
+                        tech_count=0,
+                        commercial_count=0,
+                        total_amount=0.0,
+                        processing_hours=0.0,
+                        last_quote_at=None
+                    )
+                rollup.quote_count += 1
+                rollup.tech_count += tech_count
+                rollup.commercial_count += commercial_count
+                rollup.total_amount += total_amount
+                rollup.processing_hours += processing_hours
+                if p.created_at and (rollup.last_quote_at is None or p.created_at > rollup.last_quote_at):
+                    rollup.last_quote_at = p.created_at
+
+        return list(groups.values())
@@ -4,14 +4,17 @@ Business logic and database queries for analytics
 """
 from warnings import filters
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, case, extract
+from sqlalchemy import func, and_, or_, case, extract, false
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, NamedTuple
+from collections import defaultdict
 from app.utils.logger import setup_logger
 
 logger = setup_logger()
 import json
-from app.models import Project, CommercialQuotation, TechnicalQuotation
+from app.models import Project, CommercialQuotation, CommercialQuotationItem, TechnicalQuotation, AnalyticsRollup
+from app.models.project import QuoteStatus
+from app.models.analytics_rollup import ALL_PRODUCTS
 from app.models.analytics_models import (
     AnalyticsFilters,
     ProductAnalyticsResponse,
@@ -40,6 +43,31 @@ PART_TYPE_MAPPING = {
     'Over Running Clutch': 'Over Running Clutch'
 }
 
+# Quote status columns used by the stacked status charts
+STATUS_ORDER = ['Budgetary', 'Active', 'Lost', 'Won']
+
+# Separator used when concatenating technical part types per quotation
+PART_TYPE_SEPARATOR = '\x1f'
+
+
+class QuoteFact(NamedTuple):
+    """One filtered project with its commercial totals and technical part types"""
+    quotation_number: str
+    customer_name: str
+    quote_status: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    part_types: Tuple[str, ...]  # product name per technical quotation row
+    amounts: Tuple[Optional[float], ...]  # total_amount per commercial quotation row
+
+    @property
+    def total_amount(self) -> float:
+        return sum(float(a or 0) for a in self.amounts)
+
+    @property
+    def month(self) -> Optional[str]:
+        return self.created_at.strftime('%Y-%m') if self.created_at else None
+
 
 class AnalyticsService:
     """Service for analytics calculations and queries"""
@@ -69,9 +97,10 @@ class AnalyticsService:
         return query
     
     def apply_status_filter(self, query, filters: AnalyticsFilters):
-        """Apply quote status filter"""
+        """Apply quote status filter; an unknown status matches no quotes, like filter_facts"""
         if filters.quote_status and filters.quote_status != "all":
-            query = query.filter(Project.quote_status == filters.quote_status)
+            status = QuoteStatus.__members__.get(filters.quote_status.lower())
+            query = query.filter(Project.quote_status == status if status else false())
         return query
     
     def apply_customer_filter(self, query, filters: AnalyticsFilters):
@@ -80,6 +109,15 @@ class AnalyticsService:
             query = query.filter(Project.customer_name == filters.customer)
         return query
     
+    def apply_product_filter(self, query, filters: AnalyticsFilters):
+        """Apply product filter without joining technical rows into the result"""
+        if filters.product_type and filters.product_type != "all":
+            part_types = {self.get_part_type_code(filters.product_type), self.get_part_type_name(filters.product_type)}
+            query = query.filter(Project.quotation_number.in_(
+                self.db.query(TechnicalQuotation.quotation_number).filter(TechnicalQuotation.part_type.in_(part_types))
+            ))
+        return query
+    
     def get_part_type_name(self, part_type: str) -> str:
         """Convert part type code to name"""
         return PART_TYPE_MAPPING.get(part_type, part_type)
@@ -90,16 +128,139 @@ class AnalyticsService:
         reverse_map = {v: k for k, v in PART_TYPE_MAPPING.items() if k.isdigit()}
         return reverse_map.get(product_name, product_name)
 
-    def parse_commercial_items(self, items_json: str) -> List[Dict[str, Any]]:
-        """Parse commercial quotation items JSON"""
-        try:
-            if not items_json:
-                return []
-            items = json.loads(items_json)
-            return items if isinstance(items, list) else []
-        except (json.JSONDecodeError, TypeError):
-            return []
-    
+    def quote_facts_query(self, filters: AnalyticsFilters):
+        """
+        One row per filtered project and commercial quotation, with the project's
+        technical part types. Date, status and customer filters are applied in SQL;
+        the product filter is applied by the builders since it works on technical rows.
+        """
+        part_types = self.db.query(
+            TechnicalQuotation.quotation_number.label('quotation_number'),
+            func.group_concat(TechnicalQuotation.part_type, PART_TYPE_SEPARATOR).label('part_types')
+        ).group_by(TechnicalQuotation.quotation_number).subquery()
+
+        columns = [
+            Project.quotation_number,
+            Project.customer_name,
+            Project.quote_status,
+            Project.created_at,
+            Project.updated_at,
+            CommercialQuotation.id.label('commercial_id'),
+            CommercialQuotation.total_amount,
+            part_types.c.part_types
+        ]
+
+        query = self.db.query(*columns).outerjoin(
+            CommercialQuotation, Project.quotation_number == CommercialQuotation.quotation_number
+        ).outerjoin(
+            part_types, Project.quotation_number == part_types.c.quotation_number
+        )
+
+        query = self.apply_date_filter(query, Project, filters)
+        query = self.apply_status_filter(query, filters)
+        return self.apply_customer_filter(query, filters)
+
+    def load_quote_facts(self, filters: AnalyticsFilters) -> List[QuoteFact]:
+        """
+        Load every filtered project once, together with its commercial totals
+        and technical part types, so chart builders can aggregate in memory.
+        """
+        facts: Dict[str, Dict[str, Any]] = {}
+        for r in self.quote_facts_query(filters).all():
+            fact = facts.get(r.quotation_number)
+            if fact is None:
+                status = r.quote_status.value if hasattr(r.quote_status, 'value') else r.quote_status
+                fact = facts[r.quotation_number] = {
+                    'quotation_number': r.quotation_number,
+                    'customer_name': r.customer_name,
+                    'quote_status': status,
+                    'created_at': r.created_at,
+                    'updated_at': r.updated_at,
+                    'part_types': tuple(
+                        self.get_part_type_name(pt) for pt in r.part_types.split(PART_TYPE_SEPARATOR)
+                    ) if r.part_types else (),
+                    'amounts': []
+                }
+            if r.commercial_id is not None:
+                fact['amounts'].append(r.total_amount)
+
+        return [
+            QuoteFact(**{**f, 'amounts': tuple(f['amounts'])})
+            for f in facts.values()
+        ]
+
+    def load_date_facts(self, filters: AnalyticsFilters) -> List[QuoteFact]:
+        """Facts for the date filter alone, for charts that re-apply the other filters per chart"""
+        return self.load_quote_facts(AnalyticsFilters(
+            date_filter=filters.date_filter,
+            start_date=filters.start_date,
+            end_date=filters.end_date
+        ))
+
+    def filter_facts(self, facts: List[QuoteFact], filters: AnalyticsFilters,
+                     status: bool = True, customer: bool = True, product: bool = True) -> List[QuoteFact]:
+        """Re-apply filters in memory to facts loaded with a wider filter set"""
+        product_name = self.get_product_filter_name(filters) if product else None
+        quote_status = filters.quote_status if status and filters.quote_status != "all" else None
+        customer_name = filters.customer if customer and filters.customer != "all" else None
+
+        return [
+            f for f in facts
+            if (not quote_status or (f.quote_status or '').lower() == quote_status.lower())
+            and (not customer_name or f.customer_name == customer_name)
+            and (not product_name or product_name in f.part_types)
+        ]
+
+    def get_product_filter_name(self, filters: AnalyticsFilters) -> Optional[str]:
+        """Product name selected in the filters, or None for all products"""
+        if filters.product_type and filters.product_type != "all":
+            return self.get_part_type_name(filters.product_type)
+        return None
+
+    def load_rollups(self, filters: AnalyticsFilters) -> Optional[List[AnalyticsRollup]]:
+        """
+        Load the pre-aggregated monthly rollup rows for the date filter.
+
+        Returns None when the range does not cover whole months (e.g. "today"),
+        in which case callers fall back to scanning the raw quotation rows.
+        """
+        query = self.db.query(AnalyticsRollup)
+
+        if filters.date_filter == "today":
+            return None
+
+        if filters.date_filter == "custom":
+            if filters.start_date:
+                start = datetime.strptime(filters.start_date, "%Y-%m-%d")
+                if start.day != 1:
+                    return None
+                query = query.filter(AnalyticsRollup.month >= start.strftime("%Y-%m"))
+            if filters.end_date:
+                end = datetime.strptime(filters.end_date, "%Y-%m-%d")
+                if (end + timedelta(days=1)).day != 1:
+                    return None
+                query = query.filter(AnalyticsRollup.month <= end.strftime("%Y-%m"))
+
+        return query.all()
+
+    def filter_rollups(self, rollups: List[AnalyticsRollup], filters: AnalyticsFilters, by_product: bool = False,
+                       status: bool = True, customer: bool = True, product: bool = True) -> List[AnalyticsRollup]:
+        """
+        Apply filters to rollup rows. Returns quote-level rows, or the per-product
+        rows when by_product is set or a product filter narrows the quotes.
+        """
+        product_name = self.get_product_filter_name(filters) if product else None
+        quote_status = filters.quote_status if status and filters.quote_status != "all" else None
+        customer_name = filters.customer if customer and filters.customer != "all" else None
+
+        return [
+            r for r in rollups
+            if (r.part_type != ALL_PRODUCTS if by_product else r.part_type == (product_name or ALL_PRODUCTS))
+            and (not product_name or r.part_type == product_name)
+            and (not quote_status or (r.quote_status or '').lower() == quote_status.lower())
+            and (not customer_name or r.customer_name == customer_name)
+        ]
+
     def calculate_change_percent(self, current: float, previous: float) -> tuple:
         """Calculate percentage change and direction"""
         if previous == 0:
@@ -116,11 +277,19 @@ class AnalyticsService:
     def get_product_analytics(self, filters: AnalyticsFilters) -> ProductAnalyticsResponse:
         """Get complete product analytics"""
         
-        # Get all required data
-        quotes_by_product = self.get_quotes_by_product(filters)
+        # Whole-month ranges read the rollups, anything else shares a single scan
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            product_rows = self.filter_rollups(rollups, filters, by_product=True)
+            quotes_by_product = self._rollup_quotes_by_product(product_rows)
+            product_trend = self._rollup_product_trend(product_rows)
+            status_breakdown = self._rollup_product_status_breakdown(product_rows)
+        else:
+            facts = self.load_quote_facts(filters)
+            quotes_by_product = self._build_quotes_by_product(facts, filters)
+            product_trend = self._build_product_trend(facts, filters)
+            status_breakdown = self._build_product_status_breakdown(facts, filters)
         revenue_by_product = self.get_revenue_by_product(filters)
-        product_trend = self.get_product_trend(filters)
-        status_breakdown = self.get_product_status_breakdown(filters)
         
         # Calculate KPIs
         total_quotes = sum(p['quote_count'] for p in revenue_by_product)
@@ -175,86 +344,131 @@ class AnalyticsService:
             total_records=total_quotes
         )
     
-    def get_quotes_by_product(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
-        """Get quote count by product type"""
-        query = self.db.query(
-            TechnicalQuotation.part_type,
-            func.count(TechnicalQuotation.id).label('quote_count')
-        ).join(
-            Project, TechnicalQuotation.quotation_number == Project.quotation_number
-        )
-
-        query = self.apply_date_filter(query, Project, filters)
-        query = self.apply_status_filter(query, filters)
-        query = self.apply_customer_filter(query, filters)
-
-        # Apply product_type filter
-        if filters.product_type and filters.product_type != "all":
-            part_code = self.get_part_type_code(filters.product_type)
-            query = query.filter(TechnicalQuotation.part_type == part_code)
-
-        query = query.group_by(TechnicalQuotation.part_type)
-    
-        results = query.all()
-        total = sum(r.quote_count for r in results)
+    def get_product_overview(self, filters: AnalyticsFilters) -> Dict[str, Any]:
+        """
+        Product tab payload: KPIs, quote counts, won revenue, trend, status breakdown
+        and the per-product performance table. A quote counts once for every product
+        it contains, with its full total, like the product x customer matrix.
+        """
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            quote_rows = [(r.quote_status, r.quote_count, r.total_amount) for r in self.filter_rollups(rollups, filters)]
+            product_rows = [
+                (r.part_type, r.customer_name, r.quote_status, r.month, r.quote_count, r.total_amount)
+                for r in self.filter_rollups(rollups, filters, by_product=True)
+            ]
+        else:
+            facts = self.filter_facts(self.load_quote_facts(filters), filters)
+            product_name = self.get_product_filter_name(filters)
+            quote_rows = [(f.quote_status, 1, f.total_amount) for f in facts]
+            product_rows = [
+                (product, f.customer_name, f.quote_status, f.month, 1, f.total_amount)
+                for f in facts for product in set(f.part_types)
+                if not product_name or product == product_name
+            ]
+        
+        return self._build_product_overview(quote_rows, product_rows)
     
-        return [
-        {
-            "product_type": self.get_part_type_name(r.part_type),
-            "quote_count": r.quote_count,
-            "revenue": 0.0,  # Add this
-            "avg_value": 0.0,  # Add this
-            "percentage": round((r.quote_count / total * 100), 2) if total > 0 else 0
+    def _build_product_overview(self, quote_rows, product_rows) -> Dict[str, Any]:
+        """Product tab payload from (status, count, amount) quote rows and per-product rows"""
+        total_quotes = sum(count for _, count, _ in quote_rows)
+        total_value = sum(amount for _, _, amount in quote_rows)
+        won_value = sum(amount for status, _, amount in quote_rows if status == 'Won')
+        
+        products = {}
+        for product, customer_name, status, _, count, amount in product_rows:
+            entry = products.setdefault(product, {'quote_count': 0, 'total': 0.0, 'won_revenue': 0.0, 'customers': set()})
+            entry['quote_count'] += count
+            entry['total'] += amount
+            entry['customers'].add(customer_name)
+            if status == 'Won':
+                entry['won_revenue'] += amount
+        
+        ranked = sorted(products.items(), key=lambda p: (-p[1]['quote_count'], p[0]))
+        won = sorted(((p, d['won_revenue']) for p, d in products.items() if d['won_revenue']), key=lambda p: (-p[1], p[0]))
+        total_won = sum(revenue for _, revenue in won)
+        
+        return {
+            'kpis': {
+                'total_quotes': {'label': 'Total Quotes', 'value': total_quotes, 'format_type': 'number'},
+                'total_revenue': {'label': 'Total Revenue (Won)', 'value': round(won_value, 2), 'format_type': 'currency'},
+                'avg_quote_value': {
+                    'label': 'Average Quote Value',
+                    'value': round(total_value / total_quotes, 2) if total_quotes else 0,
+                    'format_type': 'currency'
+                },
+                'most_quoted_product': {'label': 'Most Quoted Product', 'value': ranked[0][0] if ranked else 'N/A', 'format_type': 'text'},
+                'product_count': {'label': 'Active Products', 'value': len(products), 'format_type': 'number'}
+            },
+            'product_quotes': [{'product_type': p, 'quote_count': d['quote_count']} for p, d in ranked],
+            'revenue_contribution': [
+                {
+                    'product_type': p,
+                    'revenue': round(revenue, 2),
+                    'percentage': round(revenue / total_won * 100, 2) if total_won else 0
+                }
+                for p, revenue in won
+            ],
+            'product_trend': self._build_period_mix((month, p, count) for p, _, _, month, count, _ in product_rows),
+            'status_breakdown': sorted(
+                self._build_status_pivot(((p, status, count) for p, _, status, _, count, _ in product_rows), 'product_type'),
+                key=lambda x: (-x['total'], x['product_type'])
+            ),
+            'detailed_performance': sorted(
+                (
+                    {
+                        'product_type': p,
+                        'customer_count': len(d['customers']),
+                        'won_revenue': round(d['won_revenue'], 2),
+                        'percentage_of_total': round(d['total'] / total_value * 100, 2) if total_value else 0
+                    }
+                    for p, d in products.items()
+                ),
+                key=lambda x: (-x['won_revenue'], x['product_type'])
+            )
         }
-        for r in results
-    ]
     
-    def get_revenue_by_product(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
-        """Get revenue breakdown by product type"""
-
-        # Get all commercial quotations with filters
-        query = self.db.query(
-            CommercialQuotation.quotation_number,
-            CommercialQuotation.items,
-            CommercialQuotation.subtotal,
-            TechnicalQuotation.part_type
-        ).join(
-            Project, CommercialQuotation.quotation_number == Project.quotation_number
-        ).outerjoin(
-            TechnicalQuotation, CommercialQuotation.quotation_number == TechnicalQuotation.quotation_number
-        )
-
-        query = self.apply_date_filter(query, Project, filters)
-        query = self.apply_status_filter(query, filters)
-        query = self.apply_customer_filter(query, filters)
-
-        # Apply product_type filter
-        if filters.product_type and filters.product_type != "all":
-            part_code = self.get_part_type_code(filters.product_type)
-            query = query.filter(TechnicalQuotation.part_type == part_code)
-
-        quotations = query.all()
+    def _iter_part_rows(self, facts: List[QuoteFact], filters: AnalyticsFilters):
+        """Yield (fact, product) once per technical row matching the product filter"""
+        product_name = self.get_product_filter_name(filters)
+        for fact in facts:
+            for product in fact.part_types:
+                if not product_name or product == product_name:
+                    yield fact, product
+    
+    def _build_quotes_by_product(self, facts: List[QuoteFact], filters: AnalyticsFilters) -> List[Dict[str, Any]]:
+        """Quote count by product type from loaded facts"""
+        counts = defaultdict(int)
+        for _, product in self._iter_part_rows(facts, filters):
+            counts[product] += 1
         
-        # Parse items and aggregate by product
-        product_revenue = {}
+        return self._format_quote_counts(counts)
+    
+    def _rollup_quotes_by_product(self, product_rows: List[AnalyticsRollup]) -> List[Dict[str, Any]]:
+        """Quote count by product type from rollup rows"""
+        counts = defaultdict(int)
+        for r in product_rows:
+            counts[r.part_type] += r.tech_count
         
-        for quot in quotations:
-            items = self.parse_commercial_items(quot.items)
-            
-            for item in items:
-                product_name = item.get('description', 'Unknown')
-                amount = float(item.get('amount', 0))
-                
-                if product_name not in product_revenue:
-                    product_revenue[product_name] = {
-                        'revenue': 0,
-                        'quote_count': 0
-                    }
-                
-                product_revenue[product_name]['revenue'] += amount
-                product_revenue[product_name]['quote_count'] += 1
+        return self._format_quote_counts(counts)
+    
+    def _format_quote_counts(self, counts: Dict[str, int]) -> List[Dict[str, Any]]:
+        """Convert per-product quote counts to chart rows with percentages"""
+        total = sum(counts.values())
         
-        # Convert to list and calculate percentages
+        return [
+            {
+                "product_type": product,
+                "quote_count": count,
+                "revenue": 0.0,
+                "avg_value": 0.0,
+                "percentage": round((count / total * 100), 2) if total > 0 else 0
+            }
+            for product, count in sorted(counts.items(), key=lambda c: (-c[1], c[0]))
+        ]
+    
+    def _format_product_revenue(self, product_revenue: Dict[str, Dict[str, float]]) -> List[Dict[str, Any]]:
+        """Convert aggregated product revenue to sorted chart rows with percentages"""
         total_revenue = sum(p['revenue'] for p in product_revenue.values())
         
         result = []
@@ -270,103 +484,101 @@ class AnalyticsService:
                 "percentage": round(percentage, 2)
             })
         
-        # Sort by revenue descending
         result.sort(key=lambda x: x['revenue'], reverse=True)
-        
         return result
     
-    def get_product_trend(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
-        """Get product quotes trend over time"""
-
-        # Determine grouping (monthly or weekly based on date range)
-        query = self.db.query(
-            TechnicalQuotation.part_type,
-            func.strftime('%Y-%m', Project.created_at).label('period'),
-            func.count(TechnicalQuotation.id).label('quote_count')
-        ).join(
-            Project, TechnicalQuotation.quotation_number == Project.quotation_number
-        )
-
-        query = self.apply_date_filter(query, Project, filters)
-        query = self.apply_status_filter(query, filters)
-        query = self.apply_customer_filter(query, filters)
-
-        if filters.product_type and filters.product_type != "all":
-            part_code = self.get_part_type_code(filters.product_type)
-            query = query.filter(TechnicalQuotation.part_type == part_code)
-        
-        query = query.group_by(TechnicalQuotation.part_type, 'period').order_by('period')
-        
-        results = query.all()
-        
-        # Organize data by period with all products
+    def _build_product_trend(self, facts: List[QuoteFact], filters: AnalyticsFilters) -> List[Dict[str, Any]]:
+        """Monthly product quote counts from loaded facts"""
+        return self._build_period_mix((fact.month, product, 1) for fact, product in self._iter_part_rows(facts, filters))
+    
+    def _rollup_product_trend(self, product_rows: List[AnalyticsRollup]) -> List[Dict[str, Any]]:
+        """Monthly product quote counts from rollup rows"""
+        return self._build_period_mix((r.month, r.part_type, r.tech_count) for r in product_rows)
+    
+    def _build_period_mix(self, part_counts) -> List[Dict[str, Any]]:
+        """Pivot (period, product, count) rows into one dict per month with a count per product"""
         trend_data = {}
         products = set()
         
-        for r in results:
-            period = r.period
-            product = self.get_part_type_name(r.part_type)
+        for period, product, count in part_counts:
             products.add(product)
-            
-            if period not in trend_data:
-                trend_data[period] = {'period': period}
-            
-            trend_data[period][product] = r.quote_count
+            period_data = trend_data.setdefault(period, {'period': period})
+            period_data[product] = period_data.get(product, 0) + count
         
         # Fill in missing products with 0
         for period_data in trend_data.values():
             for product in products:
-                if product not in period_data:
-                    period_data[product] = 0
+                period_data.setdefault(product, 0)
         
-        # Convert to list
-        result = sorted(trend_data.values(), key=lambda x: x['period'])
+        return sorted(trend_data.values(), key=lambda x: x['period'] or '')
+    
+    def _build_product_status_breakdown(self, facts: List[QuoteFact], filters: AnalyticsFilters) -> List[Dict[str, Any]]:
+        """Product quote status breakdown from loaded facts"""
+        return self._build_status_pivot(
+            ((product, fact.quote_status, 1) for fact, product in self._iter_part_rows(facts, filters)),
+            'product_type'
+        )
+    
+    def _rollup_product_status_breakdown(self, product_rows: List[AnalyticsRollup]) -> List[Dict[str, Any]]:
+        """Product quote status breakdown from rollup rows"""
+        return self._build_status_pivot(
+            ((r.part_type, r.quote_status, r.tech_count) for r in product_rows),
+            'product_type'
+        )
+    
+    def _build_status_pivot(self, status_counts, key_field: str) -> List[Dict[str, Any]]:
+        """Pivot (key, status, count) rows into one dict per key with a count per status"""
+        breakdown = {}
+        for key, status, count in status_counts:
+            entry = breakdown.setdefault(key, {key_field: key, **{s: 0 for s in STATUS_ORDER}, 'total': 0})
+            if status:
+                entry[status] = entry.get(status, 0) + count
+            entry['total'] += count
         
-        return result
+        return [breakdown[key] for key in sorted(breakdown, key=lambda k: k or '')]
     
-    def get_product_status_breakdown(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
-        """Get product quote status breakdown"""
-
+    def get_quotes_by_product(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
+        """Get quote count by product type"""
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            return self._rollup_quotes_by_product(self.filter_rollups(rollups, filters, by_product=True))
+        return self._build_quotes_by_product(self.load_quote_facts(filters), filters)
+    
+    def get_revenue_by_product(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
+        """Get revenue breakdown by commercial line item description"""
+        description = func.coalesce(CommercialQuotationItem.description, 'Unknown')
         query = self.db.query(
-            TechnicalQuotation.part_type,
-            Project.quote_status,
-            func.count(TechnicalQuotation.id).label('count')
+            description.label('product_name'),
+            func.sum(CommercialQuotationItem.amount).label('revenue'),
+            func.count(CommercialQuotationItem.id).label('quote_count')
         ).join(
-            Project, TechnicalQuotation.quotation_number == Project.quotation_number
+            Project, CommercialQuotationItem.quotation_number == Project.quotation_number
         )
 
         query = self.apply_date_filter(query, Project, filters)
         query = self.apply_status_filter(query, filters)
         query = self.apply_customer_filter(query, filters)
+        query = self.apply_product_filter(query, filters)
 
-        # Apply product_type filter
-        if filters.product_type and filters.product_type != "all":
-            part_code = self.get_part_type_code(filters.product_type)
-            query = query.filter(TechnicalQuotation.part_type == part_code)
-
-        query = query.group_by(TechnicalQuotation.part_type, Project.quote_status)
-        
-        results = query.all()
-        
-        # Organize by product
-        breakdown = {}
-        for r in results:
-            product = self.get_part_type_name(r.part_type)
-            
-            if product not in breakdown:
-                breakdown[product] = {
-                    'product_type': product,
-                    'Budgetary': 0,
-                    'Active': 0,
-                    'Lost': 0,
-                    'Won': 0,
-                    'total': 0
-                }
-            
-            breakdown[product][r.quote_status] = r.count
-            breakdown[product]['total'] += r.count
-        
-        return list(breakdown.values())
+        product_revenue = {
+            r.product_name: {'revenue': float(r.revenue or 0), 'quote_count': r.quote_count}
+            for r in query.group_by(description).all()
+        }
+        return self._format_product_revenue(product_revenue)
+    
+    def get_product_trend(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
+        """Get product quotes trend over time"""
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            return self._rollup_product_trend(self.filter_rollups(rollups, filters, by_product=True))
+        return self._build_product_trend(self.load_quote_facts(filters), filters)
+    
+    def get_product_status_breakdown(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
+        """Get product quote status breakdown"""
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            return self._rollup_product_status_breakdown(self.filter_rollups(rollups, filters, by_product=True))
+        return self._build_product_status_breakdown(self.load_quote_facts(filters), filters)
     
     # Continued in next part...
     
@@ -382,36 +594,40 @@ class AnalyticsService:
     def get_finance_analytics(self, filters: AnalyticsFilters):
         """Get complete finance analytics"""
         
-        # Query WITHOUT items column to avoid JSON parsing errors
-        query = self.db.query(
-            CommercialQuotation.id,
-            CommercialQuotation.quotation_number,
-            CommercialQuotation.total_amount,
-            CommercialQuotation.created_at,
-            CommercialQuotation.updated_at,
-            Project.quote_status,
-            Project.customer_name,
-            Project.created_at.label('project_created_at')
-        ).join(
-            Project, CommercialQuotation.quotation_number == Project.quotation_number
-        )
-        
-        query = self.apply_date_filter(query, Project, filters)
-        query = self.apply_status_filter(query, filters)
-        query = self.apply_customer_filter(query, filters)
-        
-        results = query.all()
+        # Whole-month ranges read the rollups, anything else shares a single scan;
+        # revenue by status ignores the status filter
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            status_rows = self.filter_rollups(rollups, filters, product=False)
+            product_rows = self.filter_rollups(rollups, filters)
+            
+            # Calculate KPIs from commercial quotations
+            total_quoted_value = sum(r.total_amount for r in status_rows)
+            total_quotes = sum(r.commercial_count for r in status_rows)
+            
+            revenue_by_status_data = self._rollup_revenue_by_status(self.filter_rollups(rollups, filters, status=False))
+            
+            monthly_trend = self._rollup_monthly_revenue_trend(product_rows)
+            value_distribution = self.get_quote_value_distribution(filters)
+            inquiry_timeline = self._rollup_inquiry_timeline(product_rows)
+        else:
+            facts = self.load_quote_facts(filters.model_copy(update={'quote_status': 'all'}))
+            status_facts = self.filter_facts(facts, filters, product=False)
+            product_facts = self.filter_facts(facts, filters)
+            
+            # Calculate KPIs from commercial quotations
+            amounts = [float(a or 0) for f in status_facts for a in f.amounts]
+            total_quoted_value = sum(amounts)
+            total_quotes = len(amounts)
+            
+            revenue_by_status_data = self._build_revenue_by_status(self.filter_facts(facts, filters, status=False))
+            
+            monthly_trend = self._build_monthly_revenue_trend(product_facts)
+            value_distribution = self._build_quote_value_distribution(product_facts)
+            inquiry_timeline = self._build_inquiry_timeline(product_facts)
+        product_revenue = self.get_revenue_by_product(filters)
         
-        # Calculate KPIs from results
-        total_quoted_value = sum(float(r.total_amount or 0) for r in results)
-        total_quotes = len(results)
         avg_quote_value = total_quoted_value / total_quotes if total_quotes else 0
-        
-        # Get status breakdown for value by status
-        revenue_by_status_data = self.get_revenue_by_status(filters)
-        
-        # Get product revenue
-        product_revenue = self.get_revenue_by_product(filters)
         top_product_revenue = max(product_revenue, key=lambda x: x['revenue']) if product_revenue else None
         
         kpis = {
@@ -452,11 +668,6 @@ class AnalyticsService:
             }
         }
         
-        # Get charts data
-        monthly_trend = self.get_monthly_revenue_trend(filters)
-        value_distribution = self.get_quote_value_distribution(filters)
-        inquiry_timeline = self.get_inquiry_timeline(filters)
-        
         return {
             "kpis": kpis,
             "revenue_by_status": revenue_by_status_data,
@@ -469,110 +680,141 @@ class AnalyticsService:
             "total_records": total_quotes
         }
     
-    def get_revenue_by_status(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
-        """Get revenue breakdown by quote status"""
+    def _build_revenue_by_status(self, facts: List[QuoteFact]) -> List[Dict[str, Any]]:
+        """Commercial revenue by quote status from loaded facts"""
+        by_status = {}
+        for fact in facts:
+            for amount in fact.amounts:
+                by_status.setdefault(fact.quote_status, []).append(amount)
         
-        query = self.db.query(
-            Project.quote_status,
-            func.count(CommercialQuotation.id).label('quote_count'),
-            func.sum(CommercialQuotation.total_amount).label('total_revenue'),
-            func.avg(CommercialQuotation.total_amount).label('avg_revenue')
-        ).join(
-            CommercialQuotation, Project.quotation_number == CommercialQuotation.quotation_number
-        )
-        
-        query = self.apply_date_filter(query, Project, filters)
-        query = self.apply_customer_filter(query, filters)
-
-        if filters.product_type and filters.product_type != "all":
-            query = query.join(
-                TechnicalQuotation, Project.quotation_number == TechnicalQuotation.quotation_number
-            )
-            part_code = self.get_part_type_code(filters.product_type)
-            query = query.filter(TechnicalQuotation.part_type == part_code)
-
-        query = query.group_by(Project.quote_status)
-        
-        results = query.all()
+        result = []
+        for status in sorted(by_status, key=self._status_sort_key):
+            values = by_status[status]
+            non_null = [float(v) for v in values if v is not None]
+            result.append({
+                "label": status,
+                "value": sum(non_null),
+                "metadata": {
+                    "quote_count": len(values),
+                    "avg_revenue": sum(non_null) / len(non_null) if non_null else 0.0
+                }
+            })
+        return result
+    
+    def _rollup_revenue_by_status(self, rows: List[AnalyticsRollup]) -> List[Dict[str, Any]]:
+        """Commercial revenue by quote status from rollup rows"""
+        by_status = defaultdict(lambda: {'quote_count': 0, 'revenue': 0.0})
+        for r in rows:
+            by_status[r.quote_status]['quote_count'] += r.commercial_count
+            by_status[r.quote_status]['revenue'] += r.total_amount
         
         return [
-            {
-                "label": r.quote_status,
-                "value": float(r.total_revenue or 0),
+            self._format_revenue_point(status, by_status[status])
+            for status in sorted(by_status, key=self._status_sort_key)
+            if by_status[status]['quote_count']
+        ]
+    
+    def _status_sort_key(self, status: Optional[str]) -> int:
+        """Order quote statuses like the status filter, unknown ones last"""
+        return STATUS_ORDER.index(status) if status in STATUS_ORDER else len(STATUS_ORDER)
+    
+    def _build_monthly_revenue_trend(self, facts: List[QuoteFact]) -> List[Dict[str, Any]]:
+        """Monthly commercial revenue from loaded facts"""
+        monthly = {}
+        for fact in facts:
+            for amount in fact.amounts:
+                monthly.setdefault(fact.month, []).append(amount)
+        
+        result = []
+        for month in sorted(monthly, key=lambda m: m or ''):
+            values = monthly[month]
+            non_null = [float(v) for v in values if v is not None]
+            result.append({
+                "date": month,
+                "value": sum(non_null),
+                "label": month,
                 "metadata": {
-                    "quote_count": r.quote_count,
-                    "avg_revenue": float(r.avg_revenue or 0)
+                    "quote_count": len(values),
+                    "avg_revenue": sum(non_null) / len(non_null) if non_null else 0.0
                 }
+            })
+        return result
+    
+    def _rollup_monthly_revenue_trend(self, rows: List[AnalyticsRollup]) -> List[Dict[str, Any]]:
+        """Monthly commercial revenue from rollup rows"""
+        monthly = defaultdict(lambda: {'quote_count': 0, 'revenue': 0.0})
+        for r in rows:
+            monthly[r.month]['quote_count'] += r.commercial_count
+            monthly[r.month]['revenue'] += r.total_amount
+        
+        return [
+            {"date": month, **self._format_revenue_point(month, monthly[month])}
+            for month in sorted(monthly, key=lambda m: m or '')
+            if monthly[month]['quote_count']
+        ]
+    
+    def _format_revenue_point(self, label: Optional[str], data: Dict[str, float]) -> Dict[str, Any]:
+        """Chart point with summed revenue and quote count / average metadata"""
+        return {
+            "label": label,
+            "value": data['revenue'],
+            "metadata": {
+                "quote_count": data['quote_count'],
+                "avg_revenue": data['revenue'] / data['quote_count'] if data['quote_count'] else 0.0
             }
-            for r in results
+        }
+    
+    def _build_quote_value_distribution(self, facts: List[QuoteFact]) -> List[Dict[str, Any]]:
+        """Histogram of commercial quote values from loaded facts"""
+        return self._bin_quote_values([a for f in facts for a in f.amounts if a])
+    
+    def _build_inquiry_timeline(self, facts: List[QuoteFact]) -> List[Dict[str, Any]]:
+        """Commercial quotations per month from loaded facts"""
+        monthly_counts = defaultdict(int)
+        for fact in facts:
+            if fact.created_at:
+                monthly_counts[fact.month] += len(fact.amounts)
+        
+        return [
+            {"month": month, "count": count}
+            for month, count in sorted(monthly_counts.items())
+            if count
         ]
     
-    def get_monthly_revenue_trend(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
-        """Get monthly revenue trend"""
-
-        query = self.db.query(
-            func.strftime('%Y-%m', Project.created_at).label('month'),
-            func.count(CommercialQuotation.id).label('quote_count'),
-            func.sum(CommercialQuotation.total_amount).label('total_revenue'),
-            func.avg(CommercialQuotation.total_amount).label('avg_revenue')
-        ).join(
-            CommercialQuotation, Project.quotation_number == CommercialQuotation.quotation_number
-        )
-
-        # Apply ALL filters
-        query = self.apply_date_filter(query, Project, filters)
-        query = self.apply_status_filter(query, filters)
-        query = self.apply_customer_filter(query, filters)
-
-        # Apply product_type filter
-        if filters.product_type and filters.product_type != "all":
-            query = query.join(
-                TechnicalQuotation, Project.quotation_number == TechnicalQuotation.quotation_number
-            )
-            part_code = self.get_part_type_code(filters.product_type)
-            query = query.filter(TechnicalQuotation.part_type == part_code)
-
-        query = query.group_by('month').order_by('month')
-
-        results = query.all()
+    def _rollup_inquiry_timeline(self, rows: List[AnalyticsRollup]) -> List[Dict[str, Any]]:
+        """Commercial quotations per month from rollup rows"""
+        monthly_counts = defaultdict(int)
+        for r in rows:
+            if r.month:
+                monthly_counts[r.month] += r.commercial_count
         
         return [
-            {
-                "date": r.month,
-                "value": float(r.total_revenue or 0),
-                "label": r.month,
-                "metadata": {
-                    "quote_count": r.quote_count,
-                    "avg_revenue": float(r.avg_revenue or 0)
-                }
-            }
-            for r in results
+            {"month": month, "count": count}
+            for month, count in sorted(monthly_counts.items())
+            if count
         ]
     
+    def get_revenue_by_status(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
+        """Get revenue breakdown by quote status (ignores the status filter)"""
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            return self._rollup_revenue_by_status(self.filter_rollups(rollups, filters, status=False))
+        facts = self.load_quote_facts(filters.model_copy(update={'quote_status': 'all'}))
+        return self._build_revenue_by_status(self.filter_facts(facts, filters, status=False))
+    
+    def get_monthly_revenue_trend(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
+        """Get monthly revenue trend"""
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            return self._rollup_monthly_revenue_trend(self.filter_rollups(rollups, filters))
+        return self._build_monthly_revenue_trend(self.filter_facts(self.load_quote_facts(filters), filters))
+    
     def get_quote_value_distribution(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
-        """Get distribution of quote values (histogram data)"""
-
-        query = self.db.query(
-            CommercialQuotation.total_amount
-        ).join(
-            Project, CommercialQuotation.quotation_number == Project.quotation_number
-        )
-
-        # Apply ALL filters
-        query = self.apply_date_filter(query, Project, filters)
-        query = self.apply_status_filter(query, filters)
-        query = self.apply_customer_filter(query, filters)
-
-        # Apply product_type filter
-        if filters.product_type and filters.product_type != "all":
-            query = query.join(
-                TechnicalQuotation, Project.quotation_number == TechnicalQuotation.quotation_number
-            )
-            part_code = self.get_part_type_code(filters.product_type)
-            query = query.filter(TechnicalQuotation.part_type == part_code)
-
-        amounts = [r.total_amount for r in query.all() if r.total_amount]
-        
+        """Get distribution of quote values (histogram data; rollups do not keep single quote values)"""
+        return self._build_quote_value_distribution(self.filter_facts(self.load_quote_facts(filters), filters))
+    
+    def _bin_quote_values(self, amounts: List[float]) -> List[Dict[str, Any]]:
+        """Bucket quote values into 10 equal-width histogram bins"""
         if not amounts:
             return []
         
@@ -600,50 +842,10 @@ class AnalyticsService:
     
     def get_inquiry_timeline(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
         """Get inquiry to quotation timeline"""
-
-        # Use Project.created_at since inquiry_date doesn't exist
-        query = self.db.query(
-            Project.created_at,
-            CommercialQuotation.quotation_number
-        ).join(
-            CommercialQuotation, Project.quotation_number == CommercialQuotation.quotation_number
-        ).filter(
-            Project.created_at.isnot(None)
-        )
-
-        # Apply ALL filters
-        query = self.apply_date_filter(query, Project, filters)
-        query = self.apply_status_filter(query, filters)
-        query = self.apply_customer_filter(query, filters)
-
-        # Apply product_type filter
-        if filters.product_type and filters.product_type != "all":
-            query = query.join(
-                TechnicalQuotation, Project.quotation_number == TechnicalQuotation.quotation_number
-            )
-            part_code = self.get_part_type_code(filters.product_type)
-            query = query.filter(TechnicalQuotation.part_type == part_code)
-
-        results = query.all()
-        
-        # Group by month for timeline
-        from collections import defaultdict
-        monthly_counts = defaultdict(int)
-        
-        for r in results:
-            if r.created_at:
-                month_key = r.created_at.strftime("%Y-%m")
-                monthly_counts[month_key] += 1
-        
-        timeline_data = [
-            {
-                "month": month,
-                "count": count
-            }
-            for month, count in sorted(monthly_counts.items())
-        ]
-        
-        return timeline_data
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            return self._rollup_inquiry_timeline(self.filter_rollups(rollups, filters))
+        return self._build_inquiry_timeline(self.filter_facts(self.load_quote_facts(filters), filters))
     
     # ========================================================================
     # CUSTOMER ANALYTICS
@@ -652,41 +854,30 @@ class AnalyticsService:
     def get_customer_analytics(self, filters: AnalyticsFilters) -> CustomerAnalyticsResponse:
         """Get complete customer analytics"""
 
-        # Get customer summary
-        query = self.db.query(
-            Project.customer_name,
-            func.count(Project.id).label('quote_count'),
-            func.max(Project.created_at).label('last_quote_date')
-        )
-
-        # Apply product_type filter if needed
-        if filters.product_type and filters.product_type != "all":
-            query = query.join(
-                TechnicalQuotation, Project.quotation_number == TechnicalQuotation.quotation_number
-            )
-            part_code = self.get_part_type_code(filters.product_type)
-            query = query.filter(TechnicalQuotation.part_type == part_code)
-
-        query = query.group_by(Project.customer_name)
-
-        # Apply other filters
-        query = self.apply_date_filter(query, Project, filters)
-        query = self.apply_status_filter(query, filters)
-        query = self.apply_customer_filter(query, filters)
-
-        customers = query.all()
+        # Whole-month ranges read the rollups, anything else shares a single scan
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            rows = self.filter_rollups(rollups, filters)
+            customers = self._rollup_customer_summary(rows)
+            status_breakdown = self._rollup_customer_status_breakdown(rows, 10)
+            activity_timeline = self.get_customer_activity_timeline(filters)
+        else:
+            facts = self.filter_facts(self.load_quote_facts(filters), filters)
+            customers = self._build_customer_summary(facts)
+            status_breakdown = self._build_customer_status_breakdown(facts, 10)
+            activity_timeline = self._build_customer_activity_timeline(facts)
         
         total_customers = len(customers)
-        total_quotes = sum(c.quote_count for c in customers)
+        total_quotes = sum(c['quote_count'] for c in customers)
         
         # Get revenue data
-        top_by_revenue = self.get_top_customers(filters, "revenue", 10)
+        top_by_revenue = self._build_top_customers(customers, "revenue", 10)
         total_revenue = sum(c['revenue'] for c in top_by_revenue)
         avg_revenue_per_customer = total_revenue / total_customers if total_customers > 0 else 0
         
         # New vs Repeat customers
-        new_customers = len([c for c in customers if c.quote_count == 1])
-        repeat_customers = len([c for c in customers if c.quote_count > 1])
+        new_customers = len([c for c in customers if c['quote_count'] == 1])
+        repeat_customers = len([c for c in customers if c['quote_count'] > 1])
         
         kpis = {
             "total_customers": KPICard(
@@ -717,9 +908,7 @@ class AnalyticsService:
         }
         
         # Get charts data
-        top_by_count = self.get_top_customers(filters, "quote_count", 10)
-        status_breakdown = self.get_customer_status_breakdown(filters, 10)
-        activity_timeline = self.get_customer_activity_timeline(filters)
+        top_by_count = self._build_top_customers(customers, "quote_count", 10)
         
         new_vs_repeat = {
             "new": new_customers,
@@ -739,136 +928,101 @@ class AnalyticsService:
             total_records=total_customers
         )
     
-    def get_top_customers(self, filters: AnalyticsFilters, sort_by: str, limit: int) -> List[Dict[str, Any]]:
-        """Get top customers by revenue or quote count"""
-        
-        query = self.db.query(
-            Project.customer_name,
-            func.count(Project.id).label('quote_count'),
-            func.coalesce(func.sum(CommercialQuotation.total_amount), 0).label('total_revenue'),
-            func.max(Project.created_at).label('last_quote_date')
-        ).outerjoin(
-            CommercialQuotation, Project.quotation_number == CommercialQuotation.quotation_number
-        )
-        
-        query = self.apply_date_filter(query, Project, filters)
-        query = self.apply_status_filter(query, filters)
-        query = self.apply_customer_filter(query, filters)
-
-        if filters.product_type and filters.product_type != "all":
-            query = query.join(
-                TechnicalQuotation, Project.quotation_number == TechnicalQuotation.quotation_number
-            )
-            part_code = self.get_part_type_code(filters.product_type)
-            query = query.filter(TechnicalQuotation.part_type == part_code)
-
-        query = query.group_by(Project.customer_name)
-        
-        if sort_by == "revenue":
-            query = query.order_by(func.sum(CommercialQuotation.total_amount).desc())
-        else:
-            query = query.order_by(func.count(Project.id).desc())
-        
-        query = query.limit(limit)
-        
-        results = query.all()
-        
-        result_list = []
-        for r in results:
-            revenue = float(r.total_revenue or 0)
-            avg_deal = revenue / r.quote_count if r.quote_count > 0 else 0
-            
-            result_list.append({
-                "customer_name": r.customer_name,
-                "quote_count": r.quote_count,
-                "revenue": round(revenue, 2),
-                "avg_deal_size": round(avg_deal, 2),
-                "last_quote_date": r.last_quote_date.strftime("%Y-%m-%d") if r.last_quote_date else None
+    def _build_customer_summary(self, facts: List[QuoteFact]) -> List[Dict[str, Any]]:
+        """Per-customer quote count, revenue and last quote date from loaded facts"""
+        customers = {}
+        for fact in facts:
+            entry = customers.setdefault(fact.customer_name, {
+                'customer_name': fact.customer_name,
+                'quote_count': 0,
+                'revenue': 0.0,
+                'last_quote_date': None
+            })
+            entry['quote_count'] += 1
+            entry['revenue'] += fact.total_amount
+            if fact.created_at and (entry['last_quote_date'] is None or fact.created_at > entry['last_quote_date']):
+                entry['last_quote_date'] = fact.created_at
+        return list(customers.values())
+    
+    def _rollup_customer_summary(self, rows: List[AnalyticsRollup]) -> List[Dict[str, Any]]:
+        """Per-customer quote count, revenue and last quote date from rollup rows"""
+        customers = {}
+        for r in rows:
+            entry = customers.setdefault(r.customer_name, {
+                'customer_name': r.customer_name,
+                'quote_count': 0,
+                'revenue': 0.0,
+                'last_quote_date': None
             })
+            entry['quote_count'] += r.quote_count
+            entry['revenue'] += r.total_amount
+            if r.last_quote_at and (entry['last_quote_date'] is None or r.last_quote_at > entry['last_quote_date']):
+                entry['last_quote_date'] = r.last_quote_at
+        return list(customers.values())
+    
+    def _build_top_customers(self, customers: List[Dict[str, Any]], sort_by: str, limit: int) -> List[Dict[str, Any]]:
+        """Top customers by revenue or quote count from a customer summary"""
+        sort_key = 'revenue' if sort_by == "revenue" else 'quote_count'
+        ranked = sorted(customers, key=lambda c: c[sort_key], reverse=True)[:limit]
         
-        return result_list
+        return [
+            {
+                "customer_name": c['customer_name'],
+                "quote_count": c['quote_count'],
+                "revenue": round(c['revenue'], 2),
+                "avg_deal_size": round(c['revenue'] / c['quote_count'], 2) if c['quote_count'] > 0 else 0,
+                "last_quote_date": c['last_quote_date'].strftime("%Y-%m-%d") if c['last_quote_date'] else None
+            }
+            for c in ranked
+        ]
     
-    def get_customer_status_breakdown(self, filters: AnalyticsFilters, limit: int) -> List[Dict[str, Any]]:
-        """Get quote status breakdown per customer"""
-
-        query = self.db.query(
-            Project.customer_name,
-            Project.quote_status,
-            func.count(Project.id).label('count')
+    def _build_customer_status_breakdown(self, facts: List[QuoteFact], limit: int) -> List[Dict[str, Any]]:
+        """Quote status breakdown per customer from loaded facts"""
+        breakdown = self._build_status_pivot(
+            ((f.customer_name, f.quote_status, 1) for f in facts), 'customer_name'
         )
-
-        # Apply ALL filters
-        query = self.apply_date_filter(query, Project, filters)
-        query = self.apply_status_filter(query, filters)
-        query = self.apply_customer_filter(query, filters)
-
-        if filters.product_type and filters.product_type != "all":
-            query = query.join(
-                TechnicalQuotation, Project.quotation_number == TechnicalQuotation.quotation_number
-            )
-            part_code = self.get_part_type_code(filters.product_type)
-            query = query.filter(TechnicalQuotation.part_type == part_code)
-
-        query = query.group_by(Project.customer_name, Project.quote_status)
-        
-        results = query.all()
-        
-        # Organize by customer
-        breakdown = {}
-        for r in results:
-            if r.customer_name not in breakdown:
-                breakdown[r.customer_name] = {
-                    'customer_name': r.customer_name,
-                    'Budgetary': 0,
-                    'Active': 0,
-                    'Lost': 0,
-                    'Won': 0,
-                    'total': 0
-                }
-            
-            breakdown[r.customer_name][r.quote_status] = r.count
-            breakdown[r.customer_name]['total'] += r.count
-        
-        # Sort by total and limit
-        sorted_customers = sorted(breakdown.values(), key=lambda x: x['total'], reverse=True)
-        return sorted_customers[:limit]
+        return sorted(breakdown, key=lambda x: x['total'], reverse=True)[:limit]
     
-    def get_customer_activity_timeline(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
-        """Get customer activity timeline"""
-
-        query = self.db.query(
-            Project.customer_name,
-            Project.quotation_number,
-            Project.created_at,
-            Project.quote_status
+    def _rollup_customer_status_breakdown(self, rows: List[AnalyticsRollup], limit: int) -> List[Dict[str, Any]]:
+        """Quote status breakdown per customer from rollup rows"""
+        breakdown = self._build_status_pivot(
+            ((r.customer_name, r.quote_status, r.quote_count) for r in rows), 'customer_name'
         )
-
-        # Apply ALL filters
-        query = self.apply_date_filter(query, Project, filters)
-        query = self.apply_status_filter(query, filters)
-        query = self.apply_customer_filter(query, filters)
-
-        if filters.product_type and filters.product_type != "all":
-            query = query.join(
-                TechnicalQuotation, Project.quotation_number == TechnicalQuotation.quotation_number
-            )
-            part_code = self.get_part_type_code(filters.product_type)
-            query = query.filter(TechnicalQuotation.part_type == part_code)
-
-        query = query.order_by(Project.created_at.desc())
-
-        results = query.all()
-        
+        return sorted(breakdown, key=lambda x: x['total'], reverse=True)[:limit]
+    
+    def _build_customer_activity_timeline(self, facts: List[QuoteFact]) -> List[Dict[str, Any]]:
+        """Most recent first list of quotes from loaded facts"""
+        ordered = sorted(facts, key=lambda f: f.created_at or datetime.min, reverse=True)
         return [
             {
-                "customer_name": r.customer_name,
-                "quotation_number": r.quotation_number,
-                "date": r.created_at.strftime("%Y-%m-%d"),
-                "status": r.quote_status
+                "customer_name": f.customer_name,
+                "quotation_number": f.quotation_number,
+                "date": f.created_at.strftime("%Y-%m-%d") if f.created_at else None,
+                "status": f.quote_status
             }
-            for r in results
+            for f in ordered
         ]
     
+    def get_top_customers(self, filters: AnalyticsFilters, sort_by: str, limit: int) -> List[Dict[str, Any]]:
+        """Get top customers by revenue or quote count"""
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            customers = self._rollup_customer_summary(self.filter_rollups(rollups, filters))
+        else:
+            customers = self._build_customer_summary(self.filter_facts(self.load_quote_facts(filters), filters))
+        return self._build_top_customers(customers, sort_by, limit)
+    
+    def get_customer_status_breakdown(self, filters: AnalyticsFilters, limit: int) -> List[Dict[str, Any]]:
+        """Get quote status breakdown per customer"""
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            return self._rollup_customer_status_breakdown(self.filter_rollups(rollups, filters), limit)
+        return self._build_customer_status_breakdown(self.filter_facts(self.load_quote_facts(filters), filters), limit)
+    
+    def get_customer_activity_timeline(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
+        """Get customer activity timeline (single quotes, so always read from the facts)"""
+        return self._build_customer_activity_timeline(self.filter_facts(self.load_quote_facts(filters), filters))
+    
     # Continued in part 3...
     """
 Analytics Service - Part 3
@@ -882,12 +1036,31 @@ Combined Insights and Export functionality
     def get_combined_insights(self, filters: AnalyticsFilters) -> CombinedInsightsResponse:
         """Get combined insights across all views"""
         
-        product_customer_matrix = self.get_product_customer_matrix(filters, "quote_count")
-        top_combinations = self.get_top_product_customer_combinations(filters, 10)
-        funnel = self.get_quote_status_funnel(filters)
-        velocity = self.get_quote_velocity(12)
-        processing_time = self.get_avg_processing_time(filters)
-        product_mix = self.get_product_mix_trend(filters)
+        # Whole-month ranges read the rollups, anything else shares a single
+        # date-filtered scan; status filter re-applied per chart like the SQL versions
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            status_rows = self.filter_rollups(rollups, filters, customer=False, product=False)
+            status_product_rows = self.filter_rollups(rollups, filters, by_product=True, customer=False, product=False)
+            all_rows = self.filter_rollups(rollups, filters, status=False, customer=False, product=False)
+            all_product_rows = self.filter_rollups(rollups, filters, by_product=True, status=False, customer=False, product=False)
+            
+            product_customer_matrix = self._rollup_product_customer_matrix(status_product_rows, "quote_count")
+            top_combinations = self._rollup_top_product_customer_combinations(status_product_rows, 10)
+            funnel = self._rollup_quote_status_funnel(all_rows)
+            velocity = self.get_quote_velocity(12)
+            processing_time = self._rollup_avg_processing_time(status_rows)
+            product_mix = self._rollup_product_trend(all_product_rows)
+        else:
+            facts = self.load_date_facts(filters)
+            status_facts = self.filter_facts(facts, filters, customer=False, product=False)
+            
+            product_customer_matrix = self._build_product_customer_matrix(status_facts, "quote_count")
+            top_combinations = self._build_top_product_customer_combinations(status_facts, 10)
+            funnel = self._build_quote_status_funnel(facts)
+            velocity = self.get_quote_velocity(12)
+            processing_time = self._build_avg_processing_time(status_facts)
+            product_mix = self._build_product_mix_trend(facts)
         
         return CombinedInsightsResponse(
             product_customer_matrix=product_customer_matrix,
@@ -900,123 +1073,104 @@ Combined Insights and Export functionality
             data_timestamp=datetime.now()
         )
     
-    def get_product_customer_matrix(self, filters: AnalyticsFilters, metric: str) -> Dict[str, Any]:
-        """Get product × customer matrix"""
-        
-        if metric == "revenue":
-            # Get revenue data
-            query = self.db.query(
-                Project.customer_name,
-                TechnicalQuotation.part_type,
-                func.coalesce(func.sum(CommercialQuotation.total_amount), 0).label('value')
-            ).join(
-                TechnicalQuotation, Project.quotation_number == TechnicalQuotation.quotation_number
-            ).outerjoin(
-                CommercialQuotation, Project.quotation_number == CommercialQuotation.quotation_number
-            )
-        else:
-            # Get quote count
-            query = self.db.query(
-                Project.customer_name,
-                TechnicalQuotation.part_type,
-                func.count(TechnicalQuotation.id).label('value')
-            ).join(
-                TechnicalQuotation, Project.quotation_number == TechnicalQuotation.quotation_number
-            )
-        
-        query = self.apply_date_filter(query, Project, filters)
-        query = self.apply_status_filter(query, filters)
-        
-        query = query.group_by(Project.customer_name, TechnicalQuotation.part_type)
+    def _build_product_customer_matrix(self, facts: List[QuoteFact], metric: str) -> Dict[str, Any]:
+        """Product × customer matrix from loaded facts"""
+        matrix = defaultdict(lambda: defaultdict(float))
+        products = set()
         
-        results = query.all()
+        for fact in facts:
+            if metric == "revenue":
+                # Each quote's total counted once per product it contains
+                for product in set(fact.part_types):
+                    matrix[fact.customer_name][product] += fact.total_amount
+            else:
+                for product in fact.part_types:
+                    matrix[fact.customer_name][product] += 1
+            products.update(fact.part_types)
         
-        # Organize data
-        matrix = {}
-        customers = set()
+        return self._format_matrix(matrix, products, metric)
+    
+    def _rollup_product_customer_matrix(self, product_rows: List[AnalyticsRollup], metric: str) -> Dict[str, Any]:
+        """Product × customer matrix from rollup rows"""
+        matrix = defaultdict(lambda: defaultdict(float))
         products = set()
         
-        for r in results:
-            customer = r.customer_name
-            product = self.get_part_type_name(r.part_type)
-            value = float(r.value)
-            
-            customers.add(customer)
-            products.add(product)
-            
-            if customer not in matrix:
-                matrix[customer] = {}
-            
-            matrix[customer][product] = value
+        for r in product_rows:
+            matrix[r.customer_name][r.part_type] += r.total_amount if metric == "revenue" else r.tech_count
+            products.add(r.part_type)
         
-        # Fill missing values with 0
-        for customer in customers:
-            for product in products:
-                if product not in matrix[customer]:
-                    matrix[customer][product] = 0
+        return self._format_matrix(matrix, products, metric)
+    
+    def _format_matrix(self, matrix: Dict[str, Dict[str, float]], products: set, metric: str) -> Dict[str, Any]:
+        """Fill missing customer/product cells with 0 and sort the axes"""
+        data = {customer: {product: float(values.get(product, 0)) for product in products}
+                for customer, values in matrix.items()}
         
         return {
-            "customers": sorted(list(customers)),
-            "products": sorted(list(products)),
-            "data": matrix,
+            "customers": sorted(data.keys()),
+            "products": sorted(products),
+            "data": data,
             "metric": metric
         }
     
-    def get_top_product_customer_combinations(self, filters: AnalyticsFilters, limit: int) -> List[Dict[str, Any]]:
-        """Get top product-customer combinations"""
-        
-        query = self.db.query(
-            Project.customer_name,
-            TechnicalQuotation.part_type,
-            func.count(TechnicalQuotation.id).label('quote_count'),
-            func.coalesce(func.sum(CommercialQuotation.total_amount), 0).label('total_revenue')
-        ).join(
-            TechnicalQuotation, Project.quotation_number == TechnicalQuotation.quotation_number
-        ).outerjoin(
-            CommercialQuotation, Project.quotation_number == CommercialQuotation.quotation_number
-        )
-        
-        query = self.apply_date_filter(query, Project, filters)
-        query = self.apply_status_filter(query, filters)
-        
-        query = query.group_by(Project.customer_name, TechnicalQuotation.part_type)
-        query = query.order_by(func.count(TechnicalQuotation.id).desc())
-        query = query.limit(limit)
-        
-        results = query.all()
+    def _build_top_product_customer_combinations(self, facts: List[QuoteFact], limit: int) -> List[Dict[str, Any]]:
+        """Top customer/product pairs by technical quote count from loaded facts"""
+        combos = {}
+        for fact in facts:
+            for product in fact.part_types:
+                combo = combos.setdefault((fact.customer_name, product), {'quote_count': 0, 'revenue': 0.0})
+                combo['quote_count'] += 1
+            for product in set(fact.part_types):
+                combos[(fact.customer_name, product)]['revenue'] += fact.total_amount
+        
+        return self._format_combinations(combos, limit)
+    
+    def _rollup_top_product_customer_combinations(self, product_rows: List[AnalyticsRollup], limit: int) -> List[Dict[str, Any]]:
+        """Top customer/product pairs by technical quote count from rollup rows"""
+        combos = {}
+        for r in product_rows:
+            combo = combos.setdefault((r.customer_name, r.part_type), {'quote_count': 0, 'revenue': 0.0})
+            combo['quote_count'] += r.tech_count
+            combo['revenue'] += r.total_amount
+        
+        return self._format_combinations(combos, limit)
+    
+    def _format_combinations(self, combos: Dict[Tuple[str, str], Dict[str, float]], limit: int) -> List[Dict[str, Any]]:
+        """Rank (customer, product) pairs by quote count"""
+        ranked = sorted(combos.items(), key=lambda c: (-c[1]['quote_count'], c[0]))[:limit]
         
         return [
             {
-                "customer": r.customer_name,
-                "product": self.get_part_type_name(r.part_type),
-                "quote_count": r.quote_count,
-                "revenue": round(float(r.total_revenue or 0), 2)
+                "customer": customer,
+                "product": product,
+                "quote_count": data['quote_count'],
+                "revenue": round(data['revenue'], 2)
             }
-            for r in results
+            for (customer, product), data in ranked
         ]
     
-    def get_quote_status_funnel(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
-        """Get quote status funnel data"""
-        
-        query = self.db.query(
-            Project.quote_status,
-            func.count(Project.id).label('count'),
-            func.coalesce(func.sum(CommercialQuotation.total_amount), 0).label('value')
-        ).outerjoin(
-            CommercialQuotation, Project.quotation_number == CommercialQuotation.quotation_number
-        )
-        
-        query = self.apply_date_filter(query, Project, filters)
-        
-        query = query.group_by(Project.quote_status)
-        
-        results = query.all()
-        
-        # Define funnel order
+    def _build_quote_status_funnel(self, facts: List[QuoteFact]) -> List[Dict[str, Any]]:
+        """Quote count and value per funnel stage from loaded facts"""
+        funnel_data = defaultdict(lambda: {'count': 0, 'value': 0.0})
+        for fact in facts:
+            funnel_data[fact.quote_status]['count'] += 1
+            funnel_data[fact.quote_status]['value'] += fact.total_amount
+        
+        return self._format_funnel(funnel_data)
+    
+    def _rollup_quote_status_funnel(self, rows: List[AnalyticsRollup]) -> List[Dict[str, Any]]:
+        """Quote count and value per funnel stage from rollup rows"""
+        funnel_data = defaultdict(lambda: {'count': 0, 'value': 0.0})
+        for r in rows:
+            funnel_data[r.quote_status]['count'] += r.quote_count
+            funnel_data[r.quote_status]['value'] += r.total_amount
+        
+        return self._format_funnel(funnel_data)
+    
+    def _format_funnel(self, funnel_data: Dict[str, Dict[str, float]]) -> List[Dict[str, Any]]:
+        """Order funnel stages and fill missing ones with zeros"""
         funnel_order = ['Budgetary', 'Active', 'Won', 'Lost']
         
-        funnel_data = {r.quote_status: {'count': r.count, 'value': float(r.value or 0)} for r in results}
-        
         funnel = []
         for status in funnel_order:
             if status in funnel_data:
@@ -1034,6 +1188,59 @@ Combined Insights and Export functionality
         
         return funnel
     
+    def _build_product_mix_trend(self, facts: List[QuoteFact]) -> List[Dict[str, Any]]:
+        """Monthly technical rows per product from loaded facts, ignoring the product filter"""
+        return self._build_period_mix((f.month, product, 1) for f in facts for product in f.part_types)
+    
+    def _build_avg_processing_time(self, facts: List[QuoteFact]) -> Optional[float]:
+        """Average hours between creation and last update from loaded facts"""
+        time_diffs = [
+            (f.updated_at - f.created_at).total_seconds() / 3600
+            for f in facts if f.created_at and f.updated_at
+        ]
+        
+        if not time_diffs:
+            return None
+        
+        return round(sum(time_diffs) / len(time_diffs), 2)
+    
+    def _rollup_avg_processing_time(self, rows: List[AnalyticsRollup]) -> Optional[float]:
+        """Average hours between creation and last update from rollup rows"""
+        quote_count = sum(r.quote_count for r in rows)
+        if not quote_count:
+            return None
+        
+        return round(sum(r.processing_hours for r in rows) / quote_count, 2)
+    
+    def get_product_customer_matrix(self, filters: AnalyticsFilters, metric: str) -> Dict[str, Any]:
+        """Get product × customer matrix"""
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            return self._rollup_product_customer_matrix(
+                self.filter_rollups(rollups, filters, by_product=True, customer=False, product=False), metric
+            )
+        facts = self.filter_facts(self.load_date_facts(filters), filters, customer=False, product=False)
+        return self._build_product_customer_matrix(facts, metric)
+    
+    def get_top_product_customer_combinations(self, filters: AnalyticsFilters, limit: int) -> List[Dict[str, Any]]:
+        """Get top product-customer combinations"""
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            return self._rollup_top_product_customer_combinations(
+                self.filter_rollups(rollups, filters, by_product=True, customer=False, product=False), limit
+            )
+        facts = self.filter_facts(self.load_date_facts(filters), filters, customer=False, product=False)
+        return self._build_top_product_customer_combinations(facts, limit)
+    
+    def get_quote_status_funnel(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
+        """Get quote status funnel data"""
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            return self._rollup_quote_status_funnel(
+                self.filter_rollups(rollups, filters, status=False, customer=False, product=False)
+            )
+        return self._build_quote_status_funnel(self.load_date_facts(filters))
+    
     def get_quote_velocity(self, months: int) -> List[Dict[str, Any]]:
         """Get monthly quote velocity"""
         
@@ -1059,69 +1266,20 @@ Combined Insights and Export functionality
     
     def get_avg_processing_time(self, filters: AnalyticsFilters) -> Optional[float]:
         """Get average quote processing time (created to updated)"""
-        
-        query = self.db.query(
-            Project.created_at,
-            Project.updated_at
-        )
-        
-        query = self.apply_date_filter(query, Project, filters)
-        query = self.apply_status_filter(query, filters)
-        
-        results = query.all()
-        
-        if not results:
-            return None
-        
-        time_diffs = []
-        for r in results:
-            if r.created_at and r.updated_at:
-                diff = (r.updated_at - r.created_at).total_seconds() / 3600  # hours
-                time_diffs.append(diff)
-        
-        if not time_diffs:
-            return None
-        
-        return round(sum(time_diffs) / len(time_diffs), 2)
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            return self._rollup_avg_processing_time(self.filter_rollups(rollups, filters, customer=False, product=False))
+        facts = self.filter_facts(self.load_date_facts(filters), filters, customer=False, product=False)
+        return self._build_avg_processing_time(facts)
     
     def get_product_mix_trend(self, filters: AnalyticsFilters) -> List[Dict[str, Any]]:
         """Get product mix trend over time"""
-        
-        query = self.db.query(
-            func.strftime('%Y-%m', Project.created_at).label('period'),
-            TechnicalQuotation.part_type,
-            func.count(TechnicalQuotation.id).label('count')
-        ).join(
-            TechnicalQuotation, Project.quotation_number == TechnicalQuotation.quotation_number
-        )
-        
-        query = self.apply_date_filter(query, Project, filters)
-        
-        query = query.group_by('period', TechnicalQuotation.part_type).order_by('period')
-        
-        results = query.all()
-        
-        # Organize by period
-        mix_data = {}
-        products = set()
-        
-        for r in results:
-            period = r.period
-            product = self.get_part_type_name(r.part_type)
-            products.add(product)
-            
-            if period not in mix_data:
-                mix_data[period] = {'period': period}
-            
-            mix_data[period][product] = r.count
-        
-        # Fill missing products
-        for period_data in mix_data.values():
-            for product in products:
-                if product not in period_data:
-                    period_data[product] = 0
-        
-        return sorted(mix_data.values(), key=lambda x: x['period'])
+        rollups = self.load_rollups(filters)
+        if rollups is not None:
+            return self._rollup_product_trend(
+                self.filter_rollups(rollups, filters, by_product=True, status=False, customer=False, product=False)
+            )
+        return self._build_product_mix_trend(self.load_date_facts(filters))
     
     # ========================================================================
     # EXPORT FUNCTIONALITY
@@ -1129,9 +1287,6 @@ Combined Insights and Export functionality
     
     def export_analytics_data(self, view: str, format: str, filters: AnalyticsFilters, user_info: Dict[str, str]) -> Dict[str, Any]:
         """Export analytics data to Excel file with professional formatting"""
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-        from openpyxl.utils import get_column_letter
         from app.config import EXPORT_DIR
 
         # Support both CSV and Excel
@@ -1155,18 +1310,19 @@ Combined Insights and Export functionality
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
             if format == "xlsx":
+                from app.services.excel_export import streaming_workbook, StreamingSheet
                 filename = f"{view}_analytics_{timestamp}.xlsx"
                 filepath = EXPORT_DIR / filename
 
-                # Create Excel workbook with professional formatting
-                wb = Workbook()
-                ws = wb.active
-                ws.title = f"{view.title()} Analytics"
+                # Write-only workbook: rows stream to disk with shared named styles
+                wb = streaming_workbook()
+                sheet = StreamingSheet(wb, f"{view.title()} Analytics")
 
                 # Write Excel content with formatting
-                self._write_excel_content(ws, data, view, filters, user_info)
+                self._write_excel_content(sheet, data, view, filters, user_info)
 
                 # Save workbook
+                sheet.close()
                 wb.save(filepath)
             else:
                 # CSV export (legacy)
@@ -1192,37 +1348,8 @@ Combined Insights and Export functionality
             logger.error(traceback.format_exc())
             return {"success": False, "error": f"Export failed: {str(e)}"}
 
-    def _write_excel_content(self, ws, data: Any, view: str, filters: AnalyticsFilters, user_info: Dict[str, str]):
-        """Write professionally formatted Excel content with colors and styling"""
-        from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-        from openpyxl.utils import get_column_letter
-
-        # Color scheme - Professional Blue & Orange
-        HEADER_FILL = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")  # Dark Blue
-        SUBHEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")  # Medium Blue
-        SECTION_FILL = PatternFill(start_color="ED7D31", end_color="ED7D31", fill_type="solid")  # Orange
-        KPI_FILL = PatternFill(start_color="E2EFDA", end_color="E2EFDA", fill_type="solid")  # Light Green
-        DATA_HEADER_FILL = PatternFill(start_color="5B9BD5", end_color="5B9BD5", fill_type="solid")  # Light Blue
-        ALT_ROW_FILL = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")  # Light Gray
-
-        # Fonts
-        TITLE_FONT = Font(name='Calibri', size=18, bold=True, color="FFFFFF")
-        HEADER_FONT = Font(name='Calibri', size=14, bold=True, color="FFFFFF")
-        SECTION_FONT = Font(name='Calibri', size=12, bold=True, color="FFFFFF")
-        DATA_HEADER_FONT = Font(name='Calibri', size=11, bold=True, color="FFFFFF")
-        NORMAL_FONT = Font(name='Calibri', size=10)
-        BOLD_FONT = Font(name='Calibri', size=10, bold=True)
-
-        # Borders
-        THIN_BORDER = Border(
-            left=Side(style='thin'), right=Side(style='thin'),
-            top=Side(style='thin'), bottom=Side(style='thin')
-        )
-
-        # Center alignment
-        CENTER = Alignment(horizontal='center', vertical='center', wrap_text=True)
-        LEFT = Alignment(horizontal='left', vertical='center', wrap_text=True)
-        RIGHT = Alignment(horizontal='right', vertical='center')
+    def _write_excel_content(self, sheet, data: Any, view: str, filters: AnalyticsFilters, user_info: Dict[str, str]):
+        """Write professionally formatted Excel content using the report's named styles"""
 
         # Helper functions
         def get_data_field(data_obj, field_name):
@@ -1240,55 +1367,29 @@ Combined Insights and Export functionality
                 return item
             return {}
 
-        row = 1
+        full_width = [(1, 6)]
 
         # ========== COMPANY HEADER ==========
-        ws.merge_cells(f'A{row}:F{row}')
-        cell = ws[f'A{row}']
-        cell.value = "RINGSPANN POWER TRANSMISSION INDIA"
-        cell.font = TITLE_FONT
-        cell.fill = HEADER_FILL
-        cell.alignment = CENTER
-        row += 1
+        sheet.append(["RINGSPANN POWER TRANSMISSION INDIA"], style='report_title', merge=full_width)
 
         # Report Title
-        ws.merge_cells(f'A{row}:F{row}')
-        cell = ws[f'A{row}']
-        cell.value = f"{view.upper()} ANALYTICS EXPORT REPORT"
-        cell.font = HEADER_FONT
-        cell.fill = SUBHEADER_FILL
-        cell.alignment = CENTER
-        row += 1
+        sheet.append([f"{view.upper()} ANALYTICS EXPORT REPORT"], style='report_subtitle', merge=full_width)
 
         # User and Date Information
-        ws.merge_cells(f'A{row}:C{row}')
-        cell = ws[f'A{row}']
-        cell.value = f"Generated By: {user_info.get('name', 'System User')}"
-        cell.font = BOLD_FONT
-        cell.alignment = LEFT
-
-        ws.merge_cells(f'D{row}:F{row}')
-        cell = ws[f'D{row}']
-        cell.value = f"Region: {user_info.get('region', 'India')}"
-        cell.font = BOLD_FONT
-        cell.alignment = RIGHT
-        row += 1
-
-        ws.merge_cells(f'A{row}:F{row}')
-        cell = ws[f'A{row}']
-        cell.value = f"Generated On: {datetime.now().strftime('%d-%b-%Y %I:%M:%S %p')}"
-        cell.font = NORMAL_FONT
-        cell.alignment = CENTER
-        row += 2  # Extra spacing
+        sheet.append(
+            [f"Generated By: {user_info.get('name', 'System User')}", None, None,
+             f"Region: {user_info.get('region', 'India')}"],
+            styles=['report_label', None, None, 'report_label_right'],
+            merge=[(1, 3), (4, 6)]
+        )
+        sheet.append(
+            [f"Generated On: {datetime.now().strftime('%d-%b-%Y %I:%M:%S %p')}"],
+            style='report_note', merge=full_width
+        )
+        sheet.blank()  # Extra spacing
 
         # ========== FILTERS SECTION ==========
-        ws.merge_cells(f'A{row}:F{row}')
-        cell = ws[f'A{row}']
-        cell.value = "APPLIED FILTERS"
-        cell.font = SECTION_FONT
-        cell.fill = SECTION_FILL
-        cell.alignment = CENTER
-        row += 1
+        sheet.append(["APPLIED FILTERS"], style='report_section', merge=full_width)
 
         filters_applied = get_data_field(data, 'filters_applied') or {}
         filter_data = [
@@ -1306,36 +1407,18 @@ Combined Insights and Export functionality
             filter_data.append(['Customer', filters_applied.get('customer')])
 
         for filter_row in filter_data:
-            ws[f'A{row}'] = filter_row[0]
-            ws[f'A{row}'].font = BOLD_FONT
-            ws[f'B{row}'] = filter_row[1]
-            ws[f'B{row}'].font = NORMAL_FONT
-            row += 1
-        row += 1  # Extra spacing
+            sheet.append(filter_row, styles=['filter_name', 'filter_value'])
+        sheet.blank()  # Extra spacing
 
         # ========== KPIs SECTION ==========
         kpis = get_data_field(data, 'kpis') or {}
         if kpis:
-            ws.merge_cells(f'A{row}:F{row}')
-            cell = ws[f'A{row}']
-            cell.value = "KEY PERFORMANCE INDICATORS"
-            cell.font = SECTION_FONT
-            cell.fill = SECTION_FILL
-            cell.alignment = CENTER
-            row += 1
+            sheet.append(["KEY PERFORMANCE INDICATORS"], style='report_section', merge=full_width)
 
             # KPI Headers
-            ws[f'A{row}'] = "KPI"
-            ws[f'B{row}'] = "Value"
-            for col in ['A', 'B']:
-                ws[f'{col}{row}'].font = DATA_HEADER_FONT
-                ws[f'{col}{row}'].fill = DATA_HEADER_FILL
-                ws[f'{col}{row}'].alignment = CENTER
-                ws[f'{col}{row}'].border = THIN_BORDER
-            row += 1
-
-            kpi_row_start = row
-            for key, kpi_data in kpis.items():
+            sheet.append(["KPI", "Value"], style='data_header')
+
+            for index, (key, kpi_data) in enumerate(kpis.items()):
                 kpi_dict = to_dict(kpi_data)
                 value = kpi_dict.get('value', 0)
                 fmt = kpi_dict.get('format_type', 'text')
@@ -1347,71 +1430,32 @@ Combined Insights and Export functionality
                 else:
                     formatted_value = str(value)
 
-                ws[f'A{row}'] = kpi_dict.get('label', key)
-                ws[f'B{row}'] = formatted_value
-
                 # Alternating row colors
-                if (row - kpi_row_start) % 2 == 0:
-                    ws[f'A{row}'].fill = ALT_ROW_FILL
-                    ws[f'B{row}'].fill = ALT_ROW_FILL
-                else:
-                    ws[f'A{row}'].fill = KPI_FILL
-                    ws[f'B{row}'].fill = KPI_FILL
-
-                ws[f'A{row}'].font = BOLD_FONT
-                ws[f'B{row}'].font = NORMAL_FONT
-                ws[f'A{row}'].border = THIN_BORDER
-                ws[f'B{row}'].border = THIN_BORDER
-                ws[f'A{row}'].alignment = LEFT
-                ws[f'B{row}'].alignment = RIGHT
-                row += 1
-            row += 1  # Extra spacing
+                suffix = '_alt' if index % 2 == 0 else ''
+                sheet.append(
+                    [kpi_dict.get('label', key), formatted_value],
+                    styles=[f'kpi_label{suffix}', f'kpi_value{suffix}']
+                )
+            sheet.blank()  # Extra spacing
 
         # Continue with view-specific data sections...
         # This will be added in the next part
-        row = self._add_view_specific_data(ws, data, view, row, to_dict, get_data_field,
-                                           SECTION_FONT, SECTION_FILL, DATA_HEADER_FONT,
-                                           DATA_HEADER_FILL, NORMAL_FONT, ALT_ROW_FILL,
-                                           THIN_BORDER, CENTER, LEFT, RIGHT)
+        self._add_view_specific_data(sheet, data, view, to_dict, get_data_field)
 
         # ========== FOOTER ==========
-        row += 1
-        ws.merge_cells(f'A{row}:F{row}')
-        cell = ws[f'A{row}']
-        cell.value = f"Total Records: {get_data_field(data, 'total_records') or 'N/A'}"
-        cell.font = BOLD_FONT
-        cell.alignment = CENTER
-        row += 1
-
-        ws.merge_cells(f'A{row}:F{row}')
-        cell = ws[f'A{row}']
-        cell.value = "--- END OF REPORT ---"
-        cell.font = HEADER_FONT
-        cell.fill = HEADER_FILL
-        cell.alignment = CENTER
-
-        # Auto-size columns
-        for column in ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-            for cell in column:
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
-
-    def _add_view_specific_data(self, ws, data, view, row, to_dict, get_data_field,
-                                SECTION_FONT, SECTION_FILL, DATA_HEADER_FONT, DATA_HEADER_FILL,
-                                NORMAL_FONT, ALT_ROW_FILL, THIN_BORDER, CENTER, LEFT, RIGHT):
+        sheet.blank()
+        sheet.append(
+            [f"Total Records: {get_data_field(data, 'total_records') or 'N/A'}"],
+            style='report_total', merge=full_width
+        )
+        sheet.append(["--- END OF REPORT ---"], style='report_end', merge=full_width)
+
+    def _add_view_specific_data(self, sheet, data, view, to_dict, get_data_field):
         """Add view-specific data sections to Excel"""
-        from openpyxl.styles import Alignment
 
         # This method will handle the rest of the data export
-        # For now, return row to complete the structure
-        return row
+        # For now, the report ends after the KPIs
+        return sheet.row
 
     def _write_csv_content(self, writer, data: Any, view: str, filters: AnalyticsFilters):
         """Write comprehensive CSV content with multiple sections"""
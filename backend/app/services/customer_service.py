@@ -1,7 +1,7 @@
 """
 Customer Service
 """
-from app.database.connection import SessionLocal
+from app.database.connection import SessionLocal, WriterSession
 from app.models.customer import Customer
 
 class CustomerService:
@@ -16,7 +16,7 @@ class CustomerService:
     
     def create(self, data: dict):
         """Create customer"""
-        db = SessionLocal()
+        db = WriterSession()
         try:
             customer = Customer(**data)
             db.add(customer)
@@ -28,7 +28,7 @@ class CustomerService:
     
     def update(self, customer_id: int, data: dict):
         """Update customer"""
-        db = SessionLocal()
+        db = WriterSession()
         try:
             customer = db.query(Customer).filter(Customer.id == customer_id).first()
             if not customer:
@@ -45,7 +45,7 @@ class CustomerService:
     
     def delete(self, customer_id: int):
         """Delete customer"""
-        db = SessionLocal()
+        db = WriterSession()
         try:
             customer = db.query(Customer).filter(Customer.id == customer_id).first()
             if customer:
@@ -0,0 +1,250 @@
+"""
+Detail Export Service
+Row-per-quote, row-per-line-item and row-per-requirement exports of the filtered analytics dataset,
+read from the database in chunks and written to CSV/XLSX as they arrive
+"""
+import csv
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.config import EXPORT_DIR, EXPORT_CHUNK_SIZE
+from app.models import Project, ProjectRequirement, CommercialQuotation, CommercialQuotationItem, TechnicalQuotation
+from app.models.analytics_models import AnalyticsFilters
+from app.services.analytics_service import AnalyticsService, PART_TYPE_SEPARATOR
+from app.utils.logger import setup_logger
+
+logger = setup_logger()
+
+DETAIL_LEVELS = ('quote', 'line_item', 'requirement')
+
+QUOTE_HEADERS = [
+    'Quotation Number', 'Customer', 'Quote Status', 'Created At', 'Updated At',
+    'Products', 'Commercial Quotes', 'Subtotal (₹)', 'Tax (₹)', 'Total (₹)'
+]
+
+LINE_ITEM_HEADERS = [
+    'Quotation Number', 'Customer', 'Quote Status', 'Created At',
+    'Sr No', 'Part Type', 'Description', 'Qty', 'Unit Price (₹)', 'Amount (₹)'
+]
+
+REQUIREMENT_HEADERS = [
+    'Quotation Number', 'Customer', 'Quote Status', 'Created At',
+    'Sr No', 'Part Type', 'Tag Number', 'Application', 'Motor (kW)',
+    'Torque Min (Nm)', 'Torque Max (Nm)', 'Service Factor'
+]
+
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class DetailExportService:
+    """Streams filtered quote and line item rows without loading ORM objects"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.analytics = AnalyticsService(db)
+
+    def apply_filters(self, query, filters: AnalyticsFilters):
+        """Apply every analytics filter to a query over Project"""
+        query = self.analytics.apply_date_filter(query, Project, filters)
+        query = self.analytics.apply_status_filter(query, filters)
+        query = self.analytics.apply_customer_filter(query, filters)
+        return self.analytics.apply_product_filter(query, filters)
+
+    def quote_query(self, filters: AnalyticsFilters):
+        """One row per filtered project with its part types and summed commercial totals"""
+        part_types = self.db.query(
+            TechnicalQuotation.quotation_number.label('quotation_number'),
+            func.group_concat(TechnicalQuotation.part_type, PART_TYPE_SEPARATOR).label('part_types')
+        ).group_by(TechnicalQuotation.quotation_number).subquery()
+
+        totals = self.db.query(
+            CommercialQuotation.quotation_number.label('quotation_number'),
+            func.count(CommercialQuotation.id).label('commercial_count'),
+            func.sum(CommercialQuotation.subtotal).label('subtotal'),
+            func.sum(CommercialQuotation.tax_amount).label('tax_amount'),
+            func.sum(CommercialQuotation.total_amount).label('total_amount')
+        ).group_by(CommercialQuotation.quotation_number).subquery()
+
+        query = self.db.query(
+            Project.quotation_number,
+            Project.customer_name,
+            Project.quote_status,
+            Project.created_at,
+            Project.updated_at,
+            part_types.c.part_types,
+            totals.c.commercial_count,
+            totals.c.subtotal,
+            totals.c.tax_amount,
+            totals.c.total_amount
+        ).outerjoin(
+            part_types, Project.quotation_number == part_types.c.quotation_number
+        ).outerjoin(
+            totals, Project.quotation_number == totals.c.quotation_number
+        )
+        return self.apply_filters(query, filters).order_by(Project.created_at, Project.id)
+
+    def line_item_query(self, filters: AnalyticsFilters):
+        """One row per commercial line item of the filtered projects"""
+        query = self.db.query(
+            Project.quotation_number,
+            Project.customer_name,
+            Project.quote_status,
+            Project.created_at,
+            CommercialQuotationItem.sr_no,
+            CommercialQuotationItem.part_type,
+            CommercialQuotationItem.description,
+            CommercialQuotationItem.qty,
+            CommercialQuotationItem.unit_price,
+            CommercialQuotationItem.amount
+        ).join(
+            CommercialQuotationItem, CommercialQuotationItem.quotation_number == Project.quotation_number
+        )
+        return self.apply_filters(query, filters).order_by(
+            Project.created_at, Project.id, CommercialQuotationItem.commercial_quotation_id, CommercialQuotationItem.id
+        )
+
+    def requirement_query(self, filters: AnalyticsFilters):
+        """One row per customer requirement of the filtered projects"""
+        query = self.db.query(
+            Project.quotation_number,
+            Project.customer_name,
+            Project.quote_status,
+            Project.created_at,
+            ProjectRequirement.position,
+            ProjectRequirement.part_type,
+            ProjectRequirement.tag_number,
+            ProjectRequirement.application,
+            ProjectRequirement.motor_kw,
+            ProjectRequirement.torque_min_nm,
+            ProjectRequirement.torque_max_nm,
+            ProjectRequirement.service_factor
+        ).join(
+            ProjectRequirement, ProjectRequirement.project_id == Project.id
+        )
+        return self.apply_filters(query, filters).order_by(
+            Project.created_at, Project.id, ProjectRequirement.position, ProjectRequirement.id
+        )
+
+    def iter_rows(self, level: str, filters: AnalyticsFilters,
+                  chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[List[Any]]:
+        """Export rows for the level, fetched chunk_size rows at a time"""
+        if level == 'quote':
+            for r in self.quote_query(filters).yield_per(chunk_size):
+                yield [
+                    r.quotation_number,
+                    r.customer_name,
+                    self._status(r.quote_status),
+                    self._datetime(r.created_at),
+                    self._datetime(r.updated_at),
+                    '; '.join(dict.fromkeys(
+                        self.analytics.get_part_type_name(pt) for pt in r.part_types.split(PART_TYPE_SEPARATOR)
+                    )) if r.part_types else '',
+                    r.commercial_count or 0,
+                    round(r.subtotal or 0, 2),
+                    round(r.tax_amount or 0, 2),
+                    round(r.total_amount or 0, 2)
+                ]
+        elif level == 'requirement':
+            for r in self.requirement_query(filters).yield_per(chunk_size):
+                yield [
+                    r.quotation_number,
+                    r.customer_name,
+                    self._status(r.quote_status),
+                    self._datetime(r.created_at),
+                    r.position,
+                    self.analytics.get_part_type_name(r.part_type) if r.part_type else '',
+                    r.tag_number or '',
+                    r.application or '',
+                    r.motor_kw,
+                    r.torque_min_nm,
+                    r.torque_max_nm,
+                    r.service_factor
+                ]
+        else:
+            for r in self.line_item_query(filters).yield_per(chunk_size):
+                yield [
+                    r.quotation_number,
+                    r.customer_name,
+                    self._status(r.quote_status),
+                    self._datetime(r.created_at),
+                    r.sr_no,
+                    self.analytics.get_part_type_name(r.part_type) if r.part_type else '',
+                    r.description or '',
+                    r.qty or 0,
+                    round(r.unit_price or 0, 2),
+                    round(r.amount or 0, 2)
+                ]
+
+    def export(self, level: str, format: str, filters: AnalyticsFilters,
+               idle: Optional[Callable[[], None]] = None,
+               chunk_size: int = EXPORT_CHUNK_SIZE) -> Dict[str, Any]:
+        """
+        Write the detail rows to EXPORT_DIR as CSV or XLSX. idle runs after every
+        chunk so a cooperative caller can yield while large exports are written.
+        """
+        if level not in DETAIL_LEVELS:
+            return {"success": False, "error": "Invalid detail level"}
+        if format not in ["csv", "xlsx"]:
+            return {"success": False, "error": "Only CSV and Excel exports are supported"}
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f"{level}_details_{timestamp}.{format}"
+        filepath = EXPORT_DIR / filename
+        headers = {'quote': QUOTE_HEADERS, 'line_item': LINE_ITEM_HEADERS, 'requirement': REQUIREMENT_HEADERS}[level]
+        rows = self.iter_rows(level, filters, chunk_size)
+
+        try:
+            if format == "xlsx":
+                count = self._write_xlsx(filepath, f"{level.replace('_', ' ').title()} Details",
+                                         headers, rows, idle, chunk_size)
+            else:
+                count = self._write_csv(filepath, headers, rows, idle, chunk_size)
+        except Exception as e:
+            logger.error(f"Detail export error: {e}")
+            filepath.unlink(missing_ok=True)
+            return {"success": False, "error": f"Export failed: {str(e)}"}
+
+        logger.info(f"Exported {count} {level} rows to {filename}")
+        return {
+            "success": True,
+            "message": f"{count} rows exported successfully to {filename}",
+            "filename": filename,
+            "filepath": str(filepath),
+            "rows": count,
+            "generated_at": datetime.now().isoformat()
+        }
+
+    def _write_csv(self, filepath, headers, rows, idle, chunk_size) -> int:
+        count = 0
+        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(headers)
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+                if idle and count % chunk_size == 0:
+                    idle()
+        return count
+
+    def _write_xlsx(self, filepath, title, headers, rows, idle, chunk_size) -> int:
+        from app.services.excel_export import streaming_workbook, StreamingSheet
+
+        wb = streaming_workbook()
+        sheet = StreamingSheet(wb, title)
+        sheet.append(headers, style='data_header')
+        count = 0
+        for row in rows:
+            sheet.append(row, style='data_cell_alt' if count % 2 else 'data_cell')
+            count += 1
+            if idle and count % chunk_size == 0:
+                idle()
+        sheet.close()
+        wb.save(filepath)
+        return count
+
+    def _status(self, status) -> str:
+        return status.value if hasattr(status, 'value') else (status or '')
+
+    def _datetime(self, value) -> str:
+        return value.strftime(DATETIME_FORMAT) if value else ''
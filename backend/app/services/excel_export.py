@@ -0,0 +1,158 @@
+"""
+Excel Export
+Streaming (write-only) workbook writing with shared named styles and column
+widths measured while the rows are written
+"""
+from copy import copy
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+# Rows held in memory before the column widths are fixed. Write-only sheets must
+# declare widths before their first row, so later rows no longer widen columns.
+WIDTH_SAMPLE_ROWS = 500
+MAX_COLUMN_WIDTH = 50
+
+# Color scheme - Professional Blue & Orange
+HEADER_COLOR = "1F4E78"       # Dark Blue
+SUBHEADER_COLOR = "4472C4"    # Medium Blue
+SECTION_COLOR = "ED7D31"      # Orange
+KPI_COLOR = "E2EFDA"          # Light Green
+DATA_HEADER_COLOR = "5B9BD5"  # Light Blue
+ALT_ROW_COLOR = "F2F2F2"      # Light Gray
+
+
+def _fill(color: str) -> PatternFill:
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+
+def report_styles() -> List[NamedStyle]:
+    """Named styles of the analytics reports (new objects, since a style binds to one workbook)"""
+    title_font = Font(name='Calibri', size=18, bold=True, color="FFFFFF")
+    header_font = Font(name='Calibri', size=14, bold=True, color="FFFFFF")
+    section_font = Font(name='Calibri', size=12, bold=True, color="FFFFFF")
+    data_header_font = Font(name='Calibri', size=11, bold=True, color="FFFFFF")
+    normal_font = Font(name='Calibri', size=10)
+    bold_font = Font(name='Calibri', size=10, bold=True)
+
+    thin = Side(style='thin')
+    thin_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+
+    center = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    left = Alignment(horizontal='left', vertical='center', wrap_text=True)
+    right = Alignment(horizontal='right', vertical='center')
+
+    return [
+        NamedStyle('report_title', font=title_font, fill=_fill(HEADER_COLOR), alignment=center),
+        NamedStyle('report_subtitle', font=header_font, fill=_fill(SUBHEADER_COLOR), alignment=center),
+        NamedStyle('report_end', font=header_font, fill=_fill(HEADER_COLOR), alignment=center),
+        NamedStyle('report_section', font=section_font, fill=_fill(SECTION_COLOR), alignment=center),
+        NamedStyle('report_label', font=bold_font, alignment=left),
+        NamedStyle('report_label_right', font=bold_font, alignment=right),
+        NamedStyle('report_note', font=normal_font, alignment=center),
+        NamedStyle('report_total', font=bold_font, alignment=center),
+        NamedStyle('filter_name', font=bold_font),
+        NamedStyle('filter_value', font=normal_font),
+        NamedStyle('data_header', font=data_header_font, fill=_fill(DATA_HEADER_COLOR),
+                   alignment=center, border=thin_border),
+        NamedStyle('data_cell', font=normal_font, border=thin_border),
+        NamedStyle('data_cell_alt', font=normal_font, fill=_fill(ALT_ROW_COLOR), border=thin_border),
+        NamedStyle('kpi_label', font=bold_font, fill=_fill(KPI_COLOR), alignment=left, border=thin_border),
+        NamedStyle('kpi_label_alt', font=bold_font, fill=_fill(ALT_ROW_COLOR), alignment=left, border=thin_border),
+        NamedStyle('kpi_value', font=normal_font, fill=_fill(KPI_COLOR), alignment=right, border=thin_border),
+        NamedStyle('kpi_value_alt', font=normal_font, fill=_fill(ALT_ROW_COLOR), alignment=right, border=thin_border),
+    ]
+
+
+def streaming_workbook() -> Workbook:
+    """Write-only workbook with the report styles registered once"""
+    wb = Workbook(write_only=True)
+    for style in report_styles():
+        wb.add_named_style(style)
+    return wb
+
+
+class StreamingSheet:
+    """
+    Write-only worksheet that sizes each column to its longest value (plus 2,
+    capped at MAX_COLUMN_WIDTH) as rows are appended. The first sample_rows rows
+    are held until the widths are fixed; every later row is streamed straight out.
+    """
+
+    def __init__(self, wb: Workbook, title: str, sample_rows: int = WIDTH_SAMPLE_ROWS,
+                 max_width: int = MAX_COLUMN_WIDTH):
+        self.ws = wb.create_sheet(title)
+        self.sample_rows = sample_rows
+        self.max_width = max_width
+        self.row = 0
+        self._lengths: Dict[int, int] = {}
+        self._style_arrays: Dict[str, Any] = {}
+        self._pending: Optional[List[List[WriteOnlyCell]]] = []
+
+    def append(self, values: Sequence[Any] = (), style: Optional[str] = None,
+               styles: Optional[Sequence[Optional[str]]] = None,
+               merge: Iterable[Tuple[int, int]] = ()) -> int:
+        """
+        Write one row and return its number. style applies to every value, styles
+        per column; merge lists (first_col, last_col) ranges to merge on this row.
+        """
+        self.row += 1
+        cells = []
+        for col, value in enumerate(values, 1):
+            cell_style = styles[col - 1] if styles else style
+            if cell_style is None and value is None:
+                cells.append(None)
+                continue
+            cell = WriteOnlyCell(self.ws, value=value)
+            if cell_style:
+                self._apply_style(cell, cell_style)
+            cells.append(cell)
+            if self._pending is not None:
+                length = len(str(value)) if value else 0
+                self._lengths[col] = max(self._lengths.get(col, 0), length)
+
+        for first_col, last_col in merge:
+            self.ws.merged_cells.add(
+                f"{get_column_letter(first_col)}{self.row}:{get_column_letter(last_col)}{self.row}"
+            )
+            if self._pending is not None:
+                for col in range(first_col, last_col + 1):
+                    self._lengths.setdefault(col, 0)
+
+        if self._pending is None:
+            self.ws.append(cells)
+        else:
+            self._pending.append(cells)
+            if len(self._pending) >= self.sample_rows:
+                self._flush()
+        return self.row
+
+    def blank(self, count: int = 1):
+        """Append empty spacer rows"""
+        for _ in range(count):
+            self.append()
+
+    def close(self):
+        """Write out any rows still held for sizing; call before saving the workbook"""
+        if self._pending is not None:
+            self._flush()
+
+    def _apply_style(self, cell: WriteOnlyCell, name: str):
+        """Apply a named style, resolving each name to its style ids only once per sheet"""
+        style_array = self._style_arrays.get(name)
+        if style_array is None:
+            cell.style = name
+            self._style_arrays[name] = copy(cell._style)
+        else:
+            cell._style = copy(style_array)
+
+    def _flush(self):
+        """Fix the column widths from the rows seen so far and write the held rows"""
+        for col in range(1, max(self._lengths, default=0) + 1):
+            width = min(self._lengths.get(col, 0) + 2, self.max_width)
+            self.ws.column_dimensions[get_column_letter(col)].width = width
+        pending, self._pending = self._pending, None
+        for cells in pending:
+            self.ws.append(cells)
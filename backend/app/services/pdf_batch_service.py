@@ -0,0 +1,159 @@
+"""
+PDF Batch Service
+Bulk-loads the data for regenerating PDFs of a filtered set of quotations and
+packs the rendered files into one ZIP with a manifest
+"""
+import csv
+import io
+import json
+import zipfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy import String, inspect, literal_column, type_coerce
+from sqlalchemy.orm import Session
+from app.models import Project, CommercialQuotation, TechnicalQuotation
+from app.models.analytics_models import AnalyticsFilters
+from app.services.analytics_service import AnalyticsService
+from app.services.quotation_service import QuotationService
+from app.services.requirement_service import RequirementService
+from app.utils.logger import setup_logger
+
+logger = setup_logger()
+
+BATCH_KINDS = ('commercial', 'technical')
+
+# Commercial quotation fields the PDF reads from form_data
+COMMERCIAL_FORM_FIELDS = [
+    'to', 'attn', 'email_to', 'your_inquiry_ref', 'your_partner',
+    'mobile_no', 'fax_no', 'email_partner'
+]
+
+MANIFEST_FIELDS = ['quotation_number', 'kind', 'part_type', 'status', 'file', 'error']
+
+
+class PdfBatchService:
+    """Loads batch PDF inputs with one query per table instead of per-quote lookups"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def matching_projects(self, filters: AnalyticsFilters, quotation_numbers: Optional[List[str]] = None):
+        """Projects query narrowed by the analytics filters and an optional explicit quotation list"""
+        analytics = AnalyticsService(self.db)
+        query = self.db.query(Project.id, Project.quotation_number, Project.customer_name)
+        query = analytics.apply_date_filter(query, Project, filters)
+        query = analytics.apply_status_filter(query, filters)
+        query = analytics.apply_customer_filter(query, filters)
+        query = analytics.apply_product_filter(query, filters)
+        if quotation_numbers:
+            query = query.filter(Project.quotation_number.in_(quotation_numbers))
+        return query.order_by(Project.created_at, Project.id)
+
+    def load_commercial(self, project_numbers) -> Dict[str, Dict[str, Any]]:
+        """
+        {quotation_number: {'form_data', 'terms', 'general_conditions'}} for the first
+        commercial quotation of each project, with terms/conditions as stored text
+        """
+        columns = [
+            CommercialQuotation.quotation_number,
+            CommercialQuotation.items,
+            CommercialQuotation.pages,
+            type_coerce(CommercialQuotation.terms, String).label('terms'),
+        ] + [getattr(CommercialQuotation, field) for field in COMMERCIAL_FORM_FIELDS]
+
+        # general_conditions is added by a migration and is not mapped on the model
+        table_columns = {c['name'] for c in inspect(self.db.get_bind()).get_columns('commercial_quotations')}
+        if 'general_conditions' in table_columns:
+            columns.append(literal_column('commercial_quotations.general_conditions').label('general_conditions'))
+
+        rows = self.db.query(*columns).filter(
+            CommercialQuotation.quotation_number.in_(project_numbers)
+        ).order_by(CommercialQuotation.id)
+
+        quotation_service = QuotationService()
+        result = {}
+        for row in rows:
+            if row.quotation_number in result:
+                continue
+            form_data = {field: getattr(row, field) or '' for field in COMMERCIAL_FORM_FIELDS}
+            form_data['pages'] = row.pages or 1
+            form_data['items'] = quotation_service.parse_items(row.items)
+            result[row.quotation_number] = {
+                'form_data': form_data,
+                'terms': row.terms or None,
+                'general_conditions': getattr(row, 'general_conditions', None) or None
+            }
+        return result
+
+    def load_technical(self, project_numbers) -> Dict[str, Dict[str, Any]]:
+        """{quotation_number: {requirement_id: technical quote}} as get_technical_quotes returns them"""
+        rows = self.db.query(
+            TechnicalQuotation.quotation_number,
+            TechnicalQuotation.requirement_id,
+            TechnicalQuotation.technical_data
+        ).filter(TechnicalQuotation.quotation_number.in_(project_numbers))
+
+        result = {}
+        for quotation_number, requirement_id, technical_data in rows:
+            try:
+                quote = json.loads(technical_data) if technical_data else {}
+            except json.JSONDecodeError:
+                quote = {}
+            result.setdefault(quotation_number, {})[str(requirement_id)] = quote
+        return result
+
+    def load_batch(self, filters: AnalyticsFilters, kinds=BATCH_KINDS,
+                   quotation_numbers: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Everything needed to render the batch: one entry per matching project with its
+        requirements, commercial form data and technical quotes
+        """
+        projects_query = self.matching_projects(filters, quotation_numbers)
+        project_numbers = projects_query.with_entities(Project.quotation_number).scalar_subquery()
+
+        commercial = self.load_commercial(project_numbers) if 'commercial' in kinds else {}
+        technical = self.load_technical(project_numbers) if 'technical' in kinds else {}
+        requirements = RequirementService().load(
+            self.db, projects_query.with_entities(Project.id).scalar_subquery()
+        )
+
+        batch = []
+        for project_id, quotation_number, customer_name in projects_query:
+            batch.append({
+                'quotation_number': quotation_number,
+                'customer_name': customer_name,
+                'requirements': requirements.get(project_id, []),
+                'commercial': commercial.get(quotation_number),
+                'technical_quotes': technical.get(quotation_number, {})
+            })
+        return batch
+
+
+def write_batch_zip(zip_path: Path, manifest: List[Dict[str, Any]],
+                    idle: Optional[Callable[[], None]] = None) -> Path:
+    """
+    Stream the generated files into a ZIP (commercial/ and technical/ folders) followed
+    by manifest.csv. idle runs between files so a cooperative caller can yield.
+    """
+    zip_path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        for entry in manifest:
+            if entry['status'] != 'success':
+                continue
+            filepath = Path(entry['file'])
+            arcname = f"{entry['kind']}/{filepath.name}"
+            try:
+                zf.write(filepath, arcname)
+                entry['file'] = arcname
+            except OSError as e:
+                logger.warning(f"Batch PDF missing from ZIP: {filepath}: {e}")
+                entry.update(status='failed', file='', error=str(e))
+            if idle:
+                idle()
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=MANIFEST_FIELDS)
+        writer.writeheader()
+        writer.writerows({field: entry.get(field) or '' for field in MANIFEST_FIELDS} for entry in manifest)
+        zf.writestr('manifest.csv', buffer.getvalue())
+    return zip_path
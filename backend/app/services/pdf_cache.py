@@ -0,0 +1,114 @@
+"""
+PDF Cache
+Content-addressed reuse of generated PDFs and size/age pruning of the output folders
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Optional
+from app.config import PDF_CACHE_MAX_MB, PDF_CACHE_MAX_AGE_DAYS
+from app.utils.assets import logo_path
+from app.utils.logger import setup_logger
+
+logger = setup_logger()
+
+# Bump when a generator's layout changes so older files are no longer reused
+CACHE_VERSION = 1
+
+# Minimum seconds between prunes of the same folder within one process
+PRUNE_INTERVAL = 60
+
+_last_pruned = {}
+_prune_lock = threading.Lock()
+
+
+def logo_mtime() -> Optional[float]:
+    """Modification time of the logo the generators will draw, or None if there is none"""
+    path = logo_path()
+    return path.stat().st_mtime if path else None
+
+
+def content_hash(*inputs) -> str:
+    """SHA-256 over the inputs of a rendered PDF part, including the logo it draws"""
+    payload = json.dumps(
+        [CACHE_VERSION, logo_mtime(), list(inputs)],
+        sort_keys=True, default=str, separators=(',', ':')
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def pdf_input_hash(*inputs) -> str:
+    """
+    SHA-256 over everything a PDF is rendered from. Today's date is included
+    because the generators print it as the issue date.
+    """
+    return content_hash(date.today().isoformat(), *inputs)
+
+
+def reuse_cached_pdf(filepath: Path) -> bool:
+    """True if the PDF already exists; marks it as recently used for pruning"""
+    try:
+        os.utime(filepath)
+        logger.info(f"Reusing cached PDF {filepath.name}")
+        return True
+    except OSError:
+        return False
+
+
+def pending_path(filepath: Path) -> Path:
+    """Temporary name to render into, so a half-written file is never served from the cache"""
+    return filepath.with_name(f".{filepath.stem}.{os.getpid()}.tmp")
+
+
+def publish_pdf(render_path: Path, filepath: Path):
+    """Move a finished render into place and prune its folder"""
+    os.replace(render_path, filepath)
+    prune_pdf_cache(filepath.parent)
+
+
+def prune_pdf_cache(output_dir: Path, max_bytes: Optional[int] = None,
+                    max_age_days: Optional[int] = None, force: bool = False) -> int:
+    """
+    Delete PDFs not used for max_age_days, then the least recently used ones until
+    the folder fits in max_bytes. Returns the number of files removed.
+    """
+    output_dir = Path(output_dir)
+    max_bytes = PDF_CACHE_MAX_MB * 1024 * 1024 if max_bytes is None else max_bytes
+    max_age_days = PDF_CACHE_MAX_AGE_DAYS if max_age_days is None else max_age_days
+
+    with _prune_lock:
+        now = time.time()
+        key = str(output_dir.resolve())
+        if not force and now - _last_pruned.get(key, 0) < PRUNE_INTERVAL:
+            return 0
+        _last_pruned[key] = now
+
+    files = []
+    for path in output_dir.glob('*.pdf'):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+    files.sort(key=lambda f: f[0])
+
+    cutoff = now - max_age_days * 86400
+    total = sum(size for _, size, _ in files)
+    removed = 0
+    for mtime, size, path in files:
+        if mtime >= cutoff and total <= max_bytes:
+            break
+        try:
+            path.unlink()
+            total -= size
+            removed += 1
+        except OSError as e:
+            logger.warning(f"Could not prune {path.name}: {e}")
+
+    if removed:
+        logger.info(f"Pruned {removed} cached PDFs from {output_dir}")
+    return removed
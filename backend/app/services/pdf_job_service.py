@@ -0,0 +1,163 @@
+"""
+PDF Job Service
+Background PDF rendering jobs with progress, status and cancellation
+"""
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import CancelledError
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from app.services.pdf_service import get_render_pool, reset_render_pool
+from app.utils.logger import setup_logger
+
+logger = setup_logger()
+
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED = {COMPLETED, FAILED, CANCELLED}
+
+
+class PdfJobQueue:
+    """
+    Runs PDF render tasks in the shared worker pool and watches them from a
+    cooperative monitor (an Eel greenlet), pushing a status snapshot through
+    notify whenever a task finishes.
+
+    spawn/sleep are eel.spawn/eel.sleep in the app, so watching never blocks the UI.
+    """
+
+    def __init__(self, spawn: Callable, sleep: Callable, notify: Callable[[Dict[str, Any]], None],
+                 max_jobs: int = 100, poll_interval: float = 0.1):
+        self.spawn = spawn
+        self.sleep = sleep
+        self.notify = notify
+        self.max_jobs = max_jobs
+        self.poll_interval = poll_interval
+        self._jobs: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, quotation_number: str, tasks: List[tuple],
+               finalize: Callable[[List[tuple]], Dict[str, Any]]) -> str:
+        """
+        Queue tasks [(fn, args), ...] as one job and return its id. finalize turns
+        the per-task (result, error) list into the job result dict.
+        """
+        job_id = uuid.uuid4().hex
+        pool = get_render_pool()
+        job = {
+            'job_id': job_id,
+            'kind': kind,
+            'quotation_number': quotation_number,
+            'status': QUEUED,
+            'total': len(tasks),
+            'completed': 0,
+            'result': None,
+            'error': None,
+            'created_at': datetime.now().isoformat(),
+            'finished_at': None,
+            '_futures': [pool.submit(fn, *args) for fn, args in tasks],
+            '_finalize': finalize
+        }
+        with self._lock:
+            self._jobs[job_id] = job
+            self._prune()
+
+        self.spawn(self._watch, job_id)
+        return job_id
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Public snapshot of a job, or None if unknown"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self._snapshot(job) if job else None
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Cancel a job; tasks already rendering finish but their output is discarded"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job['status'] not in FINISHED:
+                for future in job['_futures']:
+                    future.cancel()
+                self._finish(job, CANCELLED)
+            snapshot = self._snapshot(job)
+        self._notify(snapshot)
+        return snapshot
+
+    def _watch(self, job_id: str):
+        """Poll the job's futures, publishing progress until every task is done"""
+        job = self._jobs[job_id]
+        futures = job['_futures']
+        reported = None
+
+        while True:
+            with self._lock:
+                if job['status'] in FINISHED:
+                    return
+                done = sum(1 for f in futures if f.done())
+                job['completed'] = done
+                if job['status'] == QUEUED and (done or any(f.running() for f in futures)):
+                    job['status'] = RUNNING
+                progress = (done, job['status'])
+                snapshot = self._snapshot(job) if progress != reported else None
+            if done == len(futures):
+                break
+            if snapshot:
+                reported = progress
+                self._notify(snapshot)
+            self.sleep(self.poll_interval)
+
+        outcomes = []
+        for future in futures:
+            try:
+                outcomes.append((future.result(), None))
+            except CancelledError as e:
+                outcomes.append((None, e))
+            except BrokenProcessPool as e:
+                reset_render_pool()
+                outcomes.append((None, e))
+            except Exception as e:
+                outcomes.append((None, e))
+
+        try:
+            result = job['_finalize'](outcomes)
+            status = COMPLETED if result.get('success') else FAILED
+            error = None if result.get('success') else result.get('message')
+        except Exception as e:
+            logger.error(f"PDF job {job_id} failed: {e}")
+            result, status, error = None, FAILED, str(e)
+
+        with self._lock:
+            if job['status'] in FINISHED:
+                return
+            job['result'] = result
+            job['error'] = error
+            self._finish(job, status)
+            snapshot = self._snapshot(job)
+        self._notify(snapshot)
+
+    def _finish(self, job: Dict[str, Any], status: str):
+        job['status'] = status
+        job['finished_at'] = datetime.now().isoformat()
+
+    def _prune(self):
+        """Forget the oldest finished jobs beyond max_jobs"""
+        for job_id in [j for j, job in self._jobs.items() if job['status'] in FINISHED]:
+            if len(self._jobs) <= self.max_jobs:
+                break
+            del self._jobs[job_id]
+
+    def _snapshot(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in job.items() if not k.startswith('_')}
+
+    def _notify(self, snapshot: Dict[str, Any]):
+        try:
+            self.notify(snapshot)
+        except Exception as e:
+            logger.debug(f"PDF job notification skipped: {e}")
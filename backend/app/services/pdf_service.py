@@ -0,0 +1,83 @@
+"""
+PDF Service
+Shared worker process pool for ReportLab rendering
+"""
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, Optional
+from app.config import PDF_WORKERS
+from app.utils.logger import setup_logger
+
+logger = setup_logger()
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> ProcessPoolExecutor:
+    """Worker pool for PDF rendering, started on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=PDF_WORKERS)
+            logger.info(f"Started PDF render pool with {PDF_WORKERS} workers")
+        return _pool
+
+
+def reset_render_pool():
+    """Drop a broken pool so the next call starts a fresh one"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def wait_all(futures: List, idle: Optional[Callable[[], None]] = None):
+    """
+    Wait for futures to finish. With idle (e.g. eel.sleep) the caller yields
+    between checks instead of blocking, so the Eel event loop keeps serving the UI.
+    """
+    pending = set(futures)
+    while pending:
+        if idle is None:
+            _, pending = wait(pending, return_when=FIRST_COMPLETED)
+        else:
+            _, pending = wait(pending, timeout=0)
+            if pending:
+                idle()
+
+
+def run_in_pool(fn: Callable, jobs: List[tuple], idle: Optional[Callable[[], None]] = None) -> List[tuple]:
+    """
+    Run fn(*args) for each job in the render pool and return (result, error) per
+    job in input order. Falls back to running in-process for a single job or when
+    the pool cannot be used.
+    """
+    if len(jobs) <= 1 or PDF_WORKERS <= 1:
+        return [_call(fn, args) for args in jobs]
+
+    try:
+        futures = [get_render_pool().submit(fn, *args) for args in jobs]
+        wait_all(futures, idle)
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning(f"PDF render pool unavailable, rendering in-process: {e}")
+        reset_render_pool()
+        return [_call(fn, args) for args in jobs]
+
+    results = []
+    for future in futures:
+        error = future.exception()
+        if isinstance(error, BrokenProcessPool):
+            reset_render_pool()
+        results.append((None, error) if error else (future.result(), None))
+    return results
+
+
+def _call(fn: Callable, args: tuple) -> tuple:
+    """Run fn in the current process, returning (result, error)"""
+    try:
+        return fn(*args), None
+    except Exception as e:
+        return None, e
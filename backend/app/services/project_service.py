@@ -1,8 +1,12 @@
 """
 Project Service
 """
-from app.database.connection import SessionLocal
+from app.database.connection import SessionLocal, WriterSession
+from sqlalchemy.orm import selectinload
 from app.models.project import Project, ProjectStatus
+from app.services.analytics_rollup_service import AnalyticsRollupService
+from app.services.analytics_cache import analytics_cache
+from app.services.requirement_service import RequirementService
 from datetime import datetime
 
 class ProjectService:
@@ -10,7 +14,7 @@ class ProjectService:
         """Get recent projects"""
         db = SessionLocal()
         try:
-            projects = db.query(Project).order_by(
+            projects = db.query(Project).options(selectinload(Project.requirements)).order_by(
                 Project.updated_at.desc()
             ).limit(limit).all()
             
@@ -31,14 +35,18 @@ class ProjectService:
     
     def delete(self, project_id: int):
         """Delete project permanently"""
-        db = SessionLocal()
+        db = WriterSession()
         try:
             project = db.query(Project).filter(Project.id == project_id).first()
             if not project:
                 raise Exception("Project not found")
             
+            rollups = AnalyticsRollupService(db)
+            previous_slice = rollups.get_slice(project.quotation_number)
             db.delete(project)
+            rollups.refresh_quotation(project.quotation_number, previous_slice)
             db.commit()
+            analytics_cache.invalidate()
         finally:
             db.close()
     
@@ -51,7 +59,7 @@ class ProjectService:
             'quotation_number': project.quotation_number,
             'customer': project.customer_name,
             'customer_name': project.customer_name,
-            'requirements_data': project.requirements_data,
+            'requirements_data': RequirementService().to_json(project.requirements),
             'lastModified': project.updated_at.strftime('%Y-%m-%d'),
             'status': project.status.value,
             'dateCreated': project.created_at.strftime('%Y-%m-%d')
@@ -1,15 +1,143 @@
 """
 Quotation Service
 """
+import json
+from typing import List
 from app.database.connection import SessionLocal
+from app.models.commercial_quotation import CommercialQuotation
+from app.models.commercial_quotation_item import CommercialQuotationItem
+
+# Header columns the commercial quote form edits
+COMMERCIAL_FIELDS = [
+    'to', 'attn', 'email_to', 'your_inquiry_ref', 'pages',
+    'your_partner', 'mobile_no', 'fax_no', 'email_partner'
+]
+
+# Line item columns compared when syncing the normalized rows
+LINE_ITEM_COLUMNS = ['quotation_number', 'sr_no', 'part_type', 'description', 'qty', 'unit_price', 'amount']
 
 class QuotationService:
     def create_commercial(self, data: dict):
         """Create commercial quotation"""
         # TODO: Implement
         return {'id': 1, 'quotation_number': 'Q20250001'}
-    
+
     def generate_commercial_pdf(self, quotation_id: int):
         """Generate commercial PDF"""
         # TODO: Implement
         return '/path/to/pdf'
+
+    def apply_commercial_changes(self, quote: CommercialQuotation, changes: dict) -> List[str]:
+        """
+        Apply form changes to a commercial quotation, setting only the columns whose value
+        differs. changes['items'] is either the full item list or {sr_no: item} holding
+        just the edited items (None removes one). Returns the names of the changed columns.
+        """
+        changed = []
+        for field in COMMERCIAL_FIELDS:
+            if field in changes and getattr(quote, field) != changes[field]:
+                setattr(quote, field, changes[field])
+                changed.append(field)
+
+        if 'items' in changes:
+            current = self.parse_items(quote.items)
+            items = self.merge_items(current, changes['items'])
+            if items != current or quote.items is None:
+                quote.items = json.dumps(items)
+                changed.append('items')
+                self.sync_line_items(quote, items)
+
+                # Calculate totals
+                subtotal = sum(item.get('total_price', 0) for item in items)
+                for column, value in [('subtotal', subtotal), ('tax_amount', 0.0), ('total_amount', subtotal)]:
+                    if getattr(quote, column) != value:
+                        setattr(quote, column, value)
+                        changed.append(column)
+        return changed
+
+    def merge_items(self, current: list, changes) -> list:
+        """The item list after applying a full list or {sr_no: item or None} of edits"""
+        if isinstance(changes, list):
+            return changes
+        if not isinstance(changes, dict):
+            raise ValueError("items must be a list or a {sr_no: item} mapping")
+
+        items = list(current)
+        removed = set()
+        for sr_no, item in sorted(((int(key), item) for key, item in changes.items()), key=lambda change: change[0]):
+            if sr_no < 1:
+                raise ValueError(f"Invalid item number: {sr_no}")
+            if item is None:
+                removed.add(sr_no - 1)
+            elif sr_no <= len(items):
+                items[sr_no - 1] = item
+            else:
+                items.append(item)
+        return [item for index, item in enumerate(items) if index not in removed]
+
+    def merge_technical_data(self, current: dict, changes: dict) -> dict:
+        """
+        Technical quote data after applying changed fields. Nested sections such as
+        technical_fields merge key by key; a None value removes the key.
+        """
+        merged = dict(current)
+        for key, value in (changes or {}).items():
+            if value is None:
+                merged.pop(key, None)
+            elif isinstance(value, dict) and isinstance(merged.get(key), dict):
+                section = dict(merged[key])
+                for field, field_value in value.items():
+                    if field_value is None:
+                        section.pop(field, None)
+                    else:
+                        section[field] = field_value
+                merged[key] = section
+            else:
+                merged[key] = value
+        return merged
+
+    def sync_line_items(self, quote: CommercialQuotation, items: list):
+        """Make the normalized line items match items, updating only the rows that differ"""
+        wanted = [
+            self._to_line_item(quote.quotation_number, index, item)
+            for index, item in enumerate(items or [], start=1)
+            if isinstance(item, dict)
+        ]
+        rows = sorted(quote.line_items, key=lambda row: row.sr_no or 0)
+
+        for row, line_item in zip(rows, wanted):
+            for column in LINE_ITEM_COLUMNS:
+                value = getattr(line_item, column)
+                if getattr(row, column) != value:
+                    setattr(row, column, value)
+        for row in rows[len(wanted):]:
+            quote.line_items.remove(row)
+        quote.line_items.extend(wanted[len(rows):])
+
+    def parse_items(self, items) -> list:
+        """Decode the items column, which is stored as a JSON-encoded string"""
+        try:
+            if isinstance(items, str):
+                items = json.loads(items)
+            return items if isinstance(items, list) else []
+        except (json.JSONDecodeError, TypeError):
+            return []
+
+    def _to_line_item(self, quotation_number: str, index: int, item: dict) -> CommercialQuotationItem:
+        """Map a form item ({description, unit, unit_price, total_price}) to a line item row"""
+        return CommercialQuotationItem(
+            quotation_number=quotation_number,
+            sr_no=index,
+            part_type=item.get('part_type'),
+            description=item.get('description'),
+            qty=self._to_float(item.get('qty', item.get('unit'))),
+            unit_price=self._to_float(item.get('unit_price')),
+            amount=self._to_float(item.get('total_price', item.get('amount')))
+        )
+
+    def _to_float(self, value) -> float:
+        """Convert a form value to float, treating blanks and text as 0"""
+        try:
+            return float(value or 0)
+        except (TypeError, ValueError):
+            return 0.0
@@ -0,0 +1,163 @@
+"""
+Requirement Service
+Customer requirements stored one row per requirement. Saves are diffed against the
+stored rows, so an edit only writes the rows that actually changed.
+"""
+import json
+from typing import Any, Dict, Iterable, List, Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.models.project import Project
+from app.models.project_requirement import ProjectRequirement
+
+# Form labels copied into each typed column (the wording differs between part types)
+REQUIREMENT_FIELDS = {
+    'tag_number': ('Tag Number', 'Tag number'),
+    'application': ('Application',),
+    'motor_kw': ('Motor KW',),
+    'torque_min_nm': ('Torque (Mn) Min (Nm)', 'Stopping Torque (Mn) Min (Nm)', 'Torque  Main drive - Min (Nm)'),
+    'torque_max_nm': ('Torque (Mn) Max (Nm)', 'Stopping Torque (Mn) Max (Nm)', 'Torque Main drive - Max (Nm)'),
+    'service_factor': ('Service Factor',),
+}
+
+NUMERIC_FIELDS = {'motor_kw', 'torque_min_nm', 'torque_max_nm', 'service_factor'}
+
+# Columns compared when diffing a saved requirement against its stored row
+DIFF_COLUMNS = ['position', 'part_type', 'field_values'] + list(REQUIREMENT_FIELDS)
+
+
+class RequirementService:
+    def to_dict(self, row: ProjectRequirement) -> dict:
+        """Requirement in the shape the requirements form uses"""
+        return {
+            'id': row.requirement_id,
+            'partType': row.part_type or '',
+            'fieldValues': row.field_values or {}
+        }
+
+    def to_json(self, rows: Iterable[ProjectRequirement]) -> str:
+        """Requirements as the JSON list the frontend reads from requirements_data"""
+        return json.dumps([self.to_dict(row) for row in rows])
+
+    def load(self, db: Session, project_ids) -> Dict[int, List[dict]]:
+        """{project_id: [requirement, ...]} for many projects in one query"""
+        rows = db.query(ProjectRequirement).filter(
+            ProjectRequirement.project_id.in_(project_ids)
+        ).order_by(ProjectRequirement.project_id, ProjectRequirement.position, ProjectRequirement.id)
+
+        result = {}
+        for row in rows:
+            result.setdefault(row.project_id, []).append(self.to_dict(row))
+        return result
+
+    def save(self, project: Project, requirements: list) -> Dict[str, int]:
+        """
+        Make the stored requirements match the list: insert new ids, update rows whose
+        values changed and delete ids that are gone. Returns the count of each.
+        """
+        existing = self._by_requirement_id(project.requirements)
+        counts = {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+
+        for position, requirement in enumerate(requirements or [], start=1):
+            if not isinstance(requirement, dict):
+                continue
+            values = self._to_columns(requirement, position)
+            matches = existing.get(values['requirement_id'])
+            row = matches.pop(0) if matches else None
+            if row is None:
+                project.requirements.append(ProjectRequirement(**values))
+                counts['inserted'] += 1
+            elif self._update(row, values):
+                counts['updated'] += 1
+            else:
+                counts['unchanged'] += 1
+
+        for row in [row for rows in existing.values() for row in rows]:
+            project.requirements.remove(row)
+            counts['deleted'] += 1
+
+        self._touch(project, counts)
+        return counts
+
+    def upsert(self, project: Project, requirement: dict, position: Optional[int] = None) -> Dict[str, int]:
+        """Insert or update one requirement, leaving the others untouched"""
+        existing = self._by_requirement_id(project.requirements)
+        row = existing.get(self._requirement_id(requirement, 0), [None])[0]
+        if position is None:
+            position = row.position if row else max((r.position for r in project.requirements), default=0) + 1
+
+        values = self._to_columns(requirement, position)
+        counts = {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+        if row is None:
+            project.requirements.append(ProjectRequirement(**values))
+            counts['inserted'] = 1
+        elif self._update(row, values):
+            counts['updated'] = 1
+        else:
+            counts['unchanged'] = 1
+
+        self._touch(project, counts)
+        return counts
+
+    def delete(self, project: Project, requirement_id: int) -> int:
+        """Delete one requirement; returns the number of rows removed"""
+        rows = [r for r in project.requirements if r.requirement_id == int(requirement_id)]
+        for row in rows:
+            project.requirements.remove(row)
+        self._touch(project, {'deleted': len(rows)})
+        return len(rows)
+
+    def _by_requirement_id(self, rows) -> Dict[int, List[ProjectRequirement]]:
+        """Stored rows grouped by requirement id, in display order (old lists may repeat an id)"""
+        existing = {}
+        for row in rows:
+            existing.setdefault(row.requirement_id, []).append(row)
+        return existing
+
+    def _to_columns(self, requirement: dict, position: int) -> Dict[str, Any]:
+        """Column values for a requirement from the form"""
+        field_values = requirement.get('fieldValues')
+        field_values = dict(field_values) if isinstance(field_values, dict) else {}
+        values = {
+            'requirement_id': self._requirement_id(requirement, position),
+            'position': position,
+            'part_type': requirement.get('partType') or requirement.get('part_type') or None,
+            'field_values': field_values
+        }
+        for column, labels in REQUIREMENT_FIELDS.items():
+            value = next((field_values[label] for label in labels if label in field_values), None)
+            values[column] = self._to_number(value) if column in NUMERIC_FIELDS else self._to_text(value)
+        return values
+
+    def _requirement_id(self, requirement: dict, position: int) -> int:
+        try:
+            return int(requirement.get('id'))
+        except (TypeError, ValueError):
+            return position
+
+    def _update(self, row: ProjectRequirement, values: Dict[str, Any]) -> bool:
+        """Set the values that differ on row; True if any did"""
+        changed = False
+        for column in DIFF_COLUMNS:
+            if getattr(row, column) != values[column]:
+                setattr(row, column, values[column])
+                changed = True
+        return changed
+
+    def _touch(self, project: Project, counts: Dict[str, int]):
+        """Bump the project's modified time if anything was written"""
+        if any(counts.get(key) for key in ('inserted', 'updated', 'deleted')):
+            project.updated_at = func.now()
+
+    def _to_number(self, value) -> Optional[float]:
+        """Form value as a float, or None for blanks and text"""
+        if isinstance(value, bool):
+            return None
+        try:
+            return float(str(value).strip()) if value not in (None, '') else None
+        except ValueError:
+            return None
+
+    def _to_text(self, value) -> Optional[str]:
+        text = str(value).strip() if value is not None else ''
+        return text or None
@@ -0,0 +1,140 @@
+"""
+Snapshot Service
+Typed columnar (Parquet / Feather) snapshots of the quotation tables for analysis
+outside the app. Tables are read in chunks through pandas and written batch by batch.
+"""
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import Boolean, DateTime, Enum, Float, Integer, String, inspect, literal_column, select, type_coerce
+from sqlalchemy.orm import Session
+from app.config import EXPORT_DIR, EXPORT_CHUNK_SIZE
+from app.models import Project, ProjectRequirement, CommercialQuotation, CommercialQuotationItem, TechnicalQuotation
+from app.utils.logger import setup_logger
+
+logger = setup_logger()
+
+SNAPSHOT_FORMATS = {'parquet': 'parquet', 'feather': 'feather'}  # format -> file extension
+
+SNAPSHOT_MODELS = [Project, ProjectRequirement, CommercialQuotation, CommercialQuotationItem, TechnicalQuotation]
+
+SNAPSHOT_COMPRESSION = 'zstd'
+
+
+class SnapshotService:
+    """Writes one columnar file per quotation table into a timestamped snapshot folder"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def table_columns(self, model) -> List[Any]:
+        """
+        Selectable columns of a table: mapped columns with JSON read back as its stored
+        text, plus columns added by migrations that the model does not map (as text)
+        """
+        table = model.__table__
+        columns = []
+        for column in table.columns:
+            if isinstance(column.type, (Integer, Float, DateTime, Enum, Boolean)):
+                columns.append(column)
+            else:
+                columns.append(type_coerce(column, String).label(column.name))
+
+        existing = [c['name'] for c in inspect(self.db.get_bind()).get_columns(table.name)]
+        for name in existing:
+            if name not in table.columns:
+                columns.append(type_coerce(literal_column(f'{table.name}.{name}'), String).label(name))
+        return columns
+
+    def arrow_schema(self, model, columns) -> pa.Schema:
+        """Arrow schema matching table_columns: enums dictionary-encoded, timestamps typed"""
+        fields = []
+        for column in columns:
+            column_type = model.__table__.columns[column.name].type if column.name in model.__table__.columns else None
+            if isinstance(column_type, Enum):
+                arrow_type = pa.dictionary(pa.int8(), pa.string())
+            elif isinstance(column_type, DateTime):
+                arrow_type = pa.timestamp('us')
+            elif isinstance(column_type, Boolean):
+                arrow_type = pa.bool_()
+            elif isinstance(column_type, Integer):
+                arrow_type = pa.int64()
+            elif isinstance(column_type, Float):
+                arrow_type = pa.float64()
+            else:
+                arrow_type = pa.string()
+            fields.append(pa.field(column.name, arrow_type))
+        return pa.schema(fields)
+
+    def to_arrow(self, model, frame: pd.DataFrame, schema: pa.Schema) -> pa.Table:
+        """Convert one chunk to the table schema, encoding enums by their display values"""
+        for column in model.__table__.columns:
+            if isinstance(column.type, Enum) and column.type.enum_class:
+                categories = [e.value for e in column.type.enum_class]
+                frame[column.name] = pd.Categorical(
+                    [v.value if hasattr(v, 'value') else v for v in frame[column.name]],
+                    categories=categories
+                )
+        return pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+
+    def write_table(self, model, path: Path, format: str, chunk_size: int) -> int:
+        """Stream one table into path; returns its row count"""
+        columns = self.table_columns(model)
+        schema = self.arrow_schema(model, columns)
+        query = select(*columns).order_by(model.__table__.primary_key.columns.values()[0])
+
+        if format == 'parquet':
+            writer = pq.ParquetWriter(path, schema, compression=SNAPSHOT_COMPRESSION)
+        else:
+            writer = pa.ipc.new_file(path, schema, options=pa.ipc.IpcWriteOptions(compression=SNAPSHOT_COMPRESSION))
+
+        rows = 0
+        connection = self.db.connection().execution_options(stream_results=True)
+        try:
+            for frame in pd.read_sql(query, connection, chunksize=chunk_size):
+                writer.write_table(self.to_arrow(model, frame, schema))
+                rows += len(frame)
+        finally:
+            writer.close()
+        return rows
+
+    def export_snapshot(self, format: str = 'parquet', chunk_size: int = EXPORT_CHUNK_SIZE) -> Dict[str, Any]:
+        """Write every snapshot table to EXPORT_DIR/quote_snapshot_<timestamp>/"""
+        if format not in SNAPSHOT_FORMATS:
+            return {"success": False, "error": "Only Parquet and Feather snapshots are supported"}
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        folder = EXPORT_DIR / f"quote_snapshot_{timestamp}"
+        pending = EXPORT_DIR / f".quote_snapshot_{timestamp}.tmp"
+        pending.mkdir(parents=True, exist_ok=True)
+
+        tables = {}
+        try:
+            for model in SNAPSHOT_MODELS:
+                filename = f"{model.__tablename__}.{SNAPSHOT_FORMATS[format]}"
+                rows = self.write_table(model, pending / filename, format, chunk_size)
+                tables[model.__tablename__] = {
+                    "file": filename,
+                    "rows": rows,
+                    "bytes": (pending / filename).stat().st_size
+                }
+            pending.rename(folder)
+        except Exception as e:
+            logger.error(f"Snapshot export error: {e}")
+            shutil.rmtree(pending, ignore_errors=True)
+            return {"success": False, "error": f"Snapshot failed: {str(e)}"}
+
+        logger.info(f"Wrote {format} snapshot {folder.name}")
+        return {
+            "success": True,
+            "message": f"Snapshot exported successfully to {folder.name}",
+            "filename": folder.name,
+            "filepath": str(folder),
+            "format": format,
+            "tables": tables,
+            "generated_at": datetime.now().isoformat()
+        }
@@ -0,0 +1,242 @@
+"""
+Application Startup
+Phase timing for the startup report and lazy loading of the Eel API modules, so
+the window can open before the database and the heavy modules are ready
+"""
+import ast
+import importlib
+import importlib.abc
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import eel
+from app.config import STARTUP_MODE
+from app.utils.logger import setup_logger
+
+logger = setup_logger()
+
+# Eel API modules in app.api, in warm-up order (most likely to be called first)
+API_MODULES = [
+    'auth_api', 'project_api', 'customer_api', 'quotation_api', 'commercial_quote_api',
+    'technical_quote_api', 'terms_api', 'analytics_api', 'pdf_job_api'
+]
+
+
+def _in_background() -> bool:
+    return threading.current_thread() is not threading.main_thread()
+
+
+class StartupTimer:
+    """Records how long each startup phase took, measured from process start"""
+
+    def __init__(self, started: float, mode: str):
+        self.started = started
+        self.mode = mode
+        self.phases: List[Dict[str, Any]] = []
+        self.ui_ready_ms: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str, background: bool = False):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, background)
+
+    def record(self, name: str, start: float, background: bool = False):
+        end = time.perf_counter()
+        with self._lock:
+            self.phases.append({
+                'phase': name,
+                'ms': round((end - start) * 1000, 1),
+                'at_ms': round((end - self.started) * 1000, 1),
+                'background': background
+            })
+
+    def ui_ready(self):
+        """Mark the moment the window was launched"""
+        self.ui_ready_ms = round((time.perf_counter() - self.started) * 1000, 1)
+        logger.info(f"UI ready after {self.ui_ready_ms} ms ({self.mode} startup)")
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'mode': self.mode, 'ui_ready_ms': self.ui_ready_ms, 'phases': list(self.phases)}
+
+    def log_report(self):
+        report = self.report()
+        lines = [f"Startup timing ({report['mode']} mode, UI ready at {report['ui_ready_ms']} ms):"]
+        for p in report['phases']:
+            where = 'background' if p['background'] else 'foreground'
+            lines.append(f"  {p['phase']:<32} {p['ms']:>8.1f} ms  (done at {p['at_ms']:.1f} ms, {where})")
+        logger.info("\n".join(lines))
+
+
+def exposed_names(module_path: Path) -> Optional[List[str]]:
+    """Names of the @eel.expose functions in a module's source, or None if it has no source"""
+    try:
+        tree = ast.parse(module_path.read_text(encoding='utf-8'))
+    except OSError:
+        return None
+
+    def is_expose(decorator) -> bool:
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        return (isinstance(target, ast.Attribute) and target.attr == 'expose') or \
+               (isinstance(target, ast.Name) and target.id == 'expose')
+
+    return [
+        node.name for node in tree.body
+        if isinstance(node, ast.FunctionDef) and any(is_expose(d) for d in node.decorator_list)
+    ]
+
+
+class LazyApi(importlib.abc.MetaPathFinder):
+    """
+    Registers a thin stub for every exposed function of the API modules, so the
+    frontend sees the full API without importing anything. The first call to a
+    stub runs prepare() once (database initialization), imports the real module
+    and hands the call to the function it exposed.
+
+    Eel refuses to expose a name twice, so this also sits on sys.meta_path and
+    drops a module's stubs whenever that module is imported, from anywhere.
+    """
+
+    def __init__(self, package: str, modules: List[str], timer: StartupTimer,
+                 prepare: Optional[Callable[[], None]] = None):
+        self.package = package
+        self.modules = modules
+        self.timer = timer
+        self.prepare = prepare
+        self._stubs: Dict[str, List[str]] = {}
+        self._loaded = set()
+        self._prepared = False
+        self._lock = threading.RLock()
+
+    def register(self):
+        """Expose stubs for every module (modules without source are imported now)"""
+        package_dir = Path(importlib.import_module(self.package).__file__).parent
+        sys.meta_path.insert(0, self)
+        for module in self.modules:
+            names = exposed_names(package_dir / f"{module}.py")
+            if names is None:
+                self.load(module)
+                continue
+            self._stubs[module] = names
+            self._expose_stubs(module)
+
+    def load(self, module: str):
+        """Prepare the app if needed and import one API module"""
+        if module in self._loaded:
+            return
+        with self._lock:
+            self._prepare()
+            if module in self._loaded:
+                return
+            start = time.perf_counter()
+            try:
+                importlib.import_module(f"{self.package}.{module}")
+            except Exception:
+                # Put the stubs back (over anything the failed import exposed) so a later call retries
+                for name in self._stubs.get(module, []):
+                    eel._exposed_functions.pop(name, None)
+                self._expose_stubs(module)
+                raise
+            self._loaded.add(module)
+            self.timer.record(f"import {module}", start, background=_in_background())
+
+    def load_all(self):
+        for module in self.modules:
+            self.load(module)
+
+    def warm_up(self) -> threading.Thread:
+        """Prepare and import every module in a background thread, then log the report"""
+        def run():
+            try:
+                self.load_all()
+            except Exception as e:
+                logger.error(f"Startup warm-up failed: {e}")
+            self.timer.log_report()
+
+        thread = threading.Thread(target=run, name='startup-warm-up', daemon=True)
+        thread.start()
+        return thread
+
+    def find_spec(self, fullname, path, target=None):
+        """Import hook: unregister a module's stubs just before it registers its real functions"""
+        if fullname.startswith(f"{self.package}."):
+            module = fullname[len(self.package) + 1:]
+            for name in self._stubs.get(module, []):
+                if getattr(eel._exposed_functions.get(name), '_lazy_stub', False):
+                    del eel._exposed_functions[name]
+        return None
+
+    def _prepare(self):
+        if self._prepared:
+            return
+        if self.prepare:
+            with self.timer.phase("database init", background=_in_background()):
+                self.prepare()
+        self._prepared = True
+
+    def _expose_stubs(self, module: str):
+        for name in self._stubs.get(module, []):
+            if name not in eel._exposed_functions:
+                eel.expose(name)(self._stub(module, name))
+
+    def _stub(self, module: str, name: str):
+        def stub(*args):
+            self.load(module)
+            return eel._exposed_functions[name](*args)
+        stub.__name__ = name
+        stub._lazy_stub = True
+        return stub
+
+
+def prepare_database():
+    """Create tables and seed data; SQLAlchemy and the models are imported here, on first use"""
+    from app.database.connection import init_database
+    init_database()
+    logger.info("Database initialized")
+
+
+def run_app(frontend_path: str, started: float, **start_options):
+    """
+    Expose the API, open the window and finish startup. In lazy mode (the default)
+    the window opens first and the database and API modules load in a background
+    thread; STARTUP_MODE=eager loads everything before the window as before.
+    """
+    timer = StartupTimer(started, STARTUP_MODE)
+    timer.record("python imports", started)
+    lazy = STARTUP_MODE != 'eager'
+
+    api = LazyApi('app.api', API_MODULES, timer, prepare=prepare_database)
+    if lazy:
+        with timer.phase("api stubs"):
+            api.register()
+    else:
+        api.load_all()
+
+    @eel.expose
+    def get_startup_report():
+        """Startup phases with their durations"""
+        return {"success": True, "data": timer.report()}
+
+    with timer.phase("eel init"):
+        eel.init(frontend_path)
+
+    launched = time.perf_counter()
+
+    def on_ready():
+        # Runs once the browser is launched and the server is listening
+        timer.record("window launch", launched)
+        timer.ui_ready()
+        if lazy:
+            api.warm_up()
+        else:
+            timer.log_report()
+
+    eel.spawn(on_ready)
+    eel.start('index.html', block=True, **start_options)
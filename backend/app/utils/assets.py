@@ -0,0 +1,59 @@
+"""
+Static Assets
+Locates the frontend assets the PDF generators draw and decodes them once per process
+"""
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Image
+from app.utils.logger import setup_logger
+
+logger = setup_logger()
+
+LOGO_FILE = "ringspann_logo2.png"
+
+# Probed in order; the last entry does not depend on the working directory
+LOGO_CANDIDATES = [
+    Path("../frontend/public/assets") / LOGO_FILE,
+    Path("D:/Irizpro/ringspann-desktop/frontend/public/assets") / LOGO_FILE,
+    Path(__file__).resolve().parents[3] / "frontend" / "public" / "assets" / LOGO_FILE,
+]
+
+
+@lru_cache(maxsize=None)
+def logo_path() -> Optional[Path]:
+    """Path of the company logo, or None if it cannot be found"""
+    for path in LOGO_CANDIDATES:
+        if path.exists():
+            return path
+    logger.warning("Company logo not found; PDFs are rendered without it")
+    return None
+
+
+@lru_cache(maxsize=None)
+def logo_image() -> Optional[ImageReader]:
+    """
+    The logo decoded once and shared by every page and document. ReportLab keeps
+    the decoded pixels on the reader, so later draws skip reading the PNG.
+    """
+    path = logo_path()
+    if path is None:
+        return None
+    try:
+        reader = ImageReader(str(path))
+        reader.getRGBData()
+        return reader
+    except Exception as e:
+        logger.warning(f"Could not decode logo {path}: {e}")
+        return None
+
+
+def logo_flowable(width: float, height: float) -> Optional[Image]:
+    """Platypus image of the logo drawn from the shared reader, or None without a logo"""
+    reader = logo_image()
+    if reader is None:
+        return None
+    image = Image(str(logo_path()), width=width, height=height)
+    image._img = reader
+    return image
@@ -0,0 +1,24 @@
+"""
+Fail if a registered hot query falls back to a full table scan
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.database.connection import engine
+from app.database.query_plans import check_query_plans
+
+def check():
+    """Print each hot query's status and return the exit code"""
+    plans, failures = check_query_plans(engine)
+    for name, plan in plans.items():
+        if name in failures:
+            print(f"✗ {name}: full scan or sort")
+            for line in plan:
+                print(f"    {line}")
+        else:
+            print(f"✓ {name}")
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(check())
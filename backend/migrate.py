@@ -0,0 +1,20 @@
+"""
+Upgrade the database to the latest migration revision (the app also does this at startup)
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.database.migrate import run_migrations, migration_connection, current_revision
+
+def migrate():
+    """Run every pending migration in one transaction"""
+    try:
+        run_migrations()
+        with migration_connection() as connection:
+            print(f"✓ Database is at revision {current_revision(connection)}")
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+
+if __name__ == '__main__':
+    migrate()
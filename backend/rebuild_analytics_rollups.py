@@ -0,0 +1,29 @@
+"""
+Rebuild the analytics_rollups summary table from projects and quotations
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.database.connection import SessionLocal, engine
+from app.models.base import Base
+from app.models import AnalyticsRollup
+from app.services.analytics_rollup_service import AnalyticsRollupService
+
+def rebuild_rollups():
+    """Drop and recompute every analytics rollup row"""
+    Base.metadata.create_all(bind=engine, tables=[AnalyticsRollup.__table__])
+
+    db = SessionLocal()
+    try:
+        count = AnalyticsRollupService(db).rebuild()
+        db.commit()
+        print(f"✓ Rebuilt {count} analytics rollup rows")
+    except Exception as e:
+        db.rollback()
+        print(f"✗ Rebuild failed: {e}")
+    finally:
+        db.close()
+
+if __name__ == '__main__':
+    rebuild_rollups()
@@ -2,6 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import EditTermsModal from '../components/EditTermsModal';
 import EditGeneralConditionsModal from '../components/EditGeneralConditionsModal';
+import { waitForPdfJob, cancelPdfJob } from '../utils/pdfJobs';
 
 const CommercialQuote = () => {
   const { projectId } = useParams();
@@ -12,6 +13,7 @@ const CommercialQuote = () => {
   const [selectedRows, setSelectedRows] = useState(new Set());
   const [isTermsModalOpen, setIsTermsModalOpen] = useState(false);
   const [currentTerms, setCurrentTerms] = useState('');
+  const [pdfJob, setPdfJob] = useState(null);
   const [isGeneralConditionsModalOpen, setIsGeneralConditionsModalOpen] = useState(false);
   const [currentGeneralConditions, setCurrentGeneralConditions] = useState('');
   
@@ -220,20 +222,33 @@ const CommercialQuote = () => {
     }
   };
 
+  // Rendering runs as a background job so the form stays editable meanwhile
   const generatePDF = async () => {
     try {
-      const pdfResult = await window.eel.generate_commercial_pdf(
+      const submitted = await window.eel.submit_commercial_pdf_job(
         project.quotation_number,
         formData
       )();
       
-      if (pdfResult.success) {
+      if (!submitted.success) {
+        alert('PDF generation failed: ' + submitted.message);
+        return;
+      }
+      
+      // Show the Cancel button now, not on the first progress update
+      setPdfJob({ job_id: submitted.job_id, status: 'queued' });
+      const job = await waitForPdfJob(submitted.job_id, setPdfJob);
+      setPdfJob(null);
+      
+      if (job.status === 'completed') {
+        const pdfResult = job.result;
         alert(`PDF generated successfully!\n\nFile: ${pdfResult.filename}\nLocation: ${pdfResult.filepath}`);
-      } else {
-        alert('PDF generation failed: ' + pdfResult.message);
+      } else if (job.status === 'failed') {
+        alert('PDF generation failed: ' + job.error);
       }
     } catch (error) {
       console.error('Error:', error);
+      setPdfJob(null);
       alert('Failed to generate PDF');
     }
   };
@@ -539,7 +554,13 @@ const CommercialQuote = () => {
             <button style={styles.btn} onClick={saveCommercialQuote}>Save Changes</button>
             <button style={styles.btn} onClick={handleOpenTermsModal}>Edit Terms & Conditions</button>
             <button style={styles.btn} onClick={handleOpenGeneralConditionsModal}>Edit General Conditions</button>
-            <button onClick={generatePDF} style={styles.btn}>Generate Commercial PDF</button>
+            {pdfJob ? (
+              <button onClick={() => cancelPdfJob(pdfJob.job_id)} style={styles.btn}>
+                Generating PDF ({pdfJob.status})... Cancel
+              </button>
+            ) : (
+              <button onClick={generatePDF} style={styles.btn}>Generate Commercial PDF</button>
+            )}
           </div>
 
           {/* Subtotal */}
@@ -12,6 +12,7 @@ const Dashboard = () => {
   const [currentPage, setCurrentPage] = useState(1);
   const [totalPages, setTotalPages] = useState(1);
   const [totalCount, setTotalCount] = useState(0);
+  const [cursors, setCursors] = useState({ next: null, prev: null });
   const [searchQuery, setSearchQuery] = useState('');
   const perPage = 10;
 
@@ -26,15 +27,17 @@ const Dashboard = () => {
   }, [navigate]);
 
   // UPDATED: Load projects with pagination and search
-  const loadRecentProjects = async (page = 1, search = '') => {
+  // Pass a cursor + direction to seek from the current page instead of using OFFSET
+  const loadRecentProjects = async (page = 1, search = '', cursor = null, direction = 'next') => {
     setLoading(true);
     try {
-      const response = await window.eel.get_projects_paginated(page, perPage, search)();
+      const response = await window.eel.get_projects_paginated(page, perPage, search, cursor, direction)();
       if (response.success) {
         setProjects(response.data.projects);
         setCurrentPage(response.data.current_page);
         setTotalPages(response.data.total_pages);
         setTotalCount(response.data.total_count);
+        setCursors({ next: response.data.next_cursor, prev: response.data.prev_cursor });
       } else {
         console.error('Failed to load projects:', response.error);
         alert('Failed to load projects: ' + response.error);
@@ -61,13 +64,13 @@ const Dashboard = () => {
   // NEW: Handle pagination
   const handlePreviousPage = () => {
     if (currentPage > 1) {
-      loadRecentProjects(currentPage - 1, searchQuery);
+      loadRecentProjects(currentPage - 1, searchQuery, cursors.prev, 'prev');
     }
   };
 
   const handleNextPage = () => {
     if (currentPage < totalPages) {
-      loadRecentProjects(currentPage + 1, searchQuery);
+      loadRecentProjects(currentPage + 1, searchQuery, cursors.next, 'next');
     }
   };
 
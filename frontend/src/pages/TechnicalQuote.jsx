@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import TechnicalQuoteModal from '../components/TechnicalQuoteModal';
+import { waitForPdfJob, cancelPdfJob } from '../utils/pdfJobs';
 
 const TechnicalQuote = () => {
   const { projectId } = useParams();
@@ -13,6 +14,7 @@ const TechnicalQuote = () => {
   const [selectedRequirement, setSelectedRequirement] = useState(null);
   const [isModalOpen, setIsModalOpen] = useState(false);
   const [selectedRows, setSelectedRows] = useState(new Set());
+  const [pdfJob, setPdfJob] = useState(null);
   
   const [pdfMetadata, setPdfMetadata] = useState({
     quote_number: '',
@@ -116,22 +118,35 @@ const TechnicalQuote = () => {
     }
   };
 
+  // Rendering runs as a background job (one task per part type) so editing can continue
   const handleGeneratePDF = async () => {
     try {
-      const result = await window.eel.generate_technical_pdf(
+      const submitted = await window.eel.submit_technical_pdf_job(
         project.quotation_number,
         pdfMetadata,
         requirements,
         technicalQuotes
       )();
       
-      if (result.success) {
-        alert(`Technical PDF generated!\n\nFile: ${result.filename}\nLocation: ${result.filepath}`);
-      } else {
-        alert('PDF generation failed: ' + result.message);
+      if (!submitted.success) {
+        alert('PDF generation failed: ' + submitted.message);
+        return;
+      }
+      
+      // Show the Cancel button now, not on the first progress update
+      setPdfJob({ job_id: submitted.job_id, status: 'queued', completed: 0, total: submitted.total });
+      const job = await waitForPdfJob(submitted.job_id, setPdfJob);
+      setPdfJob(null);
+      
+      if (job.status === 'completed') {
+        const result = job.result;
+        alert(`Technical PDF generated!\n\nFiles: ${result.filenames.join('\n')}`);
+      } else if (job.status === 'failed') {
+        alert('PDF generation failed: ' + job.error);
       }
     } catch (error) {
       console.error('Error:', error);
+      setPdfJob(null);
       alert('Failed to generate PDF');
     }
   };
@@ -350,7 +365,13 @@ const TechnicalQuote = () => {
           {/* Action Buttons */}
           <div style={styles.buttonGroup}>
             <button style={styles.btn}>Generate Technical Quote</button>
-            <button onClick={handleGeneratePDF} style={styles.btn}>Generate Technical PDF</button>
+            {pdfJob ? (
+              <button onClick={() => cancelPdfJob(pdfJob.job_id)} style={styles.btn}>
+                Generating PDF {pdfJob.completed}/{pdfJob.total}... Cancel
+              </button>
+            ) : (
+              <button onClick={handleGeneratePDF} style={styles.btn}>Generate Technical PDF</button>
+            )}
             <button onClick={handleOpenSelectedRow} style={styles.btn}>Open Selected Row</button>
             <button onClick={handleDeleteSelectedRow} style={styles.btnDanger}>Delete Selected Row</button>
           </div>
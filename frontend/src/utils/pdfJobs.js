@@ -0,0 +1,39 @@
+// Background PDF jobs: Python pushes progress through pdf_job_update, which is
+// re-broadcast as a 'pdf-job-update' window event for any page that is listening.
+
+const onPdfJobUpdate = (job) => {
+  window.dispatchEvent(new CustomEvent('pdf-job-update', { detail: job }));
+};
+
+if (window.eel) {
+  window.eel.expose(onPdfJobUpdate, 'pdf_job_update');
+}
+
+const FINISHED = ['completed', 'failed', 'cancelled'];
+
+// Wait for a submitted job to finish, calling onProgress with each update.
+// Polls get_pdf_job_status as a fallback in case a pushed update is missed.
+export const waitForPdfJob = (jobId, onProgress = () => {}) =>
+  new Promise((resolve) => {
+    let poller = null;
+
+    const handle = (job) => {
+      if (!job || job.job_id !== jobId) return;
+      onProgress(job);
+      if (FINISHED.includes(job.status)) {
+        window.removeEventListener('pdf-job-update', listener);
+        clearInterval(poller);
+        resolve(job);
+      }
+    };
+
+    const listener = (e) => handle(e.detail);
+    window.addEventListener('pdf-job-update', listener);
+
+    poller = setInterval(async () => {
+      const status = await window.eel.get_pdf_job_status(jobId)();
+      if (status.success) handle(status.data);
+    }, 2000);
+  });
+
+export const cancelPdfJob = (jobId) => window.eel.cancel_pdf_job(jobId)();
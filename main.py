@@ -1,5 +1,9 @@
+import time
+STARTED = time.perf_counter()
+
 import sys
 import os
+import multiprocessing
 
 # Set base path
 if getattr(sys, 'frozen', False):
@@ -10,18 +14,14 @@ else:
 # Add backend to Python path
 sys.path.insert(0, os.path.join(base_path, 'backend'))
 
-import eel
-from app.database.connection import init_database
+from app.startup import run_app
 from app.utils.logger import setup_logger
-from app.api import auth_api, customer_api, quotation_api, analytics_api, project_api, commercial_quote_api, terms_api, technical_quote_api
 
 logger = setup_logger()
 
 def start_app():
     try:
         logger.info("Starting Quotation System")
-        init_database()
-        logger.info("Database initialized")
         
         # Set frontend path
         if getattr(sys, 'frozen', False):
@@ -35,8 +35,8 @@ def start_app():
         if not os.path.exists(frontend_path):
             raise Exception(f"Frontend folder not found at: {frontend_path}")
         
-        eel.init(frontend_path)
-        eel.start('index.html', mode='chrome', host='localhost', port=8080, size=(1400, 900), block=True)
+        # Database setup and API modules load after the window opens unless STARTUP_MODE=eager
+        run_app(frontend_path, STARTED, mode='chrome', host='localhost', port=8080, size=(1400, 900))
         
     except Exception as e:
         logger.error(f"Failed: {e}")
@@ -46,4 +46,7 @@ def start_app():
         sys.exit(1)
 
 if __name__ == '__main__':
+    # Needed for the PDF worker pool in frozen (PyInstaller) Windows builds; build.spec
+    # builds from this file, so workers must stop here instead of starting the app
+    multiprocessing.freeze_support()
     start_app()
\ No newline at end of file